@@ -18,6 +18,8 @@ In particular, this module implements a python interface for the
 # License: BSD 3-Clause
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from . import (
     _api_calls,
     config,
@@ -33,6 +35,7 @@ from . import (
     utils,
 )
 from .__version__ import __version__
+from ._cache_index import query_cache_index, rebuild_cache_index
 from .datasets import OpenMLDataFeature, OpenMLDataset
 from .evaluations import OpenMLEvaluation
 from .flows import OpenMLFlow
@@ -49,12 +52,18 @@ from .tasks import (
     OpenMLTask,
 )
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
 
-def populate_cache(
+def populate_cache(  # noqa: PLR0913
     task_ids: list[int] | None = None,
     dataset_ids: list[int | str] | None = None,
     flow_ids: list[int] | None = None,
     run_ids: list[int] | None = None,
+    *,
+    max_workers: int | None = None,
+    executor: Executor | None = None,
 ) -> None:
     """
     Populate a cache for offline and parallel usage of the OpenML connector.
@@ -69,25 +78,26 @@ def populate_cache(
 
     run_ids : iterable
 
+    max_workers : int, optional (default=None)
+        Number of threads used to download the entities concurrently.
+        If None (and no ``executor`` is given), they are downloaded one after another.
+
+    executor : concurrent.futures.Executor, optional (default=None)
+        Executor to submit the downloads to, instead of creating a thread pool.
+
     Returns
     -------
     None
     """
-    if task_ids is not None:
-        for task_id in task_ids:
-            tasks.functions.get_task(task_id)
-
-    if dataset_ids is not None:
-        for dataset_id in dataset_ids:
-            datasets.functions.get_dataset(dataset_id)
-
-    if flow_ids is not None:
-        for flow_id in flow_ids:
-            flows.functions.get_flow(flow_id)
-
-    if run_ids is not None:
-        for run_id in run_ids:
-            runs.functions.get_run(run_id)
+    getters = [
+        (tasks.functions.get_task, task_ids),
+        (datasets.functions.get_dataset, dataset_ids),
+        (flows.functions.get_flow, flow_ids),
+        (runs.functions.get_run, run_ids),
+    ]
+    for getter, ids in getters:
+        if ids is not None:
+            utils._map_ids(getter, ids, max_workers=max_workers, executor=executor)  # type: ignore
 
 
 __all__ = [
@@ -115,6 +125,8 @@ __all__ = [
     "exceptions",
     "extensions",
     "flows",
+    "query_cache_index",
+    "rebuild_cache_index",
     "runs",
     "setups",
     "study",
@@ -1,21 +1,32 @@
 # License: BSD 3-Clause
 from __future__ import annotations
 
+import codecs
 import contextlib
 import hashlib
+import json
 import logging
 import math
+import os
 import random
+import re
 import shutil
+import threading
 import time
 import urllib.parse
 import xml
 import zipfile
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import minio
 import requests
+import requests.adapters
 import requests.utils
+import urllib3
 import xmltodict
 from urllib3 import ProxyManager
 
@@ -28,7 +39,17 @@ from .exceptions import (
     OpenMLServerException,
     OpenMLServerNoResult,
 )
-from .utils import ProgressBar
+from .utils import ProgressBar, _map_ids
+
+if TYPE_CHECKING:
+    from minio.helpers import ProgressType
+
+try:
+    from orjson import loads as _orjson_loads
+except ImportError:
+    _json_loads: Callable[[str], Any] = json.loads
+else:
+    _json_loads = _orjson_loads
 
 _HEADERS = {"user-agent": f"openml-python/{__version__}"}
 
@@ -38,6 +59,40 @@ DATABASE_CONNECTION_ERRCODE = 107
 
 API_TOKEN_HELP_LINK = "https://openml.github.io/openml-python/latest/examples/Basics/introduction_tutorial/#authentication"  # noqa: S105
 
+# Number of distinct hosts (e.g. the API server and the file server) for which a pool of
+# connections is kept. The number of connections per host is ``config.connection_pool_maxsize``.
+_N_HOST_POOLS = 4
+
+_session: requests.Session | None = None
+_session_pid: int | None = None
+_session_pool_maxsize: int | None = None
+_session_lock = threading.Lock()
+
+# MinIO clients by (endpoint, proxy, pool size), which are shared by the downloads of a process
+_minio_clients: dict[tuple[str, str | None, int], minio.Minio] = {}
+_minio_clients_pid: int | None = None
+# Connect and read timeout (in seconds) of the MinIO connection pools, as used by MinIO itself
+_MINIO_TIMEOUT = 5 * 60
+
+LISTING_CACHE_DIR_NAME = "listings"
+# Cache files of the listings which are being refreshed by a background thread
+_refreshing_listings: set[Path] = set()
+_refreshing_listings_lock = threading.Lock()
+
+# (server, endpoint) pairs whose JSON responses could not be used, these are read as XML instead
+_xml_fallback_endpoints: set[tuple[str, str]] = set()
+
+# Data files are downloaded in parts of this many bytes, which are requested concurrently
+_DOWNLOAD_PART_SIZE = 2**25
+_DOWNLOAD_CHUNK_SIZE = 2**16
+# Errors after which the download of a part is continued with a new request
+_DOWNLOAD_ERRORS = (
+    ConnectionError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.ChunkedEncodingError,
+    urllib3.exceptions.HTTPError,
+)
+
 
 def _robot_delay(n: int) -> float:
     wait = (1 / (1 + math.exp(-(n * 0.5 - 4)))) * 60
@@ -69,19 +124,119 @@ def resolve_env_proxies(url: str) -> str | None:
     return requests.utils.select_proxy(url, resolved_proxies)  # type: ignore
 
 
-def _create_url_from_endpoint(endpoint: str) -> str:
-    url = config.server
+def _get_session() -> requests.Session:
+    """Return the session which is shared by all requests to the OpenML server.
+
+    The session keeps up to ``config.connection_pool_maxsize`` connections per host alive, so
+    consecutive calls reuse established TCP/TLS connections instead of doing a new handshake.
+    It is created lazily and re-created when the pool size changes or when it is accessed from
+    a forked child process, as pooled connections must not be shared across processes.
+
+    Returns
+    -------
+    requests.Session
+    """
+    global _session, _session_pid, _session_pool_maxsize  # noqa: PLW0603
+
+    pool_maxsize = max(1, config.connection_pool_maxsize)
+    with _session_lock:
+        if (
+            _session is not None
+            and _session_pid == os.getpid()
+            and _session_pool_maxsize == pool_maxsize
+        ):
+            return _session
+
+        if _session is not None and _session_pid == os.getpid():
+            _session.close()
+
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=_N_HOST_POOLS,
+            pool_maxsize=pool_maxsize,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        _session = session
+        _session_pid = os.getpid()
+        _session_pool_maxsize = pool_maxsize
+        return session
+
+
+def _get_minio_client(endpoint: str, proxy: str | None = None) -> minio.Minio:
+    """Return the MinIO client which is shared by all downloads from ``endpoint``.
+
+    Like the session of ``_get_session``, a client keeps up to ``config.connection_pool_maxsize``
+    connections alive, and is not shared with forked child processes. Apart from the pool size,
+    the connection pool uses the same timeout and retry settings as MinIO's default one.
+
+    Parameters
+    ----------
+    endpoint : str
+        Host (and port) of the MinIO server.
+    proxy : str, optional (default=None)
+        The proxy server to connect through.
+
+    Returns
+    -------
+    minio.Minio
+    """
+    global _minio_clients_pid  # noqa: PLW0603
+
+    pool_maxsize = max(1, config.connection_pool_maxsize)
+    key = (endpoint, proxy, pool_maxsize)
+    with _session_lock:
+        if _minio_clients_pid != os.getpid():
+            _minio_clients.clear()
+            _minio_clients_pid = os.getpid()
+        if key not in _minio_clients:
+            pool_kwargs: dict[str, Any] = {
+                "maxsize": pool_maxsize,
+                "timeout": urllib3.Timeout(connect=_MINIO_TIMEOUT, read=_MINIO_TIMEOUT),
+                "retries": urllib3.Retry(
+                    total=5,
+                    backoff_factor=0.2,
+                    status_forcelist=[500, 502, 503, 504],
+                ),
+            }
+            http_client = (
+                ProxyManager(proxy, **pool_kwargs) if proxy else urllib3.PoolManager(**pool_kwargs)
+            )
+            _minio_clients[key] = minio.Minio(
+                endpoint=endpoint,
+                secure=False,
+                http_client=http_client,
+            )
+        return _minio_clients[key]
+
+
+def _create_url_from_endpoint(endpoint: str, *, api_format: str = "xml") -> str:
+    url = config.server if api_format == "xml" else _json_server(config.server)
+    if url is None:
+        raise ValueError(f"The server {config.server} does not offer the JSON API.")
     if not url.endswith("/"):
         url += "/"
     url += endpoint
     return url.replace("=", "%3d")
 
 
+def _json_server(server: str) -> str | None:
+    """The URL of the JSON flavor of the API of ``server``, which is served next to the XML one.
+
+    Returns None if ``server`` is not the URL of an XML API, e.g. ``.../api/v1/xml``.
+    """
+    base, _, flavor = server.rstrip("/").rpartition("/")
+    return f"{base}/json" if flavor == "xml" else None
+
+
 def _perform_api_call(
     call: str,
     request_method: str,
     data: DATA_TYPE | None = None,
     file_elements: FILE_ELEMENTS_TYPE | None = None,
+    *,
+    api_format: str = "xml",
 ) -> str:
     """
     Perform an API call at the OpenML server.
@@ -101,13 +256,15 @@ def _perform_api_call(
     file_elements : dict
         Mapping of {filename: str} of strings which should be uploaded as
         files to the server.
+    api_format : str (default="xml")
+        Whether to call the XML or the JSON flavor of the API.
 
     Returns
     -------
     return_value : str
         Return value of the OpenML server
     """
-    url = _create_url_from_endpoint(call)
+    url = _create_url_from_endpoint(call, api_format=api_format)
     logging.info("Starting [%s] request for the URL %s", request_method, url)
     start = time.time()
 
@@ -129,11 +286,441 @@ def _perform_api_call(
     return response.text
 
 
+def _perform_read_call(
+    call: str,
+    *,
+    cached: bool = True,
+    force_refresh_cache: bool = False,
+) -> Any:
+    """Perform a read-only API call in the format set for its endpoint in ``config.api_format``.
+
+    If the JSON response of an endpoint cannot be used, for example because the server does
+    not offer the JSON API, the call is repeated in XML and the endpoint is read as XML for the
+    rest of the session.
+
+    Parameters
+    ----------
+    call : str
+        The API call, e.g. ``data/list/limit/100/offset/0``.
+    cached : bool (default=True)
+        If True, the call is answered from the listing cache if possible.
+    force_refresh_cache : bool (default=False)
+        If True, a cached response is ignored and replaced with the response of the server.
+
+    Returns
+    -------
+    str or Any
+        The XML response as a string, or the decoded JSON response.
+    """
+    endpoint = call.split("/", 1)[0]
+    formats = config._parse_api_format(config.api_format)
+    if (
+        formats.get(endpoint, formats[""]) == "json"
+        and (config.server, endpoint) not in _xml_fallback_endpoints
+        and _json_server(config.server) is not None
+    ):
+        try:
+            if cached:
+                response = _perform_cached_api_call(
+                    call,
+                    force_refresh_cache=force_refresh_cache,
+                    api_format="json",
+                )
+            else:
+                response = _perform_api_call(call, "get", api_format="json")
+            return _json_loads(response)
+        except OpenMLServerException:
+            # A proper answer of the server, e.g. that there are no results
+            raise
+        except (OpenMLServerError, ValueError) as e:
+            logging.warning("Could not use the JSON API for %s, using XML instead: %s", call, e)
+            _xml_fallback_endpoints.add((config.server, endpoint))
+
+    if cached:
+        return _perform_cached_api_call(call, force_refresh_cache=force_refresh_cache)
+    return _perform_api_call(call, "get")
+
+
+def _perform_cached_api_call(
+    call: str,
+    *,
+    force_refresh_cache: bool = False,
+    api_format: str = "xml",
+) -> str:
+    """Perform a read-only API call, answering it from the listing cache if possible.
+
+    Responses are cached on disk for the time-to-live configured for the endpoint of the
+    call in ``config.listing_cache_ttl``, and not at all if that is 0. A response older
+    than its time-to-live is still returned for the same time again, while a background
+    thread fetches a fresh copy for the next call.
+
+    Parameters
+    ----------
+    call : str
+        The API call, e.g. ``data/list/limit/100/offset/0``.
+    force_refresh_cache : bool (default=False)
+        If True, the cached response is ignored and replaced with the response of the server.
+    api_format : str (default="xml")
+        Whether to call the XML or the JSON flavor of the API.
+
+    Returns
+    -------
+    str
+        Return value of the OpenML server
+    """
+    endpoint = call.split("/", 1)[0]
+    ttls = config._parse_listing_cache_ttl(config.listing_cache_ttl)
+    ttl = ttls.get(endpoint, ttls[""])
+    if ttl <= 0:
+        return _perform_api_call(call, "get", api_format=api_format)
+
+    # Listings depend on the permissions of the user, so responses are not shared between keys
+    key_call = call if api_format == "xml" else f"{api_format}/{call}"
+    key = hashlib.sha256(f"{config.apikey}\n{key_call}".encode()).hexdigest()
+    cache_directory = Path(config.get_cache_directory()) / LISTING_CACHE_DIR_NAME
+    cache_file = cache_directory / f"{key}.{api_format}"
+    if not force_refresh_cache:
+        try:
+            modified = cache_file.stat().st_mtime
+            response = cache_file.read_text(encoding="utf8")
+        except OSError:
+            pass
+        else:
+            now = time.time()
+            if now - modified <= 2 * ttl:
+                # The access time tracks the last use for the eviction, the modification
+                # time when the response was fetched
+                with contextlib.suppress(OSError):
+                    os.utime(cache_file, (now, modified))
+                if now - modified > ttl:
+                    _refresh_listing_in_background(call, cache_file, api_format=api_format)
+                return response
+
+    return _fetch_listing(
+        call,
+        cache_file,
+        conditional=not force_refresh_cache,
+        api_format=api_format,
+    )
+
+
+def _fetch_listing(
+    call: str,
+    cache_file: Path,
+    *,
+    conditional: bool = True,
+    api_format: str = "xml",
+) -> str:
+    response = _download_revalidated(
+        call,
+        cache_file,
+        conditional=conditional,
+        api_format=api_format,
+    )
+    try:
+        _evict_listings(cache_file.parent, max_bytes=config.listing_cache_max_mb * 2**20)
+    except OSError as e:
+        logging.warning("Could not evict cached listings: %s", e)
+    return response
+
+
+def _refresh_listing_in_background(call: str, cache_file: Path, *, api_format: str = "xml") -> None:
+    with _refreshing_listings_lock:
+        if cache_file in _refreshing_listings:
+            return
+        _refreshing_listings.add(cache_file)
+
+    def _refresh() -> None:
+        try:
+            _fetch_listing(call, cache_file, api_format=api_format)
+        except Exception as e:  # noqa: BLE001
+            logging.info("Could not refresh the cached response of %s: %s", call, e)
+        finally:
+            with _refreshing_listings_lock:
+                _refreshing_listings.discard(cache_file)
+
+    threading.Thread(target=_refresh, daemon=True).start()
+
+
+def _evict_listings(directory: Path, max_bytes: float) -> None:
+    """Remove the least recently used cached listings until they fit in ``max_bytes``."""
+    entries = []
+    for cache_file in directory.glob("*.*"):
+        if cache_file.suffix not in (".xml", ".json") or cache_file.name.endswith(
+            ".validators.json"
+        ):
+            continue
+        with contextlib.suppress(FileNotFoundError):
+            stat = cache_file.stat()
+            entries.append((stat.st_atime, stat.st_size, cache_file))
+
+    total_bytes = sum(size for _, size, _ in entries)
+    for _, size, cache_file in sorted(entries):
+        if total_bytes <= max_bytes:
+            break
+        with contextlib.suppress(FileNotFoundError):
+            cache_file.unlink()
+        with contextlib.suppress(FileNotFoundError):
+            _validators_file(cache_file).unlink()
+        total_bytes -= size
+
+
+def _is_due_for_revalidation(cache_file: Path) -> bool:
+    """Whether ``cache_file`` was validated longer than ``config.metadata_revalidate_after`` ago.
+
+    Always False if revalidation is disabled or the file does not exist.
+    """
+    if config.metadata_revalidate_after <= 0:
+        return False
+    try:
+        validated = cache_file.stat().st_mtime
+    except OSError:
+        return False
+    return time.time() - validated > config.metadata_revalidate_after
+
+
+def _download_revalidated(
+    call: str,
+    cache_file: Path,
+    *,
+    conditional: bool = True,
+    api_format: str = "xml",
+) -> str:
+    """Perform a GET API call and store the response in ``cache_file``.
+
+    If ``cache_file`` exists, the request is conditional on the ``ETag`` and ``Last-Modified``
+    validators the server sent along with it, and a response of 304 (Not Modified) keeps the
+    cached copy instead of downloading it again. The modification time of ``cache_file`` is
+    set to the time of this validation. If the server cannot be reached, the cached copy is
+    used as well.
+
+    Parameters
+    ----------
+    call : str
+        The API call, e.g. ``data/qualities/61``.
+    cache_file : Path
+        The file the response is cached in.
+    conditional : bool (default=True)
+        If False, the response is downloaded even if the cached copy is unchanged.
+    api_format : str (default="xml")
+        Whether to call the XML or the JSON flavor of the API.
+
+    Returns
+    -------
+    str
+        The (possibly cached) response of the server.
+    """
+    validators_file = _validators_file(cache_file)
+    is_cached = cache_file.is_file()
+    headers: dict[str, str] = {}
+    if conditional and is_cached:
+        try:
+            validators = json.loads(validators_file.read_text(encoding="utf8"))
+        except (OSError, ValueError):
+            validators = {}
+        if "etag" in validators:
+            headers["If-None-Match"] = validators["etag"]
+        if "last_modified" in validators:
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+    url = _create_url_from_endpoint(call, api_format=api_format)
+    try:
+        response = __read_url(url, "get", headers=headers)
+    except OSError as e:
+        if not is_cached:
+            raise
+        logging.warning("Could not revalidate %s, using the cached copy: %s", cache_file, e)
+        return cache_file.read_text(encoding="utf8")
+
+    if response.status_code == 304:
+        os.utime(cache_file)
+        return cache_file.read_text(encoding="utf8")
+
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_file.write_text(response.text, encoding="utf8")
+    tmp_file.replace(cache_file)
+
+    validators = {
+        key: response.headers[header]
+        for key, header in (("etag", "ETag"), ("last_modified", "Last-Modified"))
+        if header in response.headers
+    }
+    if validators:
+        validators_file.write_text(json.dumps(validators), encoding="utf8")
+    else:
+        validators_file.unlink(missing_ok=True)
+    return response.text
+
+
+def _validators_file(cache_file: Path) -> Path:
+    return cache_file.with_name(f"{cache_file.name}.validators.json")
+
+
+def _download_in_parts(  # noqa: C901, PLR0913, PLR0915
+    read_range: Callable[[int, int], Iterator[bytes]],
+    size: int,
+    destination: Path,
+    *,
+    source: str,
+    version: str = "",
+    md5_checksum: str | None = None,
+    progress: ProgressType | None = None,
+    max_workers: int | None = None,
+) -> None:
+    """Download the file ``source`` of ``size`` bytes to ``destination`` in parts.
+
+    Parts of ``_DOWNLOAD_PART_SIZE`` bytes are downloaded concurrently by up to
+    ``max_workers`` threads, and written to ``destination`` with a
+    ``.part`` suffix until the file is complete. The parts which are complete are recorded in
+    a ``.part.json`` file, so an interrupted download continues where it stopped, unless the
+    ``version`` (e.g. the etag) of the file changed in the meantime.
+
+    Parameters
+    ----------
+    read_range : Callable[[int, int], Iterator[bytes]]
+        Called with the offset and length of a range of the file, yields the bytes of that range.
+    size : int
+        Size of the file in bytes.
+    destination : Path
+        The path to store the file in.
+    source : str
+        URL of the file, for error messages.
+    version : str, optional (default="")
+        Identifies the content of the file on the server.
+    md5_checksum : str, optional (default=None)
+        If not None, the MD5 checksum of the file is compared to it. It is computed while the
+        parts come in.
+    progress : ProgressType, optional (default=None)
+        Progress bar which is updated with the downloaded bytes.
+    max_workers : int, optional (default=None)
+        The number of parts which are downloaded at the same time.
+        If None, ``config.connection_pool_maxsize`` is used.
+    """
+    part_file = destination.with_name(f"{destination.name}.part")
+    state_file = destination.with_name(f"{destination.name}.part.json")
+    n_parts = math.ceil(size / _DOWNLOAD_PART_SIZE)
+
+    done = _read_download_state(state_file, version=version, size=size)
+    if not done or not part_file.is_file():
+        done = set()
+        with part_file.open("wb") as fh:
+            fh.truncate(size)
+    state_lock = threading.Lock()
+
+    if progress is not None:
+        progress.set_meta(object_name=destination.name, total_length=size)
+        progress.update(sum(min(_DOWNLOAD_PART_SIZE, size - p * _DOWNLOAD_PART_SIZE) for p in done))
+
+    def _download_part(part: int) -> None:
+        start = part * _DOWNLOAD_PART_SIZE
+        stop = min(start + _DOWNLOAD_PART_SIZE, size)
+        _download_range(read_range, part_file, start, stop, progress=progress)
+        with state_lock:
+            done.add(part)
+            state = {"version": version, "size": size, "done": sorted(done)}
+            state_file.write_text(json.dumps(state), encoding="utf8")
+
+    # The parts are hashed in order while later parts are still being downloaded
+    md5 = hashlib.md5()  # noqa: S324
+    n_hashed = 0
+
+    def _hash_complete_parts() -> None:
+        nonlocal n_hashed
+        n_complete = n_hashed
+        while n_complete < n_parts and n_complete in done:
+            n_complete += 1
+        start, stop = n_hashed * _DOWNLOAD_PART_SIZE, min(n_complete * _DOWNLOAD_PART_SIZE, size)
+        with part_file.open("rb") as fh:
+            fh.seek(start)
+            while start < stop:
+                chunk = fh.read(min(_DOWNLOAD_CHUNK_SIZE, stop - start))
+                md5.update(chunk)
+                start += len(chunk)
+        n_hashed = n_complete
+
+    _hash_complete_parts()
+    missing_parts = [part for part in range(n_parts) if part not in done]
+    if max_workers is None:
+        max_workers = config.connection_pool_maxsize
+    max_workers = max(1, min(len(missing_parts), max_workers))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(_download_part, part) for part in missing_parts}
+        try:
+            while pending:
+                completed, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in completed:
+                    future.result()
+                _hash_complete_parts()
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+
+    if md5_checksum is not None and md5.hexdigest() != md5_checksum:
+        part_file.unlink(missing_ok=True)
+        state_file.unlink(missing_ok=True)
+        raise OpenMLHashException(
+            f"Checksum of downloaded file is unequal to the expected checksum {md5_checksum} "
+            f"when downloading {source}.",
+        )
+
+    part_file.replace(destination)
+    state_file.unlink(missing_ok=True)
+
+
+def _read_download_state(state_file: Path, *, version: str, size: int) -> set[int]:
+    """Return the parts of an earlier download of the same file which are complete."""
+    try:
+        state = json.loads(state_file.read_text(encoding="utf8"))
+        if (state["version"], state["size"]) != (version, size):
+            return set()
+        return {int(part) for part in state["done"]}
+    except (OSError, ValueError, KeyError, TypeError):
+        return set()
+
+
+def _download_range(
+    read_range: Callable[[int, int], Iterator[bytes]],
+    part_file: Path,
+    start: int,
+    stop: int,
+    *,
+    progress: ProgressType | None = None,
+) -> None:
+    """Write bytes ``start`` to ``stop`` of a file to the same range of ``part_file``.
+
+    If the connection drops, the rest of the range is requested again, for up to
+    ``config.connection_n_retries`` attempts.
+    """
+    n_retries = max(1, config.connection_n_retries)
+    delay_method = _human_delay if config.retry_policy == "human" else _robot_delay
+    position = start
+    for retry_counter in range(1, n_retries + 1):
+        try:
+            with part_file.open("r+b") as fh:
+                fh.seek(position)
+                for chunk in read_range(position, stop - position):
+                    chunk = chunk[: stop - position]  # noqa: PLW2901
+                    fh.write(chunk)
+                    position += len(chunk)
+                    if progress is not None:
+                        progress.update(len(chunk))
+            if position < stop:
+                raise ConnectionError(f"Received {position - start} of {stop - start} bytes.")
+            return
+        except _DOWNLOAD_ERRORS:
+            if retry_counter >= n_retries:
+                raise
+        time.sleep(delay_method(retry_counter))
+
+
 def _download_minio_file(
     source: str,
     destination: str | Path,
     exists_ok: bool = True,  # noqa: FBT002
     proxy: str | None = "auto",
+    max_part_workers: int | None = None,
 ) -> None:
     """Download file ``source`` from a MinIO Bucket and store it at ``destination``.
 
@@ -149,6 +736,9 @@ def _download_minio_file(
         The proxy server to use. By default it's "auto" which uses ``requests`` to
         automatically find the proxy to use. Pass None or the environment variable
         ``no_proxy="*"`` to disable proxies.
+    max_part_workers : int, optional (default=None)
+        The number of parts of the file which are downloaded at the same time.
+        If None, ``config.connection_pool_maxsize`` is used.
     """
     destination = Path(destination)
     parsed_url = urllib.parse.urlparse(source)
@@ -163,16 +753,38 @@ def _download_minio_file(
     if proxy == "auto":
         proxy = resolve_env_proxies(parsed_url.geturl())
 
-    proxy_client = ProxyManager(proxy) if proxy else None
+    client = _get_minio_client(parsed_url.netloc, proxy)
+    request_headers: dict[str, str | list[str] | tuple[str]] = {**_HEADERS}
 
-    client = minio.Minio(endpoint=parsed_url.netloc, secure=False, http_client=proxy_client)
-    try:
-        client.fget_object(
+    def _read_range(offset: int, length: int) -> Iterator[bytes]:
+        response = client.get_object(
             bucket_name=bucket,
             object_name=object_name,
-            file_path=str(destination),
+            offset=offset,
+            length=length,
+            request_headers=request_headers,
+        )
+        try:
+            yield from response.stream(_DOWNLOAD_CHUNK_SIZE)
+        finally:
+            response.close()
+            response.release_conn()
+
+    try:
+        stat = client.stat_object(bucket_name=bucket, object_name=object_name)
+        etag = stat.etag or ""
+        assert stat.size is not None
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        _download_in_parts(
+            _read_range,
+            stat.size,
+            destination,
+            source=source,
+            version=etag,
+            # The etag of an object which was not uploaded in parts is the MD5 of its content
+            md5_checksum=etag if re.fullmatch("[0-9a-f]{32}", etag) else None,
             progress=ProgressBar() if config.show_progress else None,
-            request_headers=_HEADERS,
+            max_workers=max_part_workers,
         )
         if destination.is_file() and destination.suffix == ".zip":
             with zipfile.ZipFile(destination, "r") as zip_ref:
@@ -189,7 +801,10 @@ def _download_minio_file(
 def _download_minio_bucket(source: str, destination: str | Path) -> None:
     """Download file ``source`` from a MinIO Bucket and store it at ``destination``.
 
-    Does not redownload files which already exist.
+    Does not redownload files which already exist. The objects of the bucket are downloaded
+    concurrently by up to ``config.connection_pool_maxsize`` threads. If there is more than one
+    object, each object is downloaded by a single thread so that all downloads together do not
+    use more connections than the pool of the client holds.
 
     Parameters
     ----------
@@ -205,34 +820,46 @@ def _download_minio_bucket(source: str, destination: str | Path) -> None:
     _, bucket, *prefixes, _file = parsed_url.path.split("/")
     prefix = "/".join(prefixes)
 
-    client = minio.Minio(endpoint=parsed_url.netloc, secure=False)
+    client = _get_minio_client(parsed_url.netloc, resolve_env_proxies(parsed_url.geturl()))
 
+    etags: dict[str, str] = {}
     for file_object in client.list_objects(bucket, prefix=prefix, recursive=True):
         if file_object.object_name is None:
             raise ValueError(f"Object name is None for object {file_object!r}")
         if file_object.etag is None:
             raise ValueError(f"Object etag is None for object {file_object!r}")
+        etags[file_object.object_name] = file_object.etag
+    max_part_workers = 1 if len(etags) > 1 else None
 
-        marker = destination / file_object.etag
+    def _download_object(object_name: str) -> None:
+        marker = destination / etags[object_name]
         if marker.exists():
-            continue
+            return
 
-        file_destination = destination / file_object.object_name.rsplit("/", 1)[1]
+        file_destination = destination / object_name.rsplit("/", 1)[1]
         if (file_destination.parent / file_destination.stem).exists():
             # Marker is missing but archive exists means the server archive changed, force a refresh
             shutil.rmtree(file_destination.parent / file_destination.stem)
 
         with contextlib.suppress(FileExistsError):
             _download_minio_file(
-                source=source.rsplit("/", 1)[0] + "/" + file_object.object_name.rsplit("/", 1)[1],
+                source=source.rsplit("/", 1)[0] + "/" + object_name.rsplit("/", 1)[1],
                 destination=file_destination,
                 exists_ok=False,
+                max_part_workers=max_part_workers,
             )
 
         if file_destination.is_file() and file_destination.suffix == ".zip":
             file_destination.unlink()
             marker.touch()
 
+    if etags:
+        _map_ids(
+            _download_object,
+            list(etags),
+            max_workers=min(len(etags), max(1, config.connection_pool_maxsize)),
+        )
+
 
 def _download_text_file(
     source: str,
@@ -271,20 +898,38 @@ def _download_text_file(
 
     logging.info("Starting [%s] request for the URL %s", "get", source)
     start = time.time()
-    response = __read_url(source, request_method="get", md5_checksum=md5_checksum)
-    downloaded_file = response.text
-
     if output_path is None:
+        response = __read_url(source, request_method="get", md5_checksum=md5_checksum)
         logging.info(
             "%.7fs taken for [%s] request for the URL %s",
             time.time() - start,
             "get",
             source,
         )
-        return downloaded_file
+        return response.text
 
-    with output_path.open("w", encoding=encoding) as fh:
-        fh.write(downloaded_file)
+    # Large files are downloaded in parts if the server supports range requests
+    ranged_download = (
+        _get_ranged_download(source) if encoding.replace("-", "").lower() == "utf8" else None
+    )
+    if ranged_download is not None:
+        size, version = ranged_download
+        _download_in_parts(
+            partial(_read_url_range, source),
+            size,
+            output_path,
+            source=source,
+            version=version,
+            md5_checksum=md5_checksum,
+        )
+    else:
+        __read_url(
+            source,
+            request_method="get",
+            md5_checksum=md5_checksum,
+            output_path=output_path,
+            encoding=encoding,
+        )
 
     logging.info(
         "%.7fs taken for [%s] request for the URL %s",
@@ -295,6 +940,52 @@ def _download_text_file(
     return None
 
 
+def _get_ranged_download(url: str) -> tuple[int, str] | None:
+    """Return the size and version of the file at ``url`` if it should be downloaded in parts.
+
+    That is the case if the file is larger than ``_DOWNLOAD_PART_SIZE`` and the server supports
+    range requests for it, otherwise None is returned.
+    """
+    params = {"api_key": config.apikey} if config.apikey else {}
+    try:
+        response = _get_session().head(
+            url,
+            params=params,
+            headers={**_HEADERS, "Accept-Encoding": "identity"},
+            allow_redirects=True,
+        )
+    except requests.exceptions.RequestException:
+        return None
+
+    size = response.headers.get("Content-Length", "")
+    if (
+        response.status_code != 200
+        or response.headers.get("Accept-Ranges") != "bytes"
+        or response.headers.get("Content-Encoding", "identity") != "identity"
+        or not size.isdigit()
+        or int(size) <= _DOWNLOAD_PART_SIZE
+    ):
+        return None
+    return int(size), response.headers.get("ETag", response.headers.get("Last-Modified", ""))
+
+
+def _read_url_range(url: str, offset: int, length: int) -> Iterator[bytes]:
+    """Yield the bytes ``offset`` to ``offset + length`` of the file at ``url``."""
+    params = {"api_key": config.apikey} if config.apikey else {}
+    headers = {
+        **_HEADERS,
+        "Accept-Encoding": "identity",
+        "Range": f"bytes={offset}-{offset + length - 1}",
+    }
+    with _get_session().get(url, params=params, headers=headers, stream=True) as response:
+        if response.status_code != 206:
+            raise OpenMLServerError(
+                f"Expected a partial response when downloading {url}, "
+                f"got status code {response.status_code}.",
+            )
+        yield from response.iter_content(_DOWNLOAD_CHUNK_SIZE)
+
+
 def _file_id_to_url(file_id: int, filename: str | None = None) -> str:
     """
     Presents the URL how to download a given file id
@@ -329,11 +1020,15 @@ def _read_url_files(
     )
 
 
-def __read_url(
+def __read_url(  # noqa: PLR0913
     url: str,
     request_method: str,
     data: DATA_TYPE | None = None,
     md5_checksum: str | None = None,
+    headers: dict[str, str] | None = None,
+    *,
+    output_path: Path | None = None,
+    encoding: str = "utf8",
 ) -> requests.Response:
     data = {} if data is None else data
     if config.apikey:
@@ -343,6 +1038,9 @@ def __read_url(
         url=url,
         data=data,
         md5_checksum=md5_checksum,
+        headers=headers,
+        output_path=output_path,
+        encoding=encoding,
     )
 
 
@@ -355,14 +1053,24 @@ def __is_checksum_equal(downloaded_file_binary: bytes, md5_checksum: str | None
     return md5_checksum == md5_checksum_download
 
 
-def _send_request(  # noqa: C901, PLR0912
+def _send_request(  # noqa: C901, PLR0912, PLR0913
     request_method: str,
     url: str,
     data: DATA_TYPE,
     files: FILE_ELEMENTS_TYPE | None = None,
     md5_checksum: str | None = None,
+    *,
+    headers: dict[str, str] | None = None,
+    output_path: Path | None = None,
+    encoding: str = "utf8",
 ) -> requests.Response:
+    """Send a request to ``url``, retrying it on connection and database errors.
+
+    If ``output_path`` is given, the body of the response to a GET request is streamed to that
+    file (with ``encoding``) instead of being held in memory, see ``_write_response_to_file``.
+    """
     n_retries = max(1, config.connection_n_retries)
+    request_headers = _HEADERS if headers is None else {**_HEADERS, **headers}
 
     response: requests.Response | None = None
     delay_method = _human_delay if config.retry_policy == "human" else _robot_delay
@@ -370,78 +1078,146 @@ def _send_request(  # noqa: C901, PLR0912
     # Error to raise in case of retrying too often. Will be set to the last observed exception.
     retry_raise_e: Exception | None = None
 
-    with requests.Session() as session:
-        # Start at one to have a non-zero multiplier for the sleep
-        for retry_counter in range(1, n_retries + 1):
-            try:
-                if request_method == "get":
-                    response = session.get(url, params=data, headers=_HEADERS)
-                elif request_method == "delete":
-                    response = session.delete(url, params=data, headers=_HEADERS)
-                elif request_method == "post":
-                    response = session.post(url, data=data, files=files, headers=_HEADERS)
-                else:
-                    raise NotImplementedError()
-
-                __check_response(response=response, url=url, file_elements=files)
-
-                if request_method == "get" and not __is_checksum_equal(
-                    response.text.encode("utf-8"), md5_checksum
-                ):
-                    # -- Check if encoding is not UTF-8 perhaps
-                    if __is_checksum_equal(response.content, md5_checksum):
-                        raise OpenMLHashException(
-                            f"Checksum of downloaded file is unequal to the expected checksum"
-                            f"{md5_checksum} because the text encoding is not UTF-8 when "
-                            f"downloading {url}. There might be a sever-sided issue with the file, "
-                            "see: https://github.com/openml/openml-python/issues/1180.",
-                        )
+    session = _get_session()
+    # Start at one to have a non-zero multiplier for the sleep
+    for retry_counter in range(1, n_retries + 1):
+        try:
+            if request_method == "get":
+                response = session.get(
+                    url,
+                    params=data,
+                    headers=request_headers,
+                    stream=output_path is not None,
+                )
+            elif request_method == "delete":
+                response = session.delete(url, params=data, headers=request_headers)
+            elif request_method == "post":
+                response = session.post(url, data=data, files=files, headers=request_headers)
+            else:
+                raise NotImplementedError()
+
+            if response.status_code == 304 and headers is not None:
+                # Not Modified, the answer to a conditional request
+                return response
 
+            __check_response(response=response, url=url, file_elements=files)
+
+            if request_method == "get" and output_path is not None:
+                _write_response_to_file(
+                    response,
+                    output_path,
+                    url=url,
+                    md5_checksum=md5_checksum,
+                    encoding=encoding,
+                )
+            elif request_method == "get" and not __is_checksum_equal(
+                response.text.encode("utf-8"), md5_checksum
+            ):
+                # -- Check if encoding is not UTF-8 perhaps
+                if __is_checksum_equal(response.content, md5_checksum):
                     raise OpenMLHashException(
-                        f"Checksum of downloaded file is unequal to the expected checksum "
-                        f"{md5_checksum} when downloading {url}.",
+                        f"Checksum of downloaded file is unequal to the expected checksum"
+                        f"{md5_checksum} because the text encoding is not UTF-8 when "
+                        f"downloading {url}. There might be a sever-sided issue with the file, "
+                        "see: https://github.com/openml/openml-python/issues/1180.",
                     )
 
-                return response
-            except OpenMLServerException as e:
-                # Propagate all server errors to the calling functions, except
-                # for 107 which represents a database connection error.
-                # These are typically caused by high server load,
-                # which means trying again might resolve the issue.
-                if e.code != DATABASE_CONNECTION_ERRCODE:
-                    raise e
-                retry_raise_e = e
-            except xml.parsers.expat.ExpatError as e:
-                if request_method != "get" or retry_counter >= n_retries:
-                    if response is not None:
-                        extra = f"Status code: {response.status_code}\n{response.text}"
-                    else:
-                        extra = "No response retrieved."
-
-                    raise OpenMLServerError(
-                        f"Unexpected server error when calling {url}. Please contact the "
-                        f"developers!\n{extra}"
-                    ) from e
-                retry_raise_e = e
-            except (
-                requests.exceptions.ChunkedEncodingError,
-                requests.exceptions.ConnectionError,
-                requests.exceptions.SSLError,
-                OpenMLHashException,
-            ) as e:
-                retry_raise_e = e
-
-            # We can only be here if there was an exception
-            assert retry_raise_e is not None
-            if retry_counter >= n_retries:
-                raise retry_raise_e
-            delay = delay_method(retry_counter)
-            time.sleep(delay)
+                raise OpenMLHashException(
+                    f"Checksum of downloaded file is unequal to the expected checksum "
+                    f"{md5_checksum} when downloading {url}.",
+                )
+
+            return response
+        except OpenMLServerException as e:
+            # Propagate all server errors to the calling functions, except
+            # for 107 which represents a database connection error.
+            # These are typically caused by high server load,
+            # which means trying again might resolve the issue.
+            if e.code != DATABASE_CONNECTION_ERRCODE:
+                raise e
+            retry_raise_e = e
+        except xml.parsers.expat.ExpatError as e:
+            if request_method != "get" or retry_counter >= n_retries:
+                if response is not None:
+                    extra = f"Status code: {response.status_code}\n{response.text}"
+                else:
+                    extra = "No response retrieved."
+
+                raise OpenMLServerError(
+                    f"Unexpected server error when calling {url}. Please contact the "
+                    f"developers!\n{extra}"
+                ) from e
+            retry_raise_e = e
+        except (
+            requests.exceptions.ChunkedEncodingError,
+            requests.exceptions.ConnectionError,
+            requests.exceptions.SSLError,
+            OpenMLHashException,
+        ) as e:
+            retry_raise_e = e
+
+        # We can only be here if there was an exception
+        assert retry_raise_e is not None
+        if retry_counter >= n_retries:
+            raise retry_raise_e
+        delay = delay_method(retry_counter)
+        time.sleep(delay)
 
     assert response is not None
     return response
 
 
+def _write_response_to_file(
+    response: requests.Response,
+    output_path: Path,
+    *,
+    url: str,
+    md5_checksum: str | None = None,
+    encoding: str = "utf8",
+) -> None:
+    """Write the text of ``response`` to ``output_path`` in chunks, so it never is in memory.
+
+    The MD5 checksum is computed chunk by chunk as well, and compared to ``md5_checksum``. The
+    text is written to a temporary file first, which replaces ``output_path`` once it is
+    complete and its checksum is correct.
+    """
+    tmp_file = output_path.with_name(
+        f"{output_path.name}.{os.getpid()}.{threading.get_ident()}.tmp",
+    )
+    # Decode the text the same way as ``response.text``
+    decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+    text_md5, content_md5 = hashlib.md5(), hashlib.md5()  # noqa: S324
+    try:
+        with tmp_file.open("w", encoding=encoding) as fh:
+            for chunk in response.iter_content(_DOWNLOAD_CHUNK_SIZE):
+                content_md5.update(chunk)
+                text = decoder.decode(chunk)
+                text_md5.update(text.encode("utf-8"))
+                fh.write(text)
+            text = decoder.decode(b"", final=True)
+            text_md5.update(text.encode("utf-8"))
+            fh.write(text)
+
+        if md5_checksum is not None and text_md5.hexdigest() != md5_checksum:
+            # -- Check if encoding is not UTF-8 perhaps
+            if content_md5.hexdigest() == md5_checksum:
+                raise OpenMLHashException(
+                    f"Checksum of downloaded file is unequal to the expected checksum"
+                    f"{md5_checksum} because the text encoding is not UTF-8 when "
+                    f"downloading {url}. There might be a sever-sided issue with the file, "
+                    "see: https://github.com/openml/openml-python/issues/1180.",
+                )
+
+            raise OpenMLHashException(
+                f"Checksum of downloaded file is unequal to the expected checksum "
+                f"{md5_checksum} when downloading {url}.",
+            )
+
+        tmp_file.replace(output_path)
+    finally:
+        tmp_file.unlink(missing_ok=True)
+
+
 def __check_response(
     response: requests.Response,
     url: str,
@@ -465,7 +1241,12 @@ def __parse_server_exception(
     # in the response body itself.
     # First, we need to parse it out.
     try:
-        server_exception = xmltodict.parse(response.text)
+        if response.text.lstrip().startswith("{"):
+            # The JSON API reports errors as {"error": {"code": ..., "message": ...}}
+            json_error = _json_loads(response.text)["error"]
+            server_exception = {"oml:error": {f"oml:{k}": v for k, v in json_error.items()}}
+        else:
+            server_exception = xmltodict.parse(response.text)
     except xml.parsers.expat.ExpatError as e:
         raise e
     except Exception as e:
@@ -0,0 +1,391 @@
+# License: BSD 3-Clause
+"""An SQLite index of the metadata of the cached entities, to query the cache offline.
+
+The index is stored in the cache directory of the server and updated whenever a description is
+downloaded to the cache. Entities which were cached before the index existed are added the first
+time the index is queried, or with ``rebuild_cache_index``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import sqlite3
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
+import xmltodict
+
+from . import config
+
+if TYPE_CHECKING:
+    from .datasets import OpenMLDataFeature
+    from .flows import OpenMLFlow
+    from .runs import OpenMLRun
+    from .tasks import OpenMLTask
+
+logger = logging.getLogger(__name__)
+
+CACHE_INDEX_FILE_NAME = "index.sqlite"
+# Increase when the schema changes, an index with another version is rebuilt
+_SCHEMA_VERSION = 1
+_SCHEMA = """
+CREATE TABLE datasets (
+    did INTEGER PRIMARY KEY,
+    name TEXT,
+    version INTEGER,
+    status TEXT,
+    format TEXT,
+    upload_date TEXT,
+    default_target_attribute TEXT,
+    md5_checksum TEXT
+);
+CREATE TABLE dataset_qualities (
+    did INTEGER,
+    name TEXT,
+    value REAL,
+    PRIMARY KEY (did, name)
+);
+CREATE TABLE dataset_features (
+    did INTEGER PRIMARY KEY,
+    number_of_features INTEGER,
+    number_of_numeric_features INTEGER,
+    number_of_nominal_features INTEGER,
+    number_of_string_features INTEGER,
+    number_of_features_with_missing_values INTEGER
+);
+CREATE TABLE tasks (
+    tid INTEGER PRIMARY KEY,
+    task_type_id INTEGER,
+    task_type TEXT,
+    did INTEGER,
+    target_name TEXT,
+    estimation_procedure_id INTEGER,
+    evaluation_measure TEXT
+);
+CREATE TABLE flows (
+    fid INTEGER PRIMARY KEY,
+    name TEXT,
+    custom_name TEXT,
+    version TEXT,
+    external_version TEXT,
+    uploader TEXT,
+    upload_date TEXT
+);
+CREATE TABLE runs (
+    run_id INTEGER PRIMARY KEY,
+    task_id INTEGER,
+    flow_id INTEGER,
+    flow_name TEXT,
+    setup_id INTEGER,
+    did INTEGER,
+    uploader INTEGER
+);
+CREATE TABLE run_evaluations (
+    run_id INTEGER,
+    name TEXT,
+    value REAL,
+    PRIMARY KEY (run_id, name)
+);
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE INDEX tasks_did ON tasks (did);
+CREATE INDEX runs_task_id ON runs (task_id);
+"""
+# The tables with the rows of an entity, by the name of its cache directory
+_ENTITY_TABLES = {
+    "datasets": [("datasets", "did"), ("dataset_qualities", "did"), ("dataset_features", "did")],
+    "tasks": [("tasks", "tid")],
+    "flows": [("flows", "fid")],
+    "runs": [("runs", "run_id"), ("run_evaluations", "run_id")],
+}
+
+
+def query_cache_index(sql: str, parameters: tuple | dict = ()) -> pd.DataFrame:
+    """Query the metadata of the cached entities with SQL, without contacting the server.
+
+    The index of the cache directory of the configured server has the tables:
+
+    - ``datasets`` (did, name, version, status, format, upload_date,
+      default_target_attribute, md5_checksum)
+    - ``dataset_qualities`` (did, name, value)
+    - ``dataset_features`` (did, number_of_features, number_of_numeric_features,
+      number_of_nominal_features, number_of_string_features,
+      number_of_features_with_missing_values)
+    - ``tasks`` (tid, task_type_id, task_type, did, target_name, estimation_procedure_id,
+      evaluation_measure)
+    - ``flows`` (fid, name, custom_name, version, external_version, uploader, upload_date)
+    - ``runs`` (run_id, task_id, flow_id, flow_name, setup_id, did, uploader)
+    - ``run_evaluations`` (run_id, name, value)
+
+    If the index does not cover the cache yet, it is built from the cached files first.
+
+    Parameters
+    ----------
+    sql : str
+        The query, e.g. to find the cached classification tasks on datasets with less than
+        10000 instances::
+
+            SELECT tasks.tid FROM tasks JOIN dataset_qualities AS q ON q.did = tasks.did
+            WHERE tasks.task_type_id = 1 AND q.name = 'NumberOfInstances' AND q.value < 10000
+
+    parameters : tuple or dict, optional
+        Values for the placeholders (``?`` or ``:name``) in ``sql``.
+
+    Returns
+    -------
+    pd.DataFrame
+        The result of the query.
+    """
+    with _connect() as connection:
+        is_built = connection.execute("SELECT value FROM meta WHERE key = 'built'").fetchone()
+    if is_built is None:
+        rebuild_cache_index()
+
+    with _connect() as connection:
+        return pd.read_sql_query(sql, connection, params=parameters)
+
+
+def rebuild_cache_index() -> None:
+    """Build the index of the cache from the files in the cache directory of the server.
+
+    Only needed if the cache was changed without OpenML-Python, the index is otherwise updated
+    whenever an entity is downloaded.
+    """
+    from .datasets.dataset import _parse_features_xml, _parse_qualities_xml
+    from .datasets.functions import DATASETS_CACHE_DIR_NAME
+    from .flows.functions import FLOWS_CACHE_DIR_NAME, _create_flow_from_xml
+    from .runs.functions import RUNS_CACHE_DIR_NAME, _create_run_from_xml
+    from .tasks.functions import TASKS_CACHE_DIR_NAME, _create_task_from_xml
+
+    cache_directory = Path(config.get_cache_directory())
+    readers: list[tuple[str, str, Callable[[sqlite3.Connection, int, str], None]]] = [
+        (
+            DATASETS_CACHE_DIR_NAME,
+            "description.xml",
+            lambda c, _, xml: _insert_dataset_description(
+                c, xmltodict.parse(xml)["oml:data_set_description"]
+            ),
+        ),
+        (
+            DATASETS_CACHE_DIR_NAME,
+            "qualities.xml",
+            lambda c, did, xml: _insert_dataset_qualities(c, did, _parse_qualities_xml(xml)),
+        ),
+        (
+            DATASETS_CACHE_DIR_NAME,
+            "features.xml",
+            lambda c, did, xml: _insert_dataset_features(c, did, _parse_features_xml(xml)),
+        ),
+        (
+            TASKS_CACHE_DIR_NAME,
+            "task.xml",
+            lambda c, _, xml: _insert_task(c, _create_task_from_xml(xml)),
+        ),
+        (
+            FLOWS_CACHE_DIR_NAME,
+            "flow.xml",
+            lambda c, _, xml: _insert_flow(c, _create_flow_from_xml(xml)),
+        ),
+        (
+            RUNS_CACHE_DIR_NAME,
+            "description.xml",
+            lambda c, _, xml: _insert_run(c, _create_run_from_xml(xml)),
+        ),
+    ]
+
+    with _connect() as connection:
+        for table in [
+            "meta",
+            *(table for tables in _ENTITY_TABLES.values() for table, _ in tables),
+        ]:
+            connection.execute(f"DELETE FROM {table}")  # noqa: S608
+        for directory, file_name, insert in readers:
+            for file in sorted((cache_directory / directory).glob(f"*/{file_name}")):
+                if not file.parent.name.isdigit():
+                    continue
+                try:
+                    insert(connection, int(file.parent.name), file.read_text(encoding="utf8"))
+                except Exception as e:  # noqa: BLE001
+                    logger.warning("Could not add %s to the cache index: %s", file, e)
+        connection.execute("INSERT INTO meta VALUES ('built', '1')")
+
+
+@contextlib.contextmanager
+def _connect(*, create: bool = True) -> Iterator[sqlite3.Connection]:
+    """Open the index of the cache directory of the server in a transaction.
+
+    If ``create`` is False and there is no index yet, FileNotFoundError is raised.
+    """
+    index_file = Path(config.get_cache_directory()) / CACHE_INDEX_FILE_NAME
+    if not create and not index_file.is_file():
+        raise FileNotFoundError(index_file)
+
+    index_file.parent.mkdir(parents=True, exist_ok=True)
+    # Several processes may share a cache, so writers wait for each other's transactions
+    connection = sqlite3.connect(index_file, timeout=60)
+    try:
+        with connection:
+            if connection.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+                tables = connection.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table'"
+                ).fetchall()
+                for (table,) in tables:
+                    connection.execute(f"DROP TABLE {table}")
+                connection.executescript(_SCHEMA)
+                connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            yield connection
+    finally:
+        connection.close()
+
+
+def _write(insert: Callable[..., None], *args: Any) -> None:
+    """Call ``insert`` with a connection to the index and ``args``.
+
+    The index is an addition to the cache, so an error is logged instead of raised.
+    """
+    try:
+        with _connect() as connection:
+            insert(connection, *args)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("Could not update the cache index: %s", e)
+
+
+def _index_dataset_description(description: dict[str, Any]) -> None:
+    _write(_insert_dataset_description, description)
+
+
+def _index_dataset_qualities(dataset_id: int, qualities: dict[str, float]) -> None:
+    _write(_insert_dataset_qualities, dataset_id, qualities)
+
+
+def _index_dataset_features(dataset_id: int, features: dict[int, OpenMLDataFeature]) -> None:
+    _write(_insert_dataset_features, dataset_id, features)
+
+
+def _index_task(task: OpenMLTask) -> None:
+    _write(_insert_task, task)
+
+
+def _index_flow(flow: OpenMLFlow) -> None:
+    _write(_insert_flow, flow)
+
+
+def _index_run(run: OpenMLRun) -> None:
+    _write(_insert_run, run)
+
+
+def _remove_from_index(key: str, id_: int) -> None:
+    """Remove the entity cached in directory ``key`` with ``id_``, if there is an index."""
+    tables = _ENTITY_TABLES.get(key, [])
+    if not tables:
+        return
+    try:
+        with _connect(create=False) as connection:
+            for table, id_column in tables:
+                connection.execute(f"DELETE FROM {table} WHERE {id_column} = ?", (id_,))  # noqa: S608
+    except FileNotFoundError:
+        pass
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("Could not update the cache index: %s", e)
+
+
+def _insert_dataset_description(connection: sqlite3.Connection, description: dict) -> None:
+    connection.execute(
+        "INSERT OR REPLACE INTO datasets VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            int(description["oml:id"]),
+            description.get("oml:name"),
+            int(description["oml:version"]) if "oml:version" in description else None,
+            description.get("oml:status"),
+            description.get("oml:format"),
+            description.get("oml:upload_date"),
+            description.get("oml:default_target_attribute"),
+            description.get("oml:md5_checksum"),
+        ),
+    )
+
+
+def _insert_dataset_qualities(
+    connection: sqlite3.Connection,
+    dataset_id: int,
+    qualities: dict[str, float],
+) -> None:
+    connection.execute("DELETE FROM dataset_qualities WHERE did = ?", (dataset_id,))
+    connection.executemany(
+        "INSERT INTO dataset_qualities VALUES (?, ?, ?)",
+        [(dataset_id, name, value) for name, value in qualities.items()],
+    )
+
+
+def _insert_dataset_features(
+    connection: sqlite3.Connection,
+    dataset_id: int,
+    features: dict[int, OpenMLDataFeature],
+) -> None:
+    data_types = [feature.data_type for feature in features.values()]
+    connection.execute(
+        "INSERT OR REPLACE INTO dataset_features VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            dataset_id,
+            len(features),
+            data_types.count("numeric"),
+            data_types.count("nominal"),
+            data_types.count("string"),
+            sum(feature.number_missing_values > 0 for feature in features.values()),
+        ),
+    )
+
+
+def _insert_task(connection: sqlite3.Connection, task: OpenMLTask) -> None:
+    connection.execute(
+        "INSERT OR REPLACE INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (
+            task.task_id,
+            task.task_type_id.value,
+            task.task_type,
+            task.dataset_id,
+            getattr(task, "target_name", None),
+            task.estimation_procedure_id,
+            task.evaluation_measure,
+        ),
+    )
+
+
+def _insert_flow(connection: sqlite3.Connection, flow: OpenMLFlow) -> None:
+    connection.execute(
+        "INSERT OR REPLACE INTO flows VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (
+            flow.flow_id,
+            flow.name,
+            flow.custom_name,
+            flow.version,
+            flow.external_version,
+            flow.uploader,
+            flow.upload_date,
+        ),
+    )
+
+
+def _insert_run(connection: sqlite3.Connection, run: OpenMLRun) -> None:
+    connection.execute(
+        "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (
+            run.run_id,
+            run.task_id,
+            run.flow_id,
+            run.flow_name,
+            run.setup_id,
+            run.dataset_id,
+            run.uploader,
+        ),
+    )
+    connection.execute("DELETE FROM run_evaluations WHERE run_id = ?", (run.run_id,))
+    connection.executemany(
+        "INSERT INTO run_evaluations VALUES (?, ?, ?)",
+        [(run.run_id, name, value) for name, value in (run.evaluations or {}).items()],
+    )
@@ -10,11 +10,11 @@ import os
 import platform
 import shutil
 import warnings
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from contextlib import contextmanager
 from io import StringIO
 from pathlib import Path
-from typing import Any, Literal, cast
+from typing import Any, Literal, TypeVar, cast
 from typing_extensions import TypedDict
 from urllib.parse import urlparse
 
@@ -27,6 +27,8 @@ OPENML_CACHE_DIR_ENV_VAR = "OPENML_CACHE_DIR"
 OPENML_SKIP_PARQUET_ENV_VAR = "OPENML_SKIP_PARQUET"
 _TEST_SERVER_NORMAL_USER_KEY = "normaluser"
 
+_T = TypeVar("_T")
+
 
 class _Config(TypedDict):
     apikey: str
@@ -35,6 +37,13 @@ class _Config(TypedDict):
     avoid_duplicate_runs: bool
     retry_policy: Literal["human", "robot"]
     connection_n_retries: int
+    connection_pool_maxsize: int
+    max_concurrent_pages: int
+    listing_cache_ttl: int | str
+    listing_cache_max_mb: float
+    data_cache_max_mb: float
+    metadata_revalidate_after: int
+    api_format: str
     show_progress: bool
 
 
@@ -155,6 +164,13 @@ _defaults: _Config = {
     "avoid_duplicate_runs": False,
     "retry_policy": "human",
     "connection_n_retries": 5,
+    "connection_pool_maxsize": 10,
+    "max_concurrent_pages": 1,
+    "listing_cache_ttl": 0,
+    "listing_cache_max_mb": 64,
+    "data_cache_max_mb": 0,
+    "metadata_revalidate_after": 0,
+    "api_format": "xml",
     "show_progress": False,
 }
 
@@ -185,6 +201,13 @@ avoid_duplicate_runs = _defaults["avoid_duplicate_runs"]
 
 retry_policy: Literal["human", "robot"] = _defaults["retry_policy"]
 connection_n_retries: int = _defaults["connection_n_retries"]
+connection_pool_maxsize: int = _defaults["connection_pool_maxsize"]
+max_concurrent_pages: int = _defaults["max_concurrent_pages"]
+listing_cache_ttl: int | str = _defaults["listing_cache_ttl"]
+listing_cache_max_mb: float = _defaults["listing_cache_max_mb"]
+data_cache_max_mb: float = _defaults["data_cache_max_mb"]
+metadata_revalidate_after: int = _defaults["metadata_revalidate_after"]
+api_format: str = _defaults["api_format"]
 
 
 def set_retry_policy(value: Literal["human", "robot"], n_retries: int | None = None) -> None:
@@ -328,7 +351,7 @@ def determine_config_file_path() -> Path:
     return config_dir / "config"
 
 
-def _setup(config: _Config | None = None) -> None:
+def _setup(config: _Config | None = None) -> None:  # noqa: PLR0915
     """Setup openml package. Called on first import.
 
     Reads the config file and sets up apikey, server, cache appropriately.
@@ -342,6 +365,13 @@ def _setup(config: _Config | None = None) -> None:
     global _root_cache_directory  # noqa: PLW0603
     global avoid_duplicate_runs  # noqa: PLW0603
     global show_progress  # noqa: PLW0603
+    global connection_pool_maxsize  # noqa: PLW0603
+    global max_concurrent_pages  # noqa: PLW0603
+    global listing_cache_ttl  # noqa: PLW0603
+    global listing_cache_max_mb  # noqa: PLW0603
+    global data_cache_max_mb  # noqa: PLW0603
+    global metadata_revalidate_after  # noqa: PLW0603
+    global api_format  # noqa: PLW0603
 
     config_file = determine_config_file_path()
     config_dir = config_file.parent
@@ -364,6 +394,15 @@ def _setup(config: _Config | None = None) -> None:
     server = config["server"]
     show_progress = config["show_progress"]
     n_retries = int(config["connection_n_retries"])
+    connection_pool_maxsize = int(config["connection_pool_maxsize"])
+    max_concurrent_pages = int(config["max_concurrent_pages"])
+    _parse_listing_cache_ttl(config["listing_cache_ttl"])  # fail early on a malformed value
+    listing_cache_ttl = config["listing_cache_ttl"]
+    listing_cache_max_mb = float(config["listing_cache_max_mb"])
+    data_cache_max_mb = float(config["data_cache_max_mb"])
+    metadata_revalidate_after = int(config["metadata_revalidate_after"])
+    _parse_api_format(config["api_format"])  # fail early on a malformed value
+    api_format = config["api_format"]
 
     set_retry_policy(config["retry_policy"], n_retries)
 
@@ -388,6 +427,67 @@ def _setup(config: _Config | None = None) -> None:
         _create_log_handlers(create_file_handler=False)
 
 
+def _parse_listing_cache_ttl(value: int | str) -> dict[str, int]:
+    """Parse the ``listing_cache_ttl`` option into time-to-lives in seconds per endpoint.
+
+    The value is either a number of seconds for all endpoints, or a comma-separated list of
+    such a default and ``endpoint=seconds`` overrides, e.g. ``"3600, evaluation=600"``.
+    The default is stored under the empty string.
+    """
+    return _parse_endpoint_overrides(
+        "listing_cache_ttl",
+        value,
+        default=0,
+        convert=int,
+        expected="a number of seconds or 'endpoint=seconds'",
+    )
+
+
+def _parse_api_format(value: str) -> dict[str, str]:
+    """Parse the ``api_format`` option into the format of the responses per endpoint.
+
+    The value is either ``xml`` or ``json`` for all endpoints, or a comma-separated list of
+    such a default and ``endpoint=format`` overrides, e.g. ``"json, setup=xml"``.
+    The default is stored under the empty string.
+    """
+
+    def _format(setting: str) -> str:
+        if setting not in ("xml", "json"):
+            raise ValueError(setting)
+        return setting
+
+    return _parse_endpoint_overrides(
+        "api_format",
+        value,
+        default="xml",
+        convert=_format,
+        expected="'xml', 'json' or 'endpoint=format'",
+    )
+
+
+def _parse_endpoint_overrides(
+    option: str,
+    value: int | str,
+    *,
+    default: _T,
+    convert: Callable[[str], _T],
+    expected: str,
+) -> dict[str, _T]:
+    """Parse an option with a default for all endpoints and ``endpoint=value`` overrides."""
+    parsed = {"": default}
+    for entry in str(value).split(","):
+        if not entry.strip():
+            continue
+        endpoint, _, setting = entry.rpartition("=")
+        try:
+            parsed[endpoint.strip()] = convert(setting.strip())
+        except ValueError:
+            raise ValueError(
+                f"Invalid entry '{entry.strip()}' in {option} '{value}', expected {expected}.",
+            ) from None
+    return parsed
+
+
 def set_field_in_config_file(field: str, value: Any) -> None:
     """Overwrites the `field` in the configuration file with the new `value`."""
     if field not in _defaults:
@@ -443,6 +543,13 @@ def get_config_as_dict() -> _Config:
         "avoid_duplicate_runs": avoid_duplicate_runs,
         "connection_n_retries": connection_n_retries,
         "retry_policy": retry_policy,
+        "connection_pool_maxsize": connection_pool_maxsize,
+        "max_concurrent_pages": max_concurrent_pages,
+        "listing_cache_ttl": listing_cache_ttl,
+        "listing_cache_max_mb": listing_cache_max_mb,
+        "data_cache_max_mb": data_cache_max_mb,
+        "metadata_revalidate_after": metadata_revalidate_after,
+        "api_format": api_format,
         "show_progress": show_progress,
     }
 
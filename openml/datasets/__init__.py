@@ -11,6 +11,7 @@ from .functions import (
     fork_dataset,
     get_dataset,
     get_datasets,
+    iter_datasets,
     list_datasets,
     list_qualities,
     status_update,
@@ -27,6 +28,7 @@ __all__ = [
     "fork_dataset",
     "get_dataset",
     "get_datasets",
+    "iter_datasets",
     "list_datasets",
     "list_qualities",
     "status_update",
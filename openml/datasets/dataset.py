@@ -2,21 +2,26 @@
 from __future__ import annotations
 
 import gzip
+import itertools
+import json
 import logging
 import os
 import pickle
 import re
 import warnings
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Literal
 
 import arff
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import scipy.sparse
 import xmltodict
 
+import openml.utils
 from openml.base import OpenMLBase
 from openml.config import OPENML_SKIP_PARQUET_ENV_VAR
 
@@ -24,6 +29,10 @@ from .data_feature import OpenMLDataFeature
 
 logger = logging.getLogger(__name__)
 
+# Number of ARFF data rows which are decoded into Python objects at once before they are
+# converted into typed numpy buffers.
+_ARFF_CHUNK_SIZE = 10_000
+
 
 def _ensure_dataframe(
     data: pd.DataFrame | pd.Series | np.ndarray | scipy.sparse.spmatrix,
@@ -41,6 +50,160 @@ def _ensure_dataframe(
     raise TypeError(f"Data type {type(data)} not supported.")
 
 
+def _write_arrow_file(
+    data: pd.DataFrame,
+    categorical: list[bool],
+    attribute_names: list[str],
+    path: Path,
+) -> None:
+    """Write ``data`` as a single record batch to an uncompressed Arrow IPC file.
+
+    Float columns are written with NaN kept as a value instead of being converted to a null, so
+    that they can be read back without a copy by :func:`_read_arrow_file`.
+    """
+    columns = [
+        pa.array(data[column], from_pandas=not pd.api.types.is_float_dtype(data[column].dtype))
+        for column in data.columns
+    ]
+    metadata = {"openml": json.dumps({"categorical": categorical, "names": attribute_names})}
+    table = pa.Table.from_arrays(columns, names=[str(c) for c in data.columns], metadata=metadata)
+    with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+
+def _read_dense_arff_columns(
+    rows: Iterator[list],
+    attributes: list[tuple[str, Any]],
+) -> list[np.ndarray | list]:
+    """Convert decoded dense ARFF rows into one buffer per attribute, chunk by chunk.
+
+    Nominal attributes are returned as float codes (NaN for missing values), integer attributes as
+    int64 (float64 if values are missing), real attributes as float64 and string attributes as a
+    list of Python strings.
+    """
+    chunks: list[list[np.ndarray | list]] = [[] for _ in attributes]
+    while chunk := list(itertools.islice(rows, _ARFF_CHUNK_SIZE)):
+        for buffers, (_, type_), values in zip(
+            chunks, attributes, zip(*chunk, strict=True), strict=True
+        ):
+            if type_ == "STRING":
+                buffers.append(list(values))
+            elif type_ == "INTEGER":
+                try:
+                    buffers.append(np.array(values, dtype=np.int64))
+                except TypeError:
+                    buffers.append(np.array(values, dtype=np.float64))
+            else:
+                buffers.append(np.array(values, dtype=np.float64))
+
+    columns: list[np.ndarray | list] = []
+    for buffers, (_, type_) in zip(chunks, attributes, strict=True):
+        if type_ == "STRING":
+            columns.append(list(itertools.chain.from_iterable(buffers)))
+        elif buffers:
+            columns.append(np.concatenate(buffers))
+        else:
+            columns.append(np.empty(0, dtype=np.float64))
+        buffers.clear()
+    return columns
+
+
+def _read_sparse_arff_coo(
+    rows: Iterator[dict[int, Any]],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Convert decoded sparse ARFF rows into COO ``(data, row, col)`` arrays, chunk by chunk."""
+    data_chunks, row_chunks, col_chunks = [], [], []
+    offset = 0
+    while chunk := list(itertools.islice(rows, _ARFF_CHUNK_SIZE)):
+        n_values = np.fromiter((len(row) for row in chunk), dtype=np.int64, count=len(chunk))
+        row_chunks.append(np.repeat(np.arange(offset, offset + len(chunk)), n_values))
+        col_chunks.append(
+            np.fromiter(itertools.chain.from_iterable(chunk), dtype=np.int64, count=n_values.sum())
+        )
+        data_chunks.append(
+            np.array([value for row in chunk for value in row.values()], dtype=np.float32)
+        )
+        offset += len(chunk)
+
+    if not data_chunks:
+        return np.empty(0, np.float32), np.empty(0, np.int64), np.empty(0, np.int64)
+    return np.concatenate(data_chunks), np.concatenate(row_chunks), np.concatenate(col_chunks)
+
+
+def _select_columns(
+    attribute_names: list[str],
+    categorical: list[bool],
+    columns: Sequence[str] | None,
+    exclude: Iterable[str],
+) -> tuple[list[str], list[bool]]:
+    """Return the names (and categorical mask) of ``columns`` without those in ``exclude``.
+
+    If ``columns`` is None, all attributes are selected in their original order.
+    """
+    if columns is None:
+        columns = attribute_names
+    else:
+        unknown = [column for column in columns if column not in attribute_names]
+        if unknown:
+            raise ValueError(f"Columns {unknown} are not attributes of this dataset.")
+
+    is_categorical = dict(zip(attribute_names, categorical, strict=True))
+    exclude = set(exclude)
+    names = [column for column in columns if column not in exclude]
+    return names, [is_categorical[name] for name in names]
+
+
+def _subset_data(
+    data: pd.DataFrame,
+    names: list[str],
+    rows: Sequence[int] | np.ndarray | None,
+) -> pd.DataFrame:
+    if names != list(data.columns):
+        data = data[names]
+    if rows is not None:
+        data = data.iloc[rows]
+    return data
+
+
+def _read_arrow_file(
+    path: Path,
+    columns: Sequence[str] | None = None,
+    exclude: Iterable[str] = (),
+    rows: Sequence[int] | np.ndarray | None = None,
+) -> tuple[pd.DataFrame, list[bool], list[str]]:
+    """Memory-map an Arrow IPC file written by :func:`_write_arrow_file`.
+
+    Numeric columns without nulls are returned as read-only views on the mapped file, all other
+    columns (strings, booleans, categoricals) are converted to pandas as usual. Only the selected
+    columns and rows are ever converted.
+    """
+    table = pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+    metadata = json.loads(table.schema.metadata[b"openml"])
+    attribute_names, categorical = _select_columns(
+        metadata["names"], metadata["categorical"], columns, exclude
+    )
+
+    data: dict[str, Any] = {}
+    for name in attribute_names:
+        column = table.column(name)
+        if column.num_chunks == 1 and not pa.types.is_dictionary(column.type):
+            try:
+                values = column.chunk(0).to_numpy(zero_copy_only=True)
+            except pa.ArrowInvalid:
+                pass
+            else:
+                data[name] = values if rows is None else values[rows]
+                continue
+        if rows is not None:
+            column = column.take(pa.array(rows, type=pa.int64()))
+        data[name] = column.to_pandas()
+
+    frame = pd.DataFrame(data, copy=False)
+    if rows is not None:
+        frame.index = pd.Index(np.asarray(rows, dtype=np.int64))
+    return frame, categorical, attribute_names
+
+
 class OpenMLDataset(OpenMLBase):  # noqa: PLW1641
     """Dataset object.
 
@@ -55,7 +218,9 @@ class OpenMLDataset(OpenMLBase):  # noqa: PLW1641
     data_format : str
         Format of the dataset which can be either 'arff' or 'sparse_arff'.
     cache_format : str
-        Format for caching the dataset which can be either 'feather' or 'pickle'.
+        Format for caching the dataset which can be either 'feather', 'pickle' or 'arrow'.
+        With 'arrow' the cache file is memory-mapped on load, so numeric columns are read-only
+        views on the page cache which is shared between processes.
     dataset_id : int, optional
         Id autogenerated by the server.
     version : int, optional
@@ -128,7 +293,7 @@ class OpenMLDataset(OpenMLBase):  # noqa: PLW1641
         name: str,
         description: str | None,
         data_format: Literal["arff", "sparse_arff"] = "arff",
-        cache_format: Literal["feather", "pickle"] = "pickle",
+        cache_format: Literal["feather", "pickle", "arrow"] = "pickle",
         dataset_id: int | None = None,
         version: int | None = None,
         creator: str | None = None,
@@ -156,9 +321,9 @@ class OpenMLDataset(OpenMLBase):  # noqa: PLW1641
         parquet_url: str | None = None,
         parquet_file: str | None = None,
     ):
-        if cache_format not in ["feather", "pickle"]:
+        if cache_format not in ["feather", "pickle", "arrow"]:
             raise ValueError(
-                "cache_format must be one of 'feather' or 'pickle. "
+                "cache_format must be one of 'feather', 'pickle' or 'arrow'. "
                 f"Invalid format specified: {cache_format}",
             )
 
@@ -256,16 +421,23 @@ class OpenMLDataset(OpenMLBase):  # noqa: PLW1641
             self._qualities = _read_qualities(Path(qualities_file))
 
         if data_file is not None:
-            data_pickle, data_feather, feather_attribute = self._compressed_cache_file_paths(
-                Path(data_file)
+            data_pickle, data_feather, feather_attribute, data_arrow = (
+                self._compressed_cache_file_paths(Path(data_file))
             )
             self.data_pickle_file = data_pickle if Path(data_pickle).exists() else None
             self.data_feather_file = data_feather if Path(data_feather).exists() else None
             self.feather_attribute_file = feather_attribute if Path(feather_attribute) else None
+            self.data_arrow_file = data_arrow if Path(data_arrow).exists() else None
         else:
             self.data_pickle_file = None
             self.data_feather_file = None
             self.feather_attribute_file = None
+            self.data_arrow_file = None
+
+        # The data files must not be evicted from the cache while the dataset is in use
+        if data_file is not None or parquet_file is not None:
+            cache_dir = Path(str(parquet_file if data_file is None else data_file)).parent
+            openml.utils._pin_cache_dir(cache_dir, owner=self)
 
     @property
     def features(self) -> dict[int, OpenMLDataFeature]:
@@ -359,6 +531,7 @@ class OpenMLDataset(OpenMLBase):  # noqa: PLW1641
             "data_pickle_file",
             "data_feather_file",
             "feather_attribute_file",
+            "data_arrow_file",
             "parquet_file",
         }
 
@@ -381,6 +554,16 @@ class OpenMLDataset(OpenMLBase):  # noqa: PLW1641
             self.parquet_file = None if parquet_file is None else str(parquet_file)
         if self.parquet_file is None:
             self.data_file = str(_get_dataset_arff(self))
+        openml.utils._pin_cache_dir(self._get_downloaded_data_file().parent, owner=self)
+
+    def _get_downloaded_data_file(self) -> Path:
+        """Return the downloaded data file, which is downloaded again if it was evicted."""
+        data_file = self.data_file if self.parquet_file is None else self.parquet_file
+        if data_file is None or not Path(data_file).is_file():
+            self._download_data()
+            data_file = self.data_file if self.parquet_file is None else self.parquet_file
+        assert data_file is not None
+        return Path(data_file)
 
     def _get_arff(self, format: str) -> dict:  # noqa: A002
         """Read ARFF file and return decoded arff.
@@ -402,8 +585,6 @@ class OpenMLDataset(OpenMLBase):  # noqa: PLW1641
             Decoded arff.
 
         """
-        # TODO: add a partial read method which only returns the attribute
-        # headers of the corresponding .arff file!
         import struct
 
         filename = self.data_file
@@ -427,25 +608,37 @@ class OpenMLDataset(OpenMLBase):  # noqa: PLW1641
                     f"Please consider using a smaller dataset"
                 )
 
+        with self._decode_arff(format, stream=False) as decoded:
+            return decoded
+
+    @contextmanager
+    def _decode_arff(self, format: str, *, stream: bool) -> Iterator[dict]:  # noqa: A002
+        """Open the ARFF file referenced in self.data_file and decode it.
+
+        If ``stream`` is True, the header is decoded right away but ``data`` is a generator over
+        the decoded rows (lists for 'arff', dicts for 'sparse_arff') which reads the file lazily
+        and can only be consumed inside the context.
+        """
+        filename = self.data_file
+        assert filename is not None
+        filepath = Path(filename)
+
         if format.lower() == "arff":
-            return_type = arff.DENSE
+            return_type = arff.DENSE_GEN if stream else arff.DENSE
         elif format.lower() == "sparse_arff":
-            return_type = arff.COO
+            return_type = arff.LOD_GEN if stream else arff.COO
         else:
             raise ValueError(f"Unknown data format {format}")
 
-        def decode_arff(fh: Any) -> dict:
-            decoder = arff.ArffDecoder()
-            return decoder.decode(fh, encode_nominal=True, return_type=return_type)  # type: ignore
-
+        decoder = arff.ArffDecoder()
         if filepath.suffix.endswith(".gz"):
-            with gzip.open(filename) as zipfile:
-                return decode_arff(zipfile)
+            with gzip.open(filename, "rt", encoding="utf8") as zipfile:
+                yield decoder.decode(zipfile, encode_nominal=True, return_type=return_type)
         else:
             with filepath.open(encoding="utf8") as fh:
-                return decode_arff(fh)
+                yield decoder.decode(fh, encode_nominal=True, return_type=return_type)
 
-    def _parse_data_from_arff(  # noqa: C901, PLR0912, PLR0915
+    def _parse_data_from_arff(
         self,
         arff_file_path: Path,
     ) -> tuple[pd.DataFrame | scipy.sparse.csr_matrix, list[bool], list[str]]:
@@ -464,13 +657,23 @@ class OpenMLDataset(OpenMLBase):  # noqa: PLW1641
             List[str]: List of column names.
         """
         try:
-            data = self._get_arff(self.format)
+            with self._decode_arff(self.format, stream=True) as data:
+                return self._parse_decoded_arff(data)
         except OSError as e:
             logger.critical(
                 f"Please check that the data file {arff_file_path} is there and can be read.",
             )
             raise e
 
+    def _parse_decoded_arff(  # noqa: C901, PLR0912, PLR0915
+        self,
+        data: dict,
+    ) -> tuple[pd.DataFrame | scipy.sparse.csr_matrix, list[bool], list[str]]:
+        """Build the dataset from an ARFF file decoded with ``stream=True``.
+
+        The data section is consumed in chunks of rows, so the whole file is never held as
+        Python objects at once.
+        """
         ARFF_DTYPES_TO_PD_DTYPE = {
             "INTEGER": "integer",
             "REAL": "floating",
@@ -517,23 +720,26 @@ class OpenMLDataset(OpenMLBase):  # noqa: PLW1641
             attribute_names.append(name)
 
         if self.format.lower() == "sparse_arff":
-            X = data["data"]
-            X_shape = (max(X[1]) + 1, max(X[2]) + 1)
-            X = scipy.sparse.coo_matrix((X[0], (X[1], X[2])), shape=X_shape, dtype=np.float32)
+            values, row_indices, col_indices = _read_sparse_arff_coo(data["data"])
+            X_shape = (row_indices.max() + 1, col_indices.max() + 1)
+            X = scipy.sparse.coo_matrix(
+                (values, (row_indices, col_indices)), shape=X_shape, dtype=np.float32
+            )
             X = X.tocsr()
         elif self.format.lower() == "arff":
-            X = pd.DataFrame(data["data"], columns=attribute_names)
+            # Popped from the back, so the raw buffers are released column by column
+            columns = _read_dense_arff_columns(data["data"], data["attributes"])[::-1]
 
             col = []
-            for column_name in X.columns:
+            for column_name in attribute_names:
+                X_col = pd.Series(columns.pop(), name=column_name)
                 if attribute_dtype[column_name] in ("categorical", "boolean"):
                     categories = self._unpack_categories(
-                        X[column_name],  # type: ignore
+                        X_col,
                         categories_names[column_name],
                     )
                     col.append(categories)
                 elif attribute_dtype[column_name] in ("floating", "integer"):
-                    X_col = X[column_name]
                     if X_col.min() >= 0 and X_col.max() <= 255:
                         try:
                             X_col_uint = X_col.astype("uint8")
@@ -542,20 +748,21 @@ class OpenMLDataset(OpenMLBase):  # noqa: PLW1641
                                 continue
                         except ValueError:
                             pass
-                    col.append(X[column_name])
+                    col.append(X_col)
                 else:
-                    col.append(X[column_name])
+                    col.append(X_col)
             X = pd.concat(col, axis=1)
         else:
             raise ValueError(f"Dataset format '{self.format}' is not a valid format.")
 
         return X, categorical, attribute_names  # type: ignore
 
-    def _compressed_cache_file_paths(self, data_file: Path) -> tuple[Path, Path, Path]:
+    def _compressed_cache_file_paths(self, data_file: Path) -> tuple[Path, Path, Path, Path]:
         data_pickle_file = data_file.with_suffix(".pkl.py3")
         data_feather_file = data_file.with_suffix(".feather")
         feather_attribute_file = data_file.with_suffix(".feather.attributes.pkl.py3")
-        return data_pickle_file, data_feather_file, feather_attribute_file
+        data_arrow_file = data_file.with_suffix(".arrow")
+        return data_pickle_file, data_feather_file, feather_attribute_file, data_arrow_file
 
     def _cache_compressed_file_from_file(
         self,
@@ -570,11 +777,12 @@ class OpenMLDataset(OpenMLBase):  # noqa: PLW1641
             data_pickle_file,
             data_feather_file,
             feather_attribute_file,
+            data_arrow_file,
         ) = self._compressed_cache_file_paths(data_file)
 
         attribute_names, categorical, data = self._parse_data_from_file(data_file)
 
-        # Feather format does not work for sparse datasets, so we use pickle for sparse datasets
+        # Feather and arrow formats do not work for sparse datasets, so we use pickle for those
         if scipy.sparse.issparse(data):
             self.cache_format = "pickle"
 
@@ -588,12 +796,22 @@ class OpenMLDataset(OpenMLBase):  # noqa: PLW1641
             self.data_feather_file = data_feather_file
             self.feather_attribute_file = feather_attribute_file
 
+        elif self.cache_format == "arrow":
+            assert isinstance(data, pd.DataFrame)
+
+            _write_arrow_file(data, categorical, attribute_names, data_arrow_file)
+            self.data_arrow_file = data_arrow_file
+
         else:
             with open(data_pickle_file, "wb") as fh:  # noqa: PTH123
                 pickle.dump((data, categorical, attribute_names), fh, pickle.HIGHEST_PROTOCOL)
             self.data_pickle_file = data_pickle_file
 
-        data_file = data_pickle_file if self.cache_format == "pickle" else data_feather_file
+        data_file = {
+            "pickle": data_pickle_file,
+            "feather": data_feather_file,
+            "arrow": data_arrow_file,
+        }[self.cache_format]
         logger.debug(f"Saved dataset {int(self.dataset_id or -1)}: {self.name} to file {data_file}")
 
         return data, categorical, attribute_names
@@ -601,51 +819,92 @@ class OpenMLDataset(OpenMLBase):  # noqa: PLW1641
     def _parse_data_from_file(
         self,
         data_file: Path,
+        columns: Sequence[str] | None = None,
     ) -> tuple[list[str], list[bool], pd.DataFrame | scipy.sparse.csr_matrix]:
         if data_file.suffix == ".arff":
             data, categorical, attribute_names = self._parse_data_from_arff(data_file)
         elif data_file.suffix == ".pq":
-            attribute_names, categorical, data = self._parse_data_from_pq(data_file)
+            attribute_names, categorical, data = self._parse_data_from_pq(data_file, columns)
         else:
             raise ValueError(f"Unknown file type for file '{data_file}'.")
 
         return attribute_names, categorical, data
 
-    def _parse_data_from_pq(self, data_file: Path) -> tuple[list[str], list[bool], pd.DataFrame]:
+    def _parse_data_from_pq(
+        self,
+        data_file: Path,
+        columns: Sequence[str] | None = None,
+    ) -> tuple[list[str], list[bool], pd.DataFrame]:
         try:
-            data = pd.read_parquet(data_file)
+            data = pd.read_parquet(data_file, columns=columns)
         except Exception as e:
             raise Exception(f"File: {data_file}") from e
         categorical = [data[c].dtype.name == "category" for c in data.columns]
         attribute_names = list(data.columns)
         return attribute_names, categorical, data
 
-    def _load_data(self) -> tuple[pd.DataFrame, list[bool], list[str]]:  # noqa: PLR0912, C901, PLR0915
-        """Load data from compressed format or arff. Download data if not present on disk."""
-        need_to_create_pickle = self.cache_format == "pickle" and self.data_pickle_file is None
-        need_to_create_feather = self.cache_format == "feather" and self.data_feather_file is None
-
-        if need_to_create_pickle or need_to_create_feather:
-            if self.data_file is None:
-                self._download_data()
+    def _load_data(  # noqa: PLR0912, C901, PLR0915
+        self,
+        columns: Sequence[str] | None = None,
+        exclude: Iterable[str] = (),
+        rows: Sequence[int] | np.ndarray | None = None,
+    ) -> tuple[pd.DataFrame, list[bool], list[str]]:
+        """Load data from compressed format or arff. Download data if not present on disk.
 
-            file_to_load = self.data_file if self.parquet_file is None else self.parquet_file
-            assert file_to_load is not None
-            data, cats, attrs = self._cache_compressed_file_from_file(Path(file_to_load))
-            return _ensure_dataframe(data, attrs), cats, attrs
+        Parameters
+        ----------
+        columns : Sequence[str], optional
+            Names of the columns to load, in the order they should be returned.
+            If None, all columns are loaded.
+        exclude : Iterable[str]
+            Names of columns which should not be loaded.
+        rows : Sequence[int] or np.ndarray, optional
+            Positional indices of the rows to load. If None, all rows are loaded.
+
+        The feather and arrow caches only ever read the selected columns from disk.
+        """
+        # The cache files may also have been evicted from the cache since they were created
+        cache_files = {
+            "pickle": [self.data_pickle_file],
+            "feather": [self.data_feather_file, self.feather_attribute_file],
+            "arrow": [self.data_arrow_file],
+        }[self.cache_format]
+        if any(file is None or not Path(file).is_file() for file in cache_files):
+            file_to_load = self._get_downloaded_data_file()
+            data, cats, attrs = self._cache_compressed_file_from_file(file_to_load)
+            openml.utils._evict_data_files(Path(file_to_load).parent)
+            data = _ensure_dataframe(data, attrs)
+            attrs, cats = _select_columns(attrs, cats, columns, exclude)
+            return _subset_data(data, attrs, rows), cats, attrs
 
         # helper variable to help identify where errors occur
-        fpath = self.data_feather_file if self.cache_format == "feather" else self.data_pickle_file
+        fpath = {
+            "pickle": self.data_pickle_file,
+            "feather": self.data_feather_file,
+            "arrow": self.data_arrow_file,
+        }[self.cache_format]
         logger.info(f"{self.cache_format} load data {self.name}")
+        assert fpath is not None
+        openml.utils._mark_cache_dir_used(Path(fpath).parent)
         try:
+            if self.cache_format == "arrow":
+                assert self.data_arrow_file is not None
+                data, categorical, attribute_names = _read_arrow_file(
+                    self.data_arrow_file, columns, exclude, rows
+                )
+                return data, categorical, attribute_names
             if self.cache_format == "feather":
                 assert self.data_feather_file is not None
                 assert self.feather_attribute_file is not None
 
-                data = pd.read_feather(self.data_feather_file)
                 fpath = self.feather_attribute_file
                 with self.feather_attribute_file.open("rb") as fh:
                     categorical, attribute_names = pickle.load(fh)  # noqa: S301
+                attribute_names, categorical = _select_columns(
+                    attribute_names, categorical, columns, exclude
+                )
+                fpath = self.data_feather_file
+                data = pd.read_feather(self.data_feather_file, columns=attribute_names)
             else:
                 assert self.data_pickle_file is not None
                 with self.data_pickle_file.open("rb") as fh:
@@ -659,7 +918,7 @@ class OpenMLDataset(OpenMLBase):  # noqa: PLW1641
             error_message = getattr(e, "message", e.args[0])
             hint = ""
 
-            if isinstance(e, EOFError):
+            if isinstance(e, (EOFError, pa.ArrowInvalid)):
                 readable_error = "Detected a corrupt cache file"
             elif isinstance(e, (ModuleNotFoundError, AttributeError)):
                 readable_error = "Detected likely dependency issues"
@@ -686,20 +945,26 @@ class OpenMLDataset(OpenMLBase):  # noqa: PLW1641
                 "Please manually delete the cache file if you want OpenML-Python "
                 "to attempt to reconstruct it.",
             )
-            file_to_load = self.data_file if self.parquet_file is None else self.parquet_file
-            assert file_to_load is not None
-            attr, cat, df = self._parse_data_from_file(Path(file_to_load))
-            return _ensure_dataframe(df), cat, attr
+            file_to_load = self._get_downloaded_data_file()
+            attr, cat, df = self._parse_data_from_file(file_to_load, columns)
+            df = _ensure_dataframe(df, attr)
+            attrs, cats = _select_columns(attr, cat, columns, exclude)
+            return _subset_data(df, attrs, rows), cats, attrs
 
         data_up_to_date = isinstance(data, pd.DataFrame) or scipy.sparse.issparse(data)
         if self.cache_format == "pickle" and not data_up_to_date:
             logger.info("Updating outdated pickle file.")
-            file_to_load = self.data_file if self.parquet_file is None else self.parquet_file
-            assert file_to_load is not None
-
-            data, cats, attrs = self._cache_compressed_file_from_file(Path(file_to_load))
+            data, categorical, attribute_names = self._cache_compressed_file_from_file(
+                self._get_downloaded_data_file()
+            )
 
-        return _ensure_dataframe(data, attribute_names), categorical, attribute_names
+        data = _ensure_dataframe(data, attribute_names)
+        if self.cache_format == "pickle":
+            # Unlike feather, the pickle cache can only be read as a whole
+            attribute_names, categorical = _select_columns(
+                attribute_names, categorical, columns, exclude
+            )
+        return _subset_data(data, attribute_names, rows), categorical, attribute_names
 
     @staticmethod
     def _unpack_categories(series: pd.Series, categories: list) -> pd.Series:
@@ -707,24 +972,30 @@ class OpenMLDataset(OpenMLBase):  # noqa: PLW1641
         def valid_category(cat: Any) -> bool:
             return isinstance(cat, str) or (cat is not None and not np.isnan(cat))
 
-        filtered_categories = [c for c in categories if valid_category(c)]
-        col = []
-        for x in series:
-            try:
-                col.append(categories[int(x)])
-            except (TypeError, ValueError):
-                col.append(np.nan)
+        is_valid = np.array([valid_category(c) for c in categories], dtype=bool)
+        filtered_categories = [c for c, valid in zip(categories, is_valid, strict=True) if valid]
 
-        # We require two lines to create a series of categories as detailed here:
-        # https://pandas.pydata.org/pandas-docs/version/0.24/user_guide/categorical.html#series-creation
-        raw_cat = pd.Categorical(col, ordered=True, categories=filtered_categories)
+        # Map each position in `categories` to its position in `filtered_categories`,
+        # nan-like categories are decoded as missing values (code -1).
+        recode = np.full(len(categories), -1, dtype=np.int64)
+        recode[is_valid] = np.arange(len(filtered_categories))
+
+        values = pd.to_numeric(series, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+        present = ~np.isnan(values)
+        codes = np.full(len(values), -1, dtype=np.int64)
+        codes[present] = recode[values[present].astype(np.int64)]
+
+        raw_cat = pd.Categorical.from_codes(codes, categories=filtered_categories, ordered=True)
         return pd.Series(raw_cat, index=series.index, name=series.name)
 
-    def get_data(  # noqa: C901
+    def get_data(  # noqa: C901, PLR0912
         self,
         target: list[str] | str | None = None,
         include_row_id: bool = False,  # noqa: FBT002
         include_ignore_attribute: bool = False,  # noqa: FBT002
+        *,
+        columns: Sequence[str] | None = None,
+        rows: Sequence[int] | np.ndarray | None = None,
     ) -> tuple[pd.DataFrame, pd.Series | None, list[bool], list[str]]:
         """Returns dataset content as dataframes.
 
@@ -738,6 +1009,12 @@ class OpenMLDataset(OpenMLBase):  # noqa: PLW1641
         include_ignore_attribute : boolean (default=False)
             Whether to include columns that are marked as "ignore"
             on the server in the dataset.
+        columns : Sequence[str], optional (default=None)
+            Names of the columns to return, in this order. The target is loaded in addition.
+            If None, all columns are returned.
+            With the feather and arrow cache formats, only these columns are read from disk.
+        rows : Sequence[int] or np.ndarray, optional (default=None)
+            Positional indices of the rows to return. If None, all rows are returned.
 
 
         Returns
@@ -751,8 +1028,6 @@ class OpenMLDataset(OpenMLBase):  # noqa: PLW1641
         attribute_names : list[str]
             List of attribute names.
         """
-        data, categorical_mask, attribute_names = self._load_data()
-
         to_exclude = []
         if not include_row_id and self.row_id_attribute is not None:
             if isinstance(self.row_id_attribute, str):
@@ -768,15 +1043,10 @@ class OpenMLDataset(OpenMLBase):  # noqa: PLW1641
 
         if len(to_exclude) > 0:
             logger.info(f"Going to remove the following attributes: {to_exclude}")
-            keep = np.array([column not in to_exclude for column in attribute_names])
-            data = data.drop(columns=to_exclude)
-            categorical_mask = [cat for cat, k in zip(categorical_mask, keep, strict=False) if k]
-            attribute_names = [att for att, k in zip(attribute_names, keep, strict=False) if k]
 
         if target is None:
-            return data, None, categorical_mask, attribute_names
-
-        if isinstance(target, str):
+            target_names = []
+        elif isinstance(target, str):
             target_names = target.split(",") if "," in target else [target]
         else:
             target_names = target
@@ -791,8 +1061,28 @@ class OpenMLDataset(OpenMLBase):  # noqa: PLW1641
                 f"Please select a single target column."
             )
 
+        if columns is not None:
+            columns = [*columns, *(name for name in target_names if name not in columns)]
+
+        # Excluded attributes (and unrequested columns) are never loaded, so no full copy of the
+        # data has to be made to drop them afterwards.
+        data, categorical_mask, attribute_names = self._load_data(
+            columns=columns,
+            exclude=to_exclude,
+            rows=rows,
+        )
+
+        if target is None:
+            return data, None, categorical_mask, attribute_names
+
         target_name = target_names[0]
-        x = data.drop(columns=[target_name])
+        # Unlike `data.drop`, this keeps the remaining columns as views on `data` (and thus on the
+        # memory-mapped arrow cache) instead of copying the whole frame.
+        x_names = [name for name in data.columns if name != target_name]
+        if x_names:
+            x = pd.DataFrame({name: data[name] for name in x_names}, copy=False)
+        else:
+            x = pd.DataFrame(index=data.index)
         y = data[target_name].squeeze()
 
         # Finally, remove the target from the list of attributes and categorical mask
@@ -1052,6 +1342,12 @@ def _read_qualities(qualities_file: str | Path) -> dict[str, float]:
     qualities_file = Path(qualities_file)
     qualities_pickle_file = Path(_get_qualities_pickle_file(str(qualities_file)))
     try:
+        if (
+            qualities_file.exists()
+            and qualities_file.stat().st_mtime > qualities_pickle_file.stat().st_mtime
+        ):
+            # The qualities were downloaded or revalidated after the pickle was written
+            raise FileNotFoundError(qualities_pickle_file)
         with qualities_pickle_file.open("rb") as fh_binary:
             return pickle.load(fh_binary)  # type: ignore  # noqa: S301
     except:  # noqa: E722
@@ -9,7 +9,7 @@ from collections import OrderedDict
 from functools import partial
 from pathlib import Path
 from pyexpat import ExpatError
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Literal, overload
 
 import arff
 import minio.error
@@ -20,6 +20,7 @@ import xmltodict
 from scipy.sparse import coo_matrix
 
 import openml._api_calls
+import openml._cache_index
 import openml.utils
 from openml.config import OPENML_SKIP_PARQUET_ENV_VAR
 from openml.exceptions import (
@@ -34,9 +35,12 @@ from openml.utils import (
     _remove_cache_dir_for_id,
 )
 
-from .dataset import OpenMLDataset
+from .dataset import OpenMLDataset, _parse_features_xml, _parse_qualities_xml
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from concurrent.futures import Executor
+
     import scipy
 
 DATASETS_CACHE_DIR_NAME = "datasets"
@@ -89,6 +93,8 @@ def list_datasets(
     number_features: int | str | None = None,
     number_classes: int | str | None = None,
     number_missing_values: int | str | None = None,
+    *,
+    force_refresh_cache: bool = False,
 ) -> pd.DataFrame:
     """Return a dataframe of all dataset which are on OpenML.
 
@@ -114,6 +120,9 @@ def list_datasets(
     number_features : int | str, optional
     number_classes : int | str, optional
     number_missing_values : int | str, optional
+    force_refresh_cache : bool (default=False)
+        If True, cached listings are ignored and replaced by the response of the server.
+        Listings are only cached if ``openml.config.listing_cache_ttl`` is set.
 
     Returns
     -------
@@ -127,6 +136,67 @@ def list_datasets(
         If qualities are calculated for the dataset, some of
         these are also included as columns.
     """
+    batches = list(
+        iter_datasets(
+            data_id=data_id,
+            offset=offset,
+            size=size,
+            status=status,
+            tag=tag,
+            data_name=data_name,
+            data_version=data_version,
+            number_instances=number_instances,
+            number_features=number_features,
+            number_classes=number_classes,
+            number_missing_values=number_missing_values,
+            force_refresh_cache=force_refresh_cache,
+        ),
+    )
+    if len(batches) == 0:
+        return pd.DataFrame()
+
+    return pd.concat(batches)
+
+
+def iter_datasets(
+    *,
+    data_id: list[int] | None = None,
+    offset: int | None = None,
+    size: int | None = None,
+    status: str | None = None,
+    tag: str | None = None,
+    data_name: str | None = None,
+    data_version: int | None = None,
+    number_instances: int | str | None = None,
+    number_features: int | str | None = None,
+    number_classes: int | str | None = None,
+    number_missing_values: int | str | None = None,
+    force_refresh_cache: bool = False,
+    batch_size: int = 10_000,
+) -> Iterator[pd.DataFrame]:
+    """Iterate over the datasets on OpenML, one page of at most ``batch_size`` at a time.
+
+    Takes the same filters as :func:`list_datasets` (as keyword arguments), but yields every
+    page as soon as it has been received instead of returning all of them at once. Pages are
+    only requested while the iteration goes on.
+
+    Parameters
+    ----------
+    force_refresh_cache : bool (default=False)
+        If True, cached listings are ignored, see :func:`list_datasets`.
+    batch_size : int, optional (default=10000)
+        The number of datasets per page.
+
+    Yields
+    ------
+    datasets: dataframe
+        The datasets of one page, with the same columns as returned by :func:`list_datasets`.
+
+    Examples
+    --------
+    >>> for page in openml.datasets.iter_datasets(status="active"):  # doctest: +SKIP
+    ...     large = page[page["NumberOfInstances"] > 1_000_000]
+    """
     listing_call = partial(
         _list_datasets,
         data_id=data_id,
@@ -138,12 +208,15 @@ def list_datasets(
         number_features=number_features,
         number_classes=number_classes,
         number_missing_values=number_missing_values,
+        force_refresh_cache=force_refresh_cache,
+    )
+    # Not a generator itself, so invalid arguments are reported when it is called
+    return openml.utils._iter_all(
+        listing_call,
+        offset=offset,
+        limit=size,
+        batch_size=batch_size,
     )
-    batches = openml.utils._list_all(listing_call, offset=offset, limit=size)
-    if len(batches) == 0:
-        return pd.DataFrame()
-
-    return pd.concat(batches)
 
 
 def _list_datasets(
@@ -151,6 +224,7 @@ def _list_datasets(
     offset: int,
     *,
     data_id: list[int] | None = None,
+    force_refresh_cache: bool = False,
     **kwargs: Any,
 ) -> pd.DataFrame:
     """
@@ -169,6 +243,9 @@ def _list_datasets(
         The number of datasets to skip, starting from the first.
     data_id : list, optional
 
+    force_refresh_cache : bool (default=False)
+        If True, a cached response of the call is ignored.
+
     kwargs : dict, optional
         Legal filter operators (keys in the dict):
         tag, status, limit, offset, data_name, data_version, number_instances,
@@ -191,39 +268,33 @@ def _list_datasets(
                 api_call += f"/{operator}/{value}"
     if data_id is not None:
         api_call += f"/data_id/{','.join([str(int(i)) for i in data_id])}"
-    return __list_datasets(api_call=api_call)
-
+    return __list_datasets(api_call=api_call, force_refresh_cache=force_refresh_cache)
 
-def __list_datasets(api_call: str) -> pd.DataFrame:
-    xml_string = openml._api_calls._perform_api_call(api_call, "get")
-    datasets_dict = xmltodict.parse(xml_string, force_list=("oml:dataset",))
 
-    # Minimalistic check if the XML is useful
-    assert isinstance(datasets_dict["oml:data"]["oml:dataset"], list), type(
-        datasets_dict["oml:data"],
+def __list_datasets(api_call: str, *, force_refresh_cache: bool = False) -> pd.DataFrame:
+    response = openml._api_calls._perform_read_call(
+        api_call,
+        force_refresh_cache=force_refresh_cache,
     )
-    assert datasets_dict["oml:data"]["@xmlns:oml"] == "http://openml.org/openml", datasets_dict[
-        "oml:data"
-    ]["@xmlns:oml"]
-
-    datasets = {}
-    for dataset_ in datasets_dict["oml:data"]["oml:dataset"]:
-        ignore_attribute = ["oml:file_id", "oml:quality"]
-        dataset = {
-            k.replace("oml:", ""): v for (k, v) in dataset_.items() if k not in ignore_attribute
-        }
-        dataset["did"] = int(dataset["did"])
-        dataset["version"] = int(dataset["version"])
-
+    datasets = openml.utils._ListingColumns()
+    qualities: set[str] = set()
+    records = openml.utils._iter_listing_records(response, "data", "dataset", nested=("quality",))
+    for dataset_ in records:
         # The number of qualities can range from 0 to infinity
-        for quality in dataset_.get("oml:quality", []):
-            try:
-                dataset[quality["@name"]] = int(quality["#text"])
-            except ValueError:
-                dataset[quality["@name"]] = float(quality["#text"])
-        datasets[dataset["did"]] = dataset
+        dataset_qualities = [
+            (quality["name"], quality["value"]) for quality in dataset_.pop("quality", [])
+        ]
+        dataset_.pop("file_id", None)
+        qualities.update(quality for quality, _ in dataset_qualities)
+        datasets.add_row([*dataset_.items(), *dataset_qualities])
+
+    if datasets.n_rows == 0:
+        return pd.DataFrame()
 
-    return pd.DataFrame.from_dict(datasets, orient="index").astype(
+    return datasets.to_frame(
+        index="did",
+        converters=dict.fromkeys([*qualities, "did", "version"], pd.to_numeric),
+    ).astype(
         {
             "did": int,
             "version": int,
@@ -338,11 +409,39 @@ def _name_to_id(
     return candidates["did"].min()  # type: ignore
 
 
+@overload
+def get_datasets(
+    dataset_ids: list[str | int],
+    download_data: bool = ...,
+    download_qualities: bool = ...,
+    *,
+    max_workers: int | None = ...,
+    executor: Executor | None = ...,
+    return_exceptions: Literal[False] = ...,
+) -> list[OpenMLDataset]: ...
+
+
+@overload
+def get_datasets(
+    dataset_ids: list[str | int],
+    download_data: bool = ...,
+    download_qualities: bool = ...,
+    *,
+    max_workers: int | None = ...,
+    executor: Executor | None = ...,
+    return_exceptions: Literal[True],
+) -> list[OpenMLDataset | Exception]: ...
+
+
 def get_datasets(
     dataset_ids: list[str | int],
     download_data: bool = False,  # noqa: FBT002
     download_qualities: bool = False,  # noqa: FBT002
-) -> list[OpenMLDataset]:
+    *,
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+    return_exceptions: bool = False,
+) -> list[OpenMLDataset] | list[OpenMLDataset | Exception]:
     """Download datasets.
 
     This function iterates :meth:`openml.datasets.get_dataset`.
@@ -359,27 +458,36 @@ def get_datasets(
         The data may later be retrieved through the `OpenMLDataset.get_data` method.
     download_qualities : bool, optional (default=True)
         If True, also download qualities.xml file. If False it skip the qualities.xml.
+    max_workers : int, optional (default=None)
+        Number of threads used to download the datasets concurrently.
+        If None (and no ``executor`` is given), the datasets are downloaded one after another.
+    executor : concurrent.futures.Executor, optional (default=None)
+        Executor to submit the downloads to, instead of creating a thread pool.
+    return_exceptions : bool (default=False)
+        If True, an exception raised for a dataset is returned in its place in the result
+        list instead of aborting the whole batch.
 
     Returns
     -------
     datasets : list of datasets
-        A list of dataset objects.
+        A list of dataset objects, in the order of ``dataset_ids``.
     """
-    datasets = []
-    for dataset_id in dataset_ids:
-        datasets.append(
-            get_dataset(dataset_id, download_data, download_qualities=download_qualities),
-        )
-    return datasets
+    return openml.utils._map_ids(  # type: ignore
+        partial(get_dataset, download_data=download_data, download_qualities=download_qualities),
+        dataset_ids,
+        max_workers=max_workers,
+        executor=executor,
+        return_exceptions=return_exceptions,
+    )
 
 
 @openml.utils.thread_safe_if_oslo_installed
-def get_dataset(  # noqa: C901, PLR0912
+def get_dataset(  # noqa: C901, PLR0912, PLR0915
     dataset_id: int | str,
     download_data: bool = False,  # noqa: FBT002
     version: int | None = None,
     error_if_multiple: bool = False,  # noqa: FBT002
-    cache_format: Literal["pickle", "feather"] = "pickle",
+    cache_format: Literal["pickle", "feather", "arrow"] = "pickle",
     download_qualities: bool = False,  # noqa: FBT002
     download_features_meta_data: bool = False,  # noqa: FBT002
     download_all_files: bool = False,  # noqa: FBT002
@@ -391,8 +499,8 @@ def get_dataset(  # noqa: C901, PLR0912
     A check will be performed to determine if the information has previously been downloaded to a
     cache, and if so be loaded from disk instead of retrieved from the server.
 
-    To make this function thread safe, you can install the python package ``oslo.concurrency``.
-    If ``oslo.concurrency`` is installed `get_dataset` becomes thread safe.
+    `get_dataset` is thread safe: concurrent calls for the same dataset are serialized.
+    To make it safe across processes as well, install the python package ``oslo.concurrency``.
 
     Alternatively, to make this function thread/multiprocessing safe initialize the cache first by
     calling `get_dataset(args)` once before calling `get_dataset(args)` many times in parallel.
@@ -419,10 +527,12 @@ def get_dataset(  # noqa: C901, PLR0912
         If no version is specified, retrieve the least recent still active version.
     error_if_multiple : bool (default=False)
         If ``True`` raise an error if multiple datasets are found with matching criteria.
-    cache_format : str (default='pickle') in {'pickle', 'feather'}
-        Format for caching the dataset - may be feather or pickle
+    cache_format : str (default='pickle') in {'pickle', 'feather', 'arrow'}
+        Format for caching the dataset - may be feather, pickle or arrow
         Note that the default 'pickle' option may load slower than feather when
         no.of.rows is very high.
+        With 'arrow' the cache file is memory-mapped, so processes loading the same dataset
+        share its numeric columns through the page cache instead of each holding a copy.
     download_qualities : bool (default=False)
         Option to download 'qualities' meta-data in addition to the minimal dataset description.
         If True, download and cache the qualities file.
@@ -454,9 +564,9 @@ def get_dataset(  # noqa: C901, PLR0912
             stacklevel=2,
         )
 
-    if cache_format not in ["feather", "pickle"]:
+    if cache_format not in ["feather", "pickle", "arrow"]:
         raise ValueError(
-            "cache_format must be one of 'feather' or 'pickle. "
+            "cache_format must be one of 'feather', 'pickle' or 'arrow'. "
             f"Invalid format specified: {cache_format}",
         )
 
@@ -521,7 +631,7 @@ def get_dataset(  # noqa: C901, PLR0912
         if remove_dataset_cache:
             _remove_cache_dir_for_id(DATASETS_CACHE_DIR_NAME, did_cache_dir)
 
-    return _create_dataset_from_description(
+    dataset = _create_dataset_from_description(
         description,
         features_file,
         qualities_file,
@@ -529,6 +639,10 @@ def get_dataset(  # noqa: C901, PLR0912
         parquet_file,
         cache_format,
     )
+    if arff_file is not None or parquet_file is not None:
+        openml.utils._mark_cache_dir_used(did_cache_dir)
+        openml.utils._evict_data_files(did_cache_dir)
+    return dataset
 
 
 def attributes_arff_from_df(df: pd.DataFrame) -> list[tuple[str, list[str] | str]]:
@@ -1088,16 +1202,19 @@ def _get_dataset_description(did_cache_dir: Path, dataset_id: int) -> dict[str,
         XML Dataset description parsed to a dict.
 
     """
-    # TODO implement a cache for this that invalidates itself after some time
-    # This can be saved on disk, but cannot be cached properly, because
-    # it contains the information on whether a dataset is active.
+    # The description contains the information on whether a dataset is active, so it is
+    # revalidated with the server once it is older than `config.metadata_revalidate_after`
     description_file = did_cache_dir / "description.xml"
+    is_downloaded = openml._api_calls._is_due_for_revalidation(description_file)
+    if is_downloaded:
+        openml._api_calls._download_revalidated(f"data/{dataset_id}", description_file)
 
     try:
         with description_file.open(encoding="utf8") as fh:
             dataset_xml = fh.read()
         description = xmltodict.parse(dataset_xml)["oml:data_set_description"]
     except Exception:  # noqa: BLE001
+        is_downloaded = True
         url_extension = f"data/{dataset_id}"
         dataset_xml = openml._api_calls._perform_api_call(url_extension, "get")
         try:
@@ -1109,6 +1226,8 @@ def _get_dataset_description(did_cache_dir: Path, dataset_id: int) -> dict[str,
         with description_file.open("w", encoding="utf8") as fh:
             fh.write(dataset_xml)
 
+    if is_downloaded:
+        openml._cache_index._index_dataset_description(description)
     return description  # type: ignore
 
 
@@ -1280,6 +1399,7 @@ def _get_dataset_features_file(did_cache_dir: str | Path | None, dataset_id: int
         features_xml = _get_features_xml(dataset_id)
         with features_file.open("w", encoding="utf8") as fh:
             fh.write(features_xml)
+        openml._cache_index._index_dataset_features(dataset_id, _parse_features_xml(features_xml))
 
     return features_file
 
@@ -1319,12 +1439,17 @@ def _get_dataset_qualities_file(
         else Path(did_cache_dir)
     )
 
-    # Dataset qualities are subject to change and must be fetched every time
+    # Dataset qualities are subject to change, so they are revalidated with the server once
+    # they are older than `config.metadata_revalidate_after`
     qualities_file = save_did_cache_dir / "qualities.xml"
+    is_downloaded = openml._api_calls._is_due_for_revalidation(qualities_file)
+    if is_downloaded:
+        openml._api_calls._download_revalidated(f"data/qualities/{dataset_id}", qualities_file)
     try:
         with qualities_file.open(encoding="utf8") as fh:
             qualities_xml = fh.read()
     except OSError:
+        is_downloaded = True
         try:
             qualities_xml = _get_qualities_xml(dataset_id)
             with qualities_file.open("w", encoding="utf8") as fh:
@@ -1337,6 +1462,9 @@ def _get_dataset_qualities_file(
 
             raise e
 
+    if is_downloaded:
+        qualities = _parse_qualities_xml(qualities_xml)
+        openml._cache_index._index_dataset_qualities(dataset_id, qualities)
     return qualities_file
 
 
@@ -1346,7 +1474,7 @@ def _create_dataset_from_description(
     qualities_file: Path | None = None,
     arff_file: Path | None = None,
     parquet_file: Path | None = None,
-    cache_format: Literal["pickle", "feather"] = "pickle",
+    cache_format: Literal["pickle", "feather", "arrow"] = "pickle",
 ) -> OpenMLDataset:
     """Create a dataset object from a description dict.
 
@@ -1363,7 +1491,7 @@ def _create_dataset_from_description(
     parquet_file : string, optional
         Path of dataset Parquet file.
     cache_format: string, optional
-        Caching option for datasets (feather/pickle)
+        Caching option for datasets (feather/pickle/arrow)
 
     Returns
     -------
@@ -1,10 +1,16 @@
 # License: BSD 3-Clause
 
 from .evaluation import OpenMLEvaluation
-from .functions import list_evaluation_measures, list_evaluations, list_evaluations_setups
+from .functions import (
+    iter_evaluations,
+    list_evaluation_measures,
+    list_evaluations,
+    list_evaluations_setups,
+)
 
 __all__ = [
     "OpenMLEvaluation",
+    "iter_evaluations",
     "list_evaluation_measures",
     "list_evaluations",
     "list_evaluations_setups",
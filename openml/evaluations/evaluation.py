@@ -38,8 +38,8 @@ class OpenMLEvaluation:
         The time of evaluation.
     uploader: int
         Uploader ID (user ID)
-    upload_name : str
-        Name of the uploader of this evaluation
+    upload_name : str or None
+        Name of the uploader of this evaluation, None if it was not resolved
     value : float
         The value (score) of this evaluation.
     values : List[float]
@@ -59,7 +59,7 @@ class OpenMLEvaluation:
     function: str
     upload_time: str
     uploader: int
-    uploader_name: str
+    uploader_name: str | None
     value: float | None
     values: list[float] | None
     array_data: str | None = None
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import json
+import threading
 from functools import partial
 from itertools import chain
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 from typing_extensions import overload
 
 import numpy as np
@@ -17,6 +18,13 @@ import openml._api_calls
 import openml.utils
 from openml.evaluations import OpenMLEvaluation
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+# User names of uploaders per server, filled by ``_get_uploader_names``
+_uploader_names: dict[str, dict[str, str]] = {}
+_uploader_names_lock = threading.Lock()
+
 
 @overload
 def list_evaluations(
@@ -33,6 +41,9 @@ def list_evaluations(
     per_fold: bool | None = None,
     sort_order: str | None = None,
     output_format: Literal["dataframe"] = ...,
+    *,
+    resolve_uploader_names: bool = True,
+    force_refresh_cache: bool = False,
 ) -> pd.DataFrame: ...
 
 
@@ -51,6 +62,9 @@ def list_evaluations(
     per_fold: bool | None = None,
     sort_order: str | None = None,
     output_format: Literal["object"] = "object",
+    *,
+    resolve_uploader_names: bool = True,
+    force_refresh_cache: bool = False,
 ) -> dict[int, OpenMLEvaluation]: ...
 
 
@@ -68,6 +82,9 @@ def list_evaluations(
     per_fold: bool | None = None,
     sort_order: str | None = None,
     output_format: Literal["object", "dataframe"] = "object",
+    *,
+    resolve_uploader_names: bool = True,
+    force_refresh_cache: bool = False,
 ) -> dict[int, OpenMLEvaluation] | pd.DataFrame:
     """List all run-evaluation pairs matching all of the given filters.
 
@@ -108,6 +125,14 @@ def list_evaluations(
         - If 'object' the output is a dict of OpenMLEvaluation objects
         - If 'dataframe' the output is a pandas DataFrame
 
+    resolve_uploader_names : bool, optional (default=True)
+        Whether to look up the user name of every uploader. If False, ``uploader_name``
+        is None and no requests are made for it. User names are cached per server for
+        the lifetime of the process, so only uploaders not seen before are looked up.
+    force_refresh_cache : bool (default=False)
+        If True, cached listings are ignored and replaced by the response of the server.
+        Listings are only cached if ``openml.config.listing_cache_ttl`` is set.
+
     Returns
     -------
     dict or dataframe
@@ -115,12 +140,7 @@ def list_evaluations(
     if output_format not in ("dataframe", "object"):
         raise ValueError("Invalid output format. Only 'object', 'dataframe'.")
 
-    per_fold_str = None
-    if per_fold is not None:
-        per_fold_str = str(per_fold).lower()
-
-    listing_call = partial(
-        _list_evaluations,
+    listing_call = _evaluations_listing_call(
         function=function,
         tasks=tasks,
         setups=setups,
@@ -129,8 +149,10 @@ def list_evaluations(
         uploaders=uploaders,
         tag=tag,
         study=study,
+        per_fold=per_fold,
         sort_order=sort_order,
-        per_fold=per_fold_str,
+        resolve_uploader_names=resolve_uploader_names,
+        force_refresh_cache=force_refresh_cache,
     )
     eval_collection = openml.utils._list_all(listing_call, offset=offset, limit=size)
 
@@ -142,6 +164,107 @@ def list_evaluations(
     return {e.run_id: e for e in flattened}
 
 
+def iter_evaluations(
+    function: str,
+    *,
+    offset: int | None = None,
+    size: int | None = None,
+    tasks: list[str | int] | None = None,
+    setups: list[str | int] | None = None,
+    flows: list[str | int] | None = None,
+    runs: list[str | int] | None = None,
+    uploaders: list[str | int] | None = None,
+    tag: str | None = None,
+    study: int | None = None,
+    per_fold: bool | None = None,
+    sort_order: str | None = None,
+    resolve_uploader_names: bool = True,
+    force_refresh_cache: bool = False,
+    batch_size: int = 10_000,
+) -> Iterator[pd.DataFrame]:
+    """Iterate over the run-evaluation pairs matching all of the given filters, page by page.
+
+    Takes the same filters as :func:`list_evaluations` (as keyword arguments), but yields every
+    page as soon as it has been received instead of returning all of them at once. Pages are
+    only requested while the iteration goes on.
+
+    Parameters
+    ----------
+    function : str
+        the evaluation function. e.g., predictive_accuracy
+    resolve_uploader_names : bool, optional (default=True)
+        Whether to look up the user name of every uploader, see :func:`list_evaluations`.
+    force_refresh_cache : bool (default=False)
+        If True, cached listings are ignored, see :func:`list_evaluations`.
+    batch_size : int, optional (default=10000)
+        The number of evaluations per page.
+
+    Yields
+    ------
+    dataframe
+        The evaluations of one page, with the same columns as returned by
+        ``list_evaluations(..., output_format="dataframe")``.
+    """
+    listing_call = _evaluations_listing_call(
+        function=function,
+        tasks=tasks,
+        setups=setups,
+        flows=flows,
+        runs=runs,
+        uploaders=uploaders,
+        tag=tag,
+        study=study,
+        per_fold=per_fold,
+        sort_order=sort_order,
+        resolve_uploader_names=resolve_uploader_names,
+        force_refresh_cache=force_refresh_cache,
+    )
+    # Not a generator itself, so invalid arguments are reported when it is called
+    pages = openml.utils._iter_all(
+        listing_call,
+        offset=offset,
+        limit=size,
+        batch_size=batch_size,
+    )
+    return (pd.DataFrame.from_records([item._to_dict() for item in page]) for page in pages)
+
+
+def _evaluations_listing_call(
+    *,
+    function: str,
+    tasks: list[str | int] | None,
+    setups: list[str | int] | None,
+    flows: list[str | int] | None,
+    runs: list[str | int] | None,
+    uploaders: list[str | int] | None,
+    tag: str | None,
+    study: int | None,
+    per_fold: bool | None,
+    sort_order: str | None,
+    resolve_uploader_names: bool,
+    force_refresh_cache: bool,
+) -> Callable[..., list[OpenMLEvaluation]]:
+    per_fold_str = None
+    if per_fold is not None:
+        per_fold_str = str(per_fold).lower()
+
+    return partial(
+        _list_evaluations,
+        function=function,
+        tasks=tasks,
+        setups=setups,
+        flows=flows,
+        runs=runs,
+        uploaders=uploaders,
+        tag=tag,
+        study=study,
+        sort_order=sort_order,
+        resolve_uploader_names=resolve_uploader_names,
+        force_refresh_cache=force_refresh_cache,
+        per_fold=per_fold_str,
+    )
+
+
 def _list_evaluations(  # noqa: C901
     limit: int,
     offset: int,
@@ -154,6 +277,8 @@ def _list_evaluations(  # noqa: C901
     uploaders: list | None = None,
     study: int | None = None,
     sort_order: str | None = None,
+    resolve_uploader_names: bool = True,
+    force_refresh_cache: bool = False,
     **kwargs: Any,
 ) -> list[OpenMLEvaluation]:
     """
@@ -190,6 +315,12 @@ def _list_evaluations(  # noqa: C901
     sort_order : str, optional
         order of sorting evaluations, ascending ("asc") or descending ("desc")
 
+    resolve_uploader_names : bool, optional (default=True)
+        Whether to look up the user names of the uploaders.
+
+    force_refresh_cache : bool (default=False)
+        If True, a cached response of the call is ignored.
+
     Returns
     -------
     list of OpenMLEvaluation objects
@@ -218,52 +349,50 @@ def _list_evaluations(  # noqa: C901
     if sort_order is not None:
         api_call += f"/sort_order/{sort_order}"
 
-    return __list_evaluations(api_call)
+    return __list_evaluations(
+        api_call,
+        resolve_uploader_names=resolve_uploader_names,
+        force_refresh_cache=force_refresh_cache,
+    )
 
 
-def __list_evaluations(api_call: str) -> list[OpenMLEvaluation]:
+def __list_evaluations(
+    api_call: str,
+    *,
+    resolve_uploader_names: bool = True,
+    force_refresh_cache: bool = False,
+) -> list[OpenMLEvaluation]:
     """Helper function to parse API calls which are lists of runs"""
-    xml_string = openml._api_calls._perform_api_call(api_call, "get")
-    evals_dict = xmltodict.parse(xml_string, force_list=("oml:evaluation",))
-    # Minimalistic check if the XML is useful
-    if "oml:evaluations" not in evals_dict:
-        raise ValueError(
-            f'Error in return XML, does not contain "oml:evaluations": {evals_dict!s}',
-        )
-
-    assert isinstance(evals_dict["oml:evaluations"]["oml:evaluation"], list), type(
-        evals_dict["oml:evaluations"],
-    )
-
-    uploader_ids = list(
-        {eval_["oml:uploader"] for eval_ in evals_dict["oml:evaluations"]["oml:evaluation"]},
+    response = openml._api_calls._perform_read_call(
+        api_call,
+        force_refresh_cache=force_refresh_cache,
     )
-    api_users = "user/list/user_id/" + ",".join(uploader_ids)
-    xml_string_user = openml._api_calls._perform_api_call(api_users, "get")
+    evals_fields = list(openml.utils._iter_listing_records(response, "evaluations", "evaluation"))
 
-    users = xmltodict.parse(xml_string_user, force_list=("oml:user",))
-    user_dict = {user["oml:id"]: user["oml:username"] for user in users["oml:users"]["oml:user"]}
+    user_dict: dict[str, str] = {}
+    if resolve_uploader_names:
+        user_dict = _get_uploader_names({eval_["uploader"] for eval_ in evals_fields})
 
     evals = []
-    for eval_ in evals_dict["oml:evaluations"]["oml:evaluation"]:
-        run_id = int(eval_["oml:run_id"])
-        value = float(eval_["oml:value"]) if "oml:value" in eval_ else None
-        values = json.loads(eval_["oml:values"]) if eval_.get("oml:values", None) else None
-        array_data = eval_.get("oml:array_data")
+    for eval_ in evals_fields:
+        run_id = int(eval_["run_id"])
+        value = float(eval_["value"]) if "value" in eval_ else None
+        values = json.loads(eval_["values"]) if eval_.get("values", None) else None
+        array_data = eval_.get("array_data")
 
         evals.append(
             OpenMLEvaluation(
                 run_id=run_id,
-                task_id=int(eval_["oml:task_id"]),
-                setup_id=int(eval_["oml:setup_id"]),
-                flow_id=int(eval_["oml:flow_id"]),
-                flow_name=eval_["oml:flow_name"],
-                data_id=int(eval_["oml:data_id"]),
-                data_name=eval_["oml:data_name"],
-                function=eval_["oml:function"],
-                upload_time=eval_["oml:upload_time"],
-                uploader=int(eval_["oml:uploader"]),
-                uploader_name=user_dict[eval_["oml:uploader"]],
+                task_id=int(eval_["task_id"]),
+                setup_id=int(eval_["setup_id"]),
+                flow_id=int(eval_["flow_id"]),
+                flow_name=eval_["flow_name"],
+                data_id=int(eval_["data_id"]),
+                data_name=eval_["data_name"],
+                function=eval_["function"],
+                upload_time=eval_["upload_time"],
+                uploader=int(eval_["uploader"]),
+                uploader_name=(user_dict[eval_["uploader"]] if resolve_uploader_names else None),
                 value=value,
                 values=values,
                 array_data=array_data,
@@ -273,6 +402,26 @@ def __list_evaluations(api_call: str) -> list[OpenMLEvaluation]:
     return evals
 
 
+def _get_uploader_names(uploader_ids: set[str]) -> dict[str, str]:
+    """Map user ids to user names, only requesting the ids not looked up before."""
+    server = openml.config.server
+    with _uploader_names_lock:
+        known = _uploader_names.setdefault(server, {})
+        unseen = sorted(uploader_ids - known.keys(), key=int)
+
+    if unseen:
+        api_users = "user/list/user_id/" + ",".join(unseen)
+        xml_string_user = openml._api_calls._perform_api_call(api_users, "get")
+        users = xmltodict.parse(xml_string_user, force_list=("oml:user",))
+        with _uploader_names_lock:
+            known.update(
+                {user["oml:id"]: user["oml:username"] for user in users["oml:users"]["oml:user"]},
+            )
+
+    with _uploader_names_lock:
+        return {uploader_id: known[uploader_id] for uploader_id in uploader_ids}
+
+
 def list_evaluation_measures() -> list[str]:
     """Return list of evaluation measures available.
 
@@ -340,6 +489,8 @@ def list_evaluations_setups(
     per_fold: bool | None = None,
     sort_order: str | None = None,
     parameters_in_separate_columns: bool = False,  # noqa: FBT002
+    *,
+    max_workers: int | None = None,
 ) -> pd.DataFrame:
     """List all run-evaluation pairs matching all of the given filters
     and their hyperparameter settings.
@@ -370,6 +521,9 @@ def list_evaluations_setups(
     parameters_in_separate_columns: bool, optional (default= False)
         Returns hyperparameters in separate columns if set to True.
         Valid only for a single flow
+    max_workers : int, optional (default=None)
+        Number of threads used to list the setups of the evaluations, which are requested
+        in chunks of 100. If None, ``openml.config.max_concurrent_pages`` is used.
 
     Returns
     -------
@@ -405,33 +559,42 @@ def list_evaluations_setups(
         # array_split - allows indices_or_sections to not equally divide the array
         # array_split -length % N sub-arrays of size length//N + 1 and the rest of size length//N.
         split_size = ((length - 1) // N) + 1
-        setup_chunks = np.array_split(uniq, split_size)
-
-        setup_data = pd.DataFrame()
-        for _setups in setup_chunks:
-            result = openml.setups.list_setups(setup=_setups, output_format="dataframe")
-            assert isinstance(result, pd.DataFrame)
-            result = result.drop("flow_id", axis=1)
-            # concat resulting setup chunks into single datframe
-            setup_data = pd.concat([setup_data, result])
-
-        parameters = []
-        # Convert parameters of setup into dict of (hyperparameter, value)
-        for parameter_dict in setup_data["parameters"]:
-            if parameter_dict is not None:
-                parameters.append(
-                    {param["full_name"]: param["value"] for param in parameter_dict.values()},
-                )
-            else:
-                parameters.append({})
-        setup_data["parameters"] = parameters
+        setup_chunks = [tuple(chunk.tolist()) for chunk in np.array_split(uniq, split_size)]
+
+        if max_workers is None:
+            max_workers = openml.config.max_concurrent_pages
+        results = openml.utils._map_ids(
+            _list_setups_chunk,
+            setup_chunks,
+            max_workers=max_workers if max_workers > 1 else None,
+        )
+        # concat resulting setup chunks into single dataframe
+        setup_data = pd.concat(results).drop("flow_id", axis=1)
+
+        # Convert parameters of setup into dict of (hyperparameter, value), once per setup
+        parameters = [
+            {param["full_name"]: param["value"] for param in parameter_dict.values()}
+            if parameter_dict is not None
+            else {}
+            for parameter_dict in setup_data["parameters"]
+        ]
+        if parameters_in_separate_columns:
+            setup_data = pd.concat(
+                [
+                    setup_data.drop("parameters", axis=1),
+                    pd.DataFrame.from_records(parameters, index=setup_data.index),
+                ],
+                axis=1,
+            )
+        else:
+            setup_data["parameters"] = parameters
         # Merge setups with evaluations
         _df = evals.merge(setup_data, on="setup_id", how="left")
 
-    if parameters_in_separate_columns:
-        _df = pd.concat(
-            [_df.drop("parameters", axis=1), _df["parameters"].apply(pd.Series)],
-            axis=1,
-        )
-
     return _df
+
+
+def _list_setups_chunk(setup_ids: tuple[int, ...]) -> pd.DataFrame:
+    result = openml.setups.list_setups(setup=setup_ids, output_format="dataframe")
+    assert isinstance(result, pd.DataFrame)
+    return result
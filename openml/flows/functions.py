@@ -12,6 +12,7 @@ import pandas as pd
 import xmltodict
 
 import openml._api_calls
+import openml._cache_index
 import openml.utils
 from openml.exceptions import OpenMLCacheException
 
@@ -129,7 +130,9 @@ def _get_flow_description(flow_id: int) -> OpenMLFlow:
         with xml_file.open("w", encoding="utf8") as fh:
             fh.write(flow_xml)
 
-        return _create_flow_from_xml(flow_xml)
+        flow = _create_flow_from_xml(flow_xml)
+        openml._cache_index._index_flow(flow)
+        return flow
 
 
 def list_flows(
@@ -137,6 +140,8 @@ def list_flows(
     size: int | None = None,
     tag: str | None = None,
     uploader: str | None = None,
+    *,
+    force_refresh_cache: bool = False,
 ) -> pd.DataFrame:
     """
     Return a list of all flows which are on OpenML.
@@ -152,6 +157,9 @@ def list_flows(
         the tag to include
     kwargs: dict, optional
         Legal filter operators: uploader.
+    force_refresh_cache : bool (default=False)
+        If True, cached listings are ignored and replaced by the response of the server.
+        Listings are only cached if ``openml.config.listing_cache_ttl`` is set.
 
     Returns
     -------
@@ -165,7 +173,12 @@ def list_flows(
             - external version
             - uploader
     """
-    listing_call = partial(_list_flows, tag=tag, uploader=uploader)
+    listing_call = partial(
+        _list_flows,
+        tag=tag,
+        uploader=uploader,
+        force_refresh_cache=force_refresh_cache,
+    )
     batches = openml.utils._list_all(listing_call, offset=offset, limit=size)
     if len(batches) == 0:
         return pd.DataFrame()
@@ -173,7 +186,13 @@ def list_flows(
     return pd.concat(batches)
 
 
-def _list_flows(limit: int, offset: int, **kwargs: Any) -> pd.DataFrame:
+def _list_flows(
+    limit: int,
+    offset: int,
+    *,
+    force_refresh_cache: bool = False,
+    **kwargs: Any,
+) -> pd.DataFrame:
     """
     Perform the api call that return a list of all flows.
 
@@ -183,6 +202,8 @@ def _list_flows(limit: int, offset: int, **kwargs: Any) -> pd.DataFrame:
         the maximum number of flows to return
     offset : int
         the number of flows to skip, starting from the first
+    force_refresh_cache : bool (default=False)
+        If True, a cached response of the call is ignored.
     kwargs: dict, optional
         Legal filter operators: uploader, tag
 
@@ -202,7 +223,7 @@ def _list_flows(limit: int, offset: int, **kwargs: Any) -> pd.DataFrame:
             if value is not None:
                 api_call += f"/{operator}/{value}"
 
-    return __list_flows(api_call=api_call)
+    return __list_flows(api_call=api_call, force_refresh_cache=force_refresh_cache)
 
 
 def flow_exists(name: str, external_version: str) -> int | bool:
@@ -308,7 +329,7 @@ def get_flow_id(
     return flows["id"].to_list()  # type: ignore[no-any-return]
 
 
-def __list_flows(api_call: str) -> pd.DataFrame:
+def __list_flows(api_call: str, *, force_refresh_cache: bool = False) -> pd.DataFrame:
     """Retrieve information about flows from OpenML API
     and parse it to a dictionary or a Pandas DataFrame.
 
@@ -316,34 +337,33 @@ def __list_flows(api_call: str) -> pd.DataFrame:
     ----------
     api_call: str
         Retrieves the information about flows.
+    force_refresh_cache : bool (default=False)
+        If True, a cached response of the call is ignored.
 
     Returns
     -------
         The flows information in the specified output format.
     """
-    xml_string = openml._api_calls._perform_api_call(api_call, "get")
-    flows_dict = xmltodict.parse(xml_string, force_list=("oml:flow",))
-
-    # Minimalistic check if the XML is useful
-    assert isinstance(flows_dict["oml:flows"]["oml:flow"], list), type(flows_dict["oml:flows"])
-    assert flows_dict["oml:flows"]["@xmlns:oml"] == "http://openml.org/openml", flows_dict[
-        "oml:flows"
-    ]["@xmlns:oml"]
-
-    flows = {}
-    for flow_ in flows_dict["oml:flows"]["oml:flow"]:
-        fid = int(flow_["oml:id"])
-        flow = {
-            "id": fid,
-            "full_name": flow_["oml:full_name"],
-            "name": flow_["oml:name"],
-            "version": flow_["oml:version"],
-            "external_version": flow_["oml:external_version"],
-            "uploader": flow_["oml:uploader"],
-        }
-        flows[fid] = flow
-
-    return pd.DataFrame.from_dict(flows, orient="index")
+    response = openml._api_calls._perform_read_call(
+        api_call,
+        force_refresh_cache=force_refresh_cache,
+    )
+    flows = openml.utils._ListingColumns()
+    for fields in openml.utils._iter_listing_records(response, "flows", "flow"):
+        flows.add_row(
+            {
+                "id": int(fields["id"]),
+                "full_name": fields["full_name"],
+                "name": fields["name"],
+                "version": fields["version"],
+                "external_version": fields["external_version"],
+                "uploader": fields["uploader"],
+            }.items()
+        )
+
+    if flows.n_rows == 0:
+        return pd.DataFrame()
+    return flows.to_frame(index="id")
 
 
 def _check_flow_for_server_id(flow: OpenMLFlow) -> None:
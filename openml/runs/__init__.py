@@ -7,6 +7,7 @@ from .functions import (
     get_runs,
     initialize_model_from_run,
     initialize_model_from_trace,
+    iter_runs,
     list_runs,
     run_exists,
     run_flow_on_task,
@@ -25,6 +26,7 @@ __all__ = [
     "get_runs",
     "initialize_model_from_run",
     "initialize_model_from_trace",
+    "iter_runs",
     "list_runs",
     "run_exists",
     "run_flow_on_task",
@@ -7,7 +7,7 @@ import warnings
 from collections import OrderedDict
 from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal, overload
 
 import numpy as np
 import pandas as pd
@@ -17,6 +17,7 @@ from joblib.parallel import Parallel, delayed
 
 import openml
 import openml._api_calls
+import openml._cache_index
 import openml.utils
 from openml import config
 from openml.exceptions import (
@@ -45,6 +46,9 @@ from .trace import OpenMLRunTrace
 
 # Avoid import cycles: https://mypy.readthedocs.io/en/latest/common_issues.html#import-cycles
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from concurrent.futures import Executor
+
     from openml.config import _Config
     from openml.extensions.extension_interface import Extension
 
@@ -470,7 +474,7 @@ def _run_task_get_arffcontent(  # noqa: PLR0915, PLR0912, C901
     add_local_measures: bool,
     n_jobs: int | None = None,
 ) -> tuple[
-    list[list],
+    pd.DataFrame,
     OpenMLRunTrace | None,
     OrderedDict[str, OrderedDict],
     OrderedDict[str, OrderedDict],
@@ -494,12 +498,13 @@ def _run_task_get_arffcontent(  # noqa: PLR0915, PLR0912, C901
 
     Returns
     -------
-    Tuple[List[List], Optional[OpenMLRunTrace],
+    Tuple[pd.DataFrame, Optional[OpenMLRunTrace],
         OrderedDict[str, OrderedDict], OrderedDict[str, OrderedDict]]
-    A tuple containing the arfftrace content,
+    A tuple containing the predictions (one column per attribute of the predictions file),
     the OpenML run trace, the global and local evaluation measures.
     """
-    arff_datacontent = []  # type: list[list]
+    # the predictions of every fold, as a mapping from prediction file attribute to column
+    fold_predictions = []  # type: list[dict[str, np.ndarray]]
     traces = []  # type: list[OpenMLRunTrace]
     # stores fold-based evaluation measures. In case of a sample based task,
     # this information is multiple times overwritten, but due to the ordering
@@ -526,6 +531,16 @@ def _run_task_get_arffcontent(  # noqa: PLR0915, PLR0912, C901
     ):
         jobs.append((n_fit, rep_no, fold_no, sample_no))
 
+    # Load the data and the split once in the parent and hand every fold job only its slice
+    # indices. joblib memory-maps large numpy buffers when dispatching to worker processes and
+    # passes plain references to threads, so the dataset is never re-read per fold.
+    x, y = _get_task_data(task)
+    dataset_name = task.get_dataset().name
+    split_indices = [
+        task.get_train_test_split_indices(repeat=rep_no, fold=fold_no, sample=sample_no)
+        for _n_fit, rep_no, fold_no, sample_no in jobs
+    ]
+
     # The forked child process may not copy the configuration state of OpenML from the parent.
     # Current configuration setup needs to be copied and passed to the child processes.
     _config = config.get_config_as_dict()
@@ -552,8 +567,15 @@ def _run_task_get_arffcontent(  # noqa: PLR0915, PLR0912, C901
             sample_no=sample_no,
             task=task,
             configuration=_config,
+            x=x,
+            y=y,
+            train_indices=train_indices,
+            test_indices=test_indices,
+            dataset_name=dataset_name,
+        )
+        for (_n_fit, rep_no, fold_no, sample_no), (train_indices, test_indices) in zip(
+            jobs, split_indices, strict=True
         )
-        for _n_fit, rep_no, fold_no, sample_no in jobs
     )  # job_rvals contain the output of all the runs with one-to-one correspondence with `jobs`
 
     for n_fit, rep_no, fold_no, sample_no in jobs:
@@ -579,41 +601,27 @@ def _run_task_get_arffcontent(  # noqa: PLR0915, PLR0912, C901
             assert test_y is not None
             assert proba_y is not None
 
-            for i, tst_idx in enumerate(test_indices):
-                if task.class_labels is not None:
-                    prediction = (
-                        task.class_labels[pred_y[i]]
-                        if isinstance(pred_y[i], (int, np.integer))
-                        else pred_y[i]
-                    )
-                    if isinstance(test_y, pd.Series):
-                        truth = (
-                            task.class_labels[test_y.iloc[i]]
-                            if isinstance(test_y.iloc[i], int)
-                            else test_y.iloc[i]
-                        )
-                    else:
-                        truth = (
-                            task.class_labels[test_y[i]]
-                            if isinstance(test_y[i], (int, np.integer))
-                            else test_y[i]
-                        )
-                    pred_prob = proba_y.iloc[i] if isinstance(proba_y, pd.DataFrame) else proba_y[i]
-
-                    arff_line = format_prediction(
-                        task=task,
-                        repeat=rep_no,
-                        fold=fold_no,
-                        sample=sample_no,
-                        index=tst_idx,
-                        prediction=prediction,
-                        truth=truth,
-                        proba=dict(zip(task.class_labels, pred_prob, strict=False)),
-                    )
-                else:
-                    raise ValueError("The task has no class labels")
-
-                arff_datacontent.append(arff_line)
+            if task.class_labels is None:
+                raise ValueError("The task has no class labels")
+            class_labels = np.asarray(task.class_labels, dtype=object)
+            probabilities = np.asarray(proba_y, dtype=np.float64)
+            if probabilities.ndim != 2 or probabilities.shape[1] < len(class_labels):
+                raise ValueError("Each class should have a predicted probability")
+
+            fold_predictions.append(
+                {
+                    "repeat": np.full(len(test_indices), rep_no),
+                    "fold": np.full(len(test_indices), fold_no),
+                    "sample": np.full(len(test_indices), sample_no),
+                    "row_id": np.asarray(test_indices),
+                    "prediction": _to_class_labels(pred_y, class_labels),
+                    "correct": _to_class_labels(test_y, class_labels),
+                    **{
+                        f"confidence.{label}": probabilities[:, i]
+                        for i, label in enumerate(task.class_labels)
+                    },
+                },
+            )
 
             if add_local_measures:
                 _calculate_local_measure(
@@ -623,18 +631,15 @@ def _run_task_get_arffcontent(  # noqa: PLR0915, PLR0912, C901
 
         elif isinstance(task, OpenMLRegressionTask):
             assert test_y is not None
-            for i, _ in enumerate(test_indices):
-                truth = test_y.iloc[i] if isinstance(test_y, pd.Series) else test_y[i]
-                arff_line = format_prediction(
-                    task=task,
-                    repeat=rep_no,
-                    fold=fold_no,
-                    index=test_indices[i],
-                    prediction=pred_y[i],
-                    truth=truth,
-                )
-
-                arff_datacontent.append(arff_line)
+            fold_predictions.append(
+                {
+                    "repeat": np.full(len(test_indices), rep_no),
+                    "fold": np.full(len(test_indices), fold_no),
+                    "row_id": np.asarray(test_indices),
+                    "prediction": np.asarray(pred_y),
+                    "truth": np.asarray(test_y),
+                },
+            )
 
             if add_local_measures:
                 _calculate_local_measure(
@@ -643,9 +648,14 @@ def _run_task_get_arffcontent(  # noqa: PLR0915, PLR0912, C901
                 )
 
         elif isinstance(task, OpenMLClusteringTask):
-            for i, _ in enumerate(test_indices):
-                arff_line = [test_indices[i], pred_y[i]]  # row_id, cluster ID
-                arff_datacontent.append(arff_line)
+            fold_predictions.append(
+                {
+                    "repeat": np.full(len(test_indices), rep_no),
+                    "fold": np.full(len(test_indices), fold_no),
+                    "row_id": np.asarray(test_indices),
+                    "cluster": np.asarray(pred_y),
+                },
+            )
 
         else:
             raise TypeError(type(task))
@@ -679,6 +689,14 @@ def _run_task_get_arffcontent(  # noqa: PLR0915, PLR0912, C901
 
         trace = OpenMLRunTrace.merge_traces(traces)
 
+    # Assemble the predictions of all folds in one go, in the column order of the predictions file
+    arff_datacontent = pd.DataFrame(
+        {
+            name: np.concatenate([fold[name] for fold in fold_predictions])
+            for name in fold_predictions[0]
+        },
+    )
+
     return (
         arff_datacontent,
         trace,
@@ -687,6 +705,51 @@ def _run_task_get_arffcontent(  # noqa: PLR0915, PLR0912, C901
     )
 
 
+def _get_task_data(task: OpenMLTask) -> tuple[pd.DataFrame, pd.Series | pd.DataFrame | None]:
+    """Load the features (and target, for supervised tasks) the model is run on."""
+    if isinstance(task, OpenMLSupervisedTask):
+        x, y = task.get_X_and_y()
+        assert isinstance(y, (pd.Series, pd.DataFrame))
+        return x, y
+    if isinstance(task, OpenMLClusteringTask):
+        return task.get_X(), None
+    raise NotImplementedError(
+        f"Task type '{task.task_type}' is not supported. "
+        f"Only OpenMLSupervisedTask and OpenMLClusteringTask are currently implemented. "
+        f"Task details: task_id={getattr(task, 'task_id', 'unknown')}, "
+        f"task_class={task.__class__.__name__}"
+    )
+
+
+def _to_class_labels(values: np.ndarray | pd.Series, class_labels: np.ndarray) -> np.ndarray:
+    """Map predictions or targets given as indices into ``class_labels`` to the labels.
+
+    Values which are not integer indices (e.g. the labels themselves) are kept as they are.
+    """
+    array: np.ndarray
+    if isinstance(values, pd.Series):
+        array = values.to_numpy()
+        # A numeric Series holds the target values themselves, not indices
+        if array.dtype != object:
+            return array
+    else:
+        array = np.asarray(values)
+        if array.dtype.kind in "iu":
+            return np.take(class_labels, array)
+        if array.dtype != object:
+            return array
+
+    labels: np.ndarray = array.copy()
+    is_index = np.fromiter(
+        (isinstance(value, (int, np.integer)) for value in array),
+        dtype=bool,
+        count=len(array),
+    )
+    if is_index.any():
+        labels[is_index] = np.take(class_labels, array[is_index].astype(np.intp))
+    return labels
+
+
 def _run_task_get_arffcontent_parallel_helper(  # noqa: PLR0913
     extension: Extension,
     fold_no: int,
@@ -695,6 +758,11 @@ def _run_task_get_arffcontent_parallel_helper(  # noqa: PLR0913
     sample_no: int,
     task: OpenMLTask,
     configuration: _Config | None = None,
+    x: pd.DataFrame | None = None,
+    y: pd.Series | pd.DataFrame | None = None,
+    train_indices: np.ndarray | None = None,
+    test_indices: np.ndarray | None = None,
+    dataset_name: str | None = None,
 ) -> tuple[
     np.ndarray,
     pd.DataFrame | None,
@@ -721,6 +789,16 @@ def _run_task_get_arffcontent_parallel_helper(  # noqa: PLR0913
         The task object from OpenML.
     configuration : _Config
         Hyperparameters to configure the model.
+    x : pd.DataFrame, optional
+        The features of the task's dataset. Loaded from the task if not provided.
+    y : pd.Series or pd.DataFrame, optional
+        The target of the task's dataset. Only used together with ``x``.
+    train_indices : np.ndarray, optional
+        Train indices of this fold sample. Looked up from the task split if not provided.
+    test_indices : np.ndarray, optional
+        Test indices of this fold sample. Only used together with ``train_indices``.
+    dataset_name : str, optional
+        Name of the task's dataset, used for logging only.
 
     Returns
     -------
@@ -735,36 +813,31 @@ def _run_task_get_arffcontent_parallel_helper(  # noqa: PLR0913
     # if configuration=None, loads the default
     config._setup(configuration)
 
-    train_indices, test_indices = task.get_train_test_split_indices(
-        repeat=rep_no,
-        fold=fold_no,
-        sample=sample_no,
-    )
+    if train_indices is None or test_indices is None:
+        train_indices, test_indices = task.get_train_test_split_indices(
+            repeat=rep_no,
+            fold=fold_no,
+            sample=sample_no,
+        )
 
-    if isinstance(task, OpenMLSupervisedTask):
-        x, y = task.get_X_and_y()
-        assert isinstance(y, (pd.Series, pd.DataFrame))
-        train_x = x.iloc[train_indices]
+    if x is None:
+        x, y = _get_task_data(task)
+
+    train_x = x.iloc[train_indices]
+    if y is not None:
         train_y = y.iloc[train_indices]
         test_x = x.iloc[test_indices]
         test_y = y.iloc[test_indices]
-    elif isinstance(task, OpenMLClusteringTask):
-        x = task.get_X()
-        train_x = x.iloc[train_indices]
+    else:
         train_y = None
         test_x = None
         test_y = None
-    else:
-        raise NotImplementedError(
-            f"Task type '{task.task_type}' is not supported. "
-            f"Only OpenMLSupervisedTask and OpenMLClusteringTask are currently implemented. "
-            f"Task details: task_id={getattr(task, 'task_id', 'unknown')}, "
-            f"task_class={task.__class__.__name__}"
-        )
 
+    if dataset_name is None:
+        dataset_name = task.get_dataset().name
     config.logger.info(
         f"Going to run model {model!s} on "
-        f"dataset {openml.datasets.get_dataset(task.dataset_id).name} "
+        f"dataset {dataset_name} "
         f"for repeat {rep_no} fold {fold_no} sample {sample_no}"
     )
     (
@@ -784,22 +857,62 @@ def _run_task_get_arffcontent_parallel_helper(  # noqa: PLR0913
     return pred_y, proba_y, test_indices, test_y, trace, user_defined_measures_fold  # type: ignore
 
 
-def get_runs(run_ids: list[int]) -> list[OpenMLRun]:
+@overload
+def get_runs(
+    run_ids: list[int],
+    *,
+    max_workers: int | None = ...,
+    executor: Executor | None = ...,
+    return_exceptions: Literal[False] = ...,
+) -> list[OpenMLRun]: ...
+
+
+@overload
+def get_runs(
+    run_ids: list[int],
+    *,
+    max_workers: int | None = ...,
+    executor: Executor | None = ...,
+    return_exceptions: Literal[True],
+) -> list[OpenMLRun | Exception]: ...
+
+
+def get_runs(
+    run_ids: list[int],
+    *,
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+    return_exceptions: bool = False,
+) -> list[OpenMLRun] | list[OpenMLRun | Exception]:
     """Gets all runs in run_ids list.
 
     Parameters
     ----------
     run_ids : list of ints
 
+    max_workers : int, optional (default=None)
+        Number of threads used to download the runs concurrently.
+        If None (and no ``executor`` is given), the runs are downloaded one after another.
+
+    executor : concurrent.futures.Executor, optional (default=None)
+        Executor to submit the downloads to, instead of creating a thread pool.
+
+    return_exceptions : bool (default=False)
+        If True, an exception raised for a run is returned in its place in the result
+        list instead of aborting the whole batch.
+
     Returns
     -------
     runs : list of OpenMLRun
         List of runs corresponding to IDs, fetched from the server.
     """
-    runs = []
-    for run_id in run_ids:
-        runs.append(get_run(run_id))
-    return runs
+    return openml.utils._map_ids(  # type: ignore
+        get_run,
+        run_ids,
+        max_workers=max_workers,
+        executor=executor,
+        return_exceptions=return_exceptions,
+    )
 
 
 @openml.utils.thread_safe_if_oslo_installed
@@ -837,7 +950,9 @@ def get_run(run_id: int, ignore_cache: bool = False) -> OpenMLRun:  # noqa: FBT0
         with run_file.open("w", encoding="utf8") as fh:
             fh.write(run_xml)
 
-    return _create_run_from_xml(run_xml)
+    run = _create_run_from_xml(run_xml)
+    openml._cache_index._index_run(run)
+    return run
 
 
 def _create_run_from_xml(xml: str, from_server: bool = True) -> OpenMLRun:  # noqa: PLR0915, PLR0912, C901, FBT002
@@ -1050,6 +1165,8 @@ def list_runs(  # noqa: PLR0913
     study: int | None = None,
     display_errors: bool = False,  # noqa: FBT002
     task_type: TaskType | int | None = None,
+    *,
+    force_refresh_cache: bool = False,
 ) -> pd.DataFrame:
     """
     List all runs matching all of the given filters.
@@ -1082,10 +1199,70 @@ def list_runs(  # noqa: PLR0913
 
     task_type : str, optional
 
+    force_refresh_cache : bool (default=False)
+        If True, cached listings are ignored and replaced by the response of the server.
+        Listings are only cached if ``openml.config.listing_cache_ttl`` is set.
+
     Returns
     -------
     dataframe
     """
+    batches = list(
+        iter_runs(
+            offset=offset,
+            size=size,
+            id=id,
+            task=task,
+            setup=setup,
+            flow=flow,
+            uploader=uploader,
+            tag=tag,
+            study=study,
+            display_errors=display_errors,
+            task_type=task_type,
+            force_refresh_cache=force_refresh_cache,
+        ),
+    )
+    if len(batches) == 0:
+        return pd.DataFrame()
+
+    return pd.concat(batches)
+
+
+def iter_runs(  # noqa: PLR0913
+    *,
+    offset: int | None = None,
+    size: int | None = None,
+    id: list | None = None,  # noqa: A002
+    task: list[int] | None = None,
+    setup: list | None = None,
+    flow: list | None = None,
+    uploader: list | None = None,
+    tag: str | None = None,
+    study: int | None = None,
+    display_errors: bool = False,
+    task_type: TaskType | int | None = None,
+    force_refresh_cache: bool = False,
+    batch_size: int = 10_000,
+) -> Iterator[pd.DataFrame]:
+    """Iterate over the runs matching all of the given filters, one page at a time.
+
+    Takes the same filters as :func:`list_runs` (as keyword arguments), but yields every
+    page as soon as it has been received instead of returning all of them at once. Pages are
+    only requested while the iteration goes on.
+
+    Parameters
+    ----------
+    force_refresh_cache : bool (default=False)
+        If True, cached listings are ignored, see :func:`list_runs`.
+    batch_size : int, optional (default=10000)
+        The number of runs per page.
+
+    Yields
+    ------
+    dataframe
+        The runs of one page, with the same columns as returned by :func:`list_runs`.
+    """
     if id is not None and (not isinstance(id, list)):
         raise TypeError("id must be of type list.")
     if task is not None and (not isinstance(task, list)):
@@ -1108,12 +1285,15 @@ def list_runs(  # noqa: PLR0913
         study=study,
         display_errors=display_errors,
         task_type=task_type,
+        force_refresh_cache=force_refresh_cache,
+    )
+    # Not a generator itself, so invalid arguments are reported when it is called
+    return openml.utils._iter_all(
+        listing_call,
+        offset=offset,
+        limit=size,
+        batch_size=batch_size,
     )
-    batches = openml.utils._list_all(listing_call, offset=offset, limit=size)
-    if len(batches) == 0:
-        return pd.DataFrame()
-
-    return pd.concat(batches)
 
 
 def _list_runs(  # noqa: PLR0913, C901
@@ -1129,6 +1309,7 @@ def _list_runs(  # noqa: PLR0913, C901
     tag: str | None = None,
     display_errors: bool = False,
     task_type: TaskType | int | None = None,
+    force_refresh_cache: bool = False,
 ) -> pd.DataFrame:
     """
     Perform API call `/run/list/{filters}'
@@ -1161,6 +1342,9 @@ def _list_runs(  # noqa: PLR0913, C901
 
     task_type : str, optional
 
+    force_refresh_cache : bool (default=False)
+        If True, a cached response of the call is ignored.
+
     Returns
     -------
     dict, or dataframe
@@ -1190,45 +1374,33 @@ def _list_runs(  # noqa: PLR0913, C901
     if task_type is not None:
         tvalue = task_type.value if isinstance(task_type, TaskType) else task_type
         api_call += f"/task_type/{tvalue}"
-    return __list_runs(api_call=api_call)
+    return __list_runs(api_call=api_call, force_refresh_cache=force_refresh_cache)
 
 
-def __list_runs(api_call: str) -> pd.DataFrame:
+def __list_runs(api_call: str, *, force_refresh_cache: bool = False) -> pd.DataFrame:
     """Helper function to parse API calls which are lists of runs"""
-    xml_string = openml._api_calls._perform_api_call(api_call, "get")
-    runs_dict = xmltodict.parse(xml_string, force_list=("oml:run",))
-    # Minimalistic check if the XML is useful
-    if "oml:runs" not in runs_dict:
-        raise ValueError(f'Error in return XML, does not contain "oml:runs": {runs_dict}')
-
-    if "@xmlns:oml" not in runs_dict["oml:runs"]:
-        raise ValueError(
-            f'Error in return XML, does not contain "oml:runs"/@xmlns:oml: {runs_dict}'
-        )
-
-    if runs_dict["oml:runs"]["@xmlns:oml"] != "http://openml.org/openml":
-        raise ValueError(
-            "Error in return XML, value of  "
-            '"oml:runs"/@xmlns:oml is not '
-            f'"http://openml.org/openml": {runs_dict}',
+    response = openml._api_calls._perform_read_call(
+        api_call,
+        force_refresh_cache=force_refresh_cache,
+    )
+    runs = openml.utils._ListingColumns()
+    for r in openml.utils._iter_listing_records(response, "runs", "run"):
+        runs.add_row(
+            {
+                "run_id": int(r["run_id"]),
+                "task_id": int(r["task_id"]),
+                "setup_id": int(r["setup_id"]),
+                "flow_id": int(r["flow_id"]),
+                "uploader": int(r["uploader"]),
+                "task_type": TaskType(int(r["task_type_id"])),
+                "upload_time": str(r["upload_time"]),
+                "error_message": str(r["error_message"] or ""),
+            }.items()
         )
 
-    assert isinstance(runs_dict["oml:runs"]["oml:run"], list), type(runs_dict["oml:runs"])
-
-    runs = {
-        int(r["oml:run_id"]): {
-            "run_id": int(r["oml:run_id"]),
-            "task_id": int(r["oml:task_id"]),
-            "setup_id": int(r["oml:setup_id"]),
-            "flow_id": int(r["oml:flow_id"]),
-            "uploader": int(r["oml:uploader"]),
-            "task_type": TaskType(int(r["oml:task_type_id"])),
-            "upload_time": str(r["oml:upload_time"]),
-            "error_message": str((r["oml:error_message"]) or ""),
-        }
-        for r in runs_dict["oml:runs"]["oml:run"]
-    }
-    return pd.DataFrame.from_dict(runs, orient="index")
+    if runs.n_rows == 0:
+        return pd.DataFrame()
+    return runs.to_frame(index="run_id")
 
 
 def format_prediction(  # noqa: PLR0913
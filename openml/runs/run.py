@@ -1,19 +1,26 @@
 # License: BSD 3-Clause
 from __future__ import annotations
 
+import io
+import json
+import os
 import pickle
+import threading
 import time
 from collections import OrderedDict
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
+    TextIO,
 )
 
 import arff
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 import openml
 import openml._api_calls
@@ -33,6 +40,12 @@ from openml.tasks import (
 if TYPE_CHECKING:
     from openml.runs.trace import OpenMLRunTrace
 
+# Number of predictions which are encoded at once when writing a predictions ARFF file.
+_PREDICTIONS_CHUNK_SIZE = 10_000
+
+# Predictions of published runs are cached in this file of the run's cache directory.
+_PREDICTIONS_CACHE_FILE_NAME = "predictions.parquet"
+
 
 class OpenMLRun(OpenMLBase):
     """OpenML Run: result of running a model on an OpenML dataset.
@@ -63,8 +76,9 @@ class OpenMLRun(OpenMLBase):
         The evaluations of the run for each fold.
     sample_evaluations: Dict
         The evaluations of the run for each sample.
-    data_content: List[List]
-        The predictions generated from executing this run.
+    data_content: List[List] or pd.DataFrame
+        The predictions generated from executing this run. Either a list of rows, or a
+        DataFrame with one column per attribute of the predictions file (in the same order).
     trace: OpenMLRunTrace
         The trace containing information on internal model evaluations of this run.
     model: object
@@ -108,7 +122,7 @@ class OpenMLRun(OpenMLBase):
         evaluations: dict | None = None,
         fold_evaluations: dict | None = None,
         sample_evaluations: dict | None = None,
-        data_content: list[list] | None = None,
+        data_content: list[list] | pd.DataFrame | None = None,
         trace: OpenMLRunTrace | None = None,
         model: object | None = None,
         task_type: str | None = None,
@@ -149,16 +163,21 @@ class OpenMLRun(OpenMLBase):
         self.description_text = description_text
         self.run_details = run_details
         self._predictions = None
+        self._prediction_folds: list[tuple[np.ndarray, np.ndarray]] | None = None
 
     @property
     def predictions(self) -> pd.DataFrame:
         """Return a DataFrame with predictions for this run"""
         if self._predictions is None:
-            if self.data_content:
+            if self.data_content is not None and len(self.data_content) > 0:
+                if isinstance(self.data_content, pd.DataFrame):
+                    attributes = self._generate_arff_dict(include_data=False)["attributes"]
+                    self._predictions = self._data_content_as_frame(attributes)
+                    return self._predictions
                 arff_dict = self._generate_arff_dict()
             elif self.predictions_url:
-                arff_text = openml._api_calls._download_text_file(self.predictions_url)
-                arff_dict = arff.loads(arff_text)
+                _, self._predictions = self._load_predictions_file()
+                return self._predictions
             else:
                 raise RuntimeError("Run has no predictions.")
             self._predictions = pd.DataFrame(
@@ -328,9 +347,13 @@ class OpenMLRun(OpenMLBase):
             run.flow = flow
             run.flow_name = flow.name
 
-        with predictions_path.open() as fht:
-            predictions = arff.load(fht)
-            run.data_content = predictions["data"]
+        predictions_parquet_path = directory / "predictions.parquet"
+        if predictions_parquet_path.is_file():
+            run.data_content = pd.read_parquet(predictions_parquet_path)
+        else:
+            with predictions_path.open() as fht:
+                predictions = arff.load(fht)
+                run.data_content = predictions["data"]
 
         if model_path.is_file():
             # note that it will load the model if the file exists, even if
@@ -347,6 +370,8 @@ class OpenMLRun(OpenMLBase):
         self,
         directory: str | Path,
         store_model: bool = True,  # noqa: FBT002
+        *,
+        store_predictions_parquet: bool = False,
     ) -> None:
         """
         The inverse of the from_filesystem method. Serializes a run
@@ -362,6 +387,11 @@ class OpenMLRun(OpenMLBase):
             if True, a model will be pickled as well. As this is the most
             storage expensive part, it is often desirable to not store the
             model.
+
+        store_predictions_parquet : bool, optional (default=False)
+            if True, the predictions are also stored as ``predictions.parquet``.
+            :meth:`from_filesystem` reads this file instead of parsing the
+            predictions ARFF file, which is much faster for large runs.
         """
         if self.data_content is None or self.model is None:
             raise ValueError("Run should have been executed (and contain model / predictions)")
@@ -372,13 +402,17 @@ class OpenMLRun(OpenMLBase):
             raise ValueError(f"Output directory {directory.expanduser().resolve()} should be empty")
 
         run_xml = self._to_xml()
-        predictions_arff = arff.dumps(self._generate_arff_dict())
+        arff_header = self._generate_arff_dict(include_data=False)
 
         # It seems like typing does not allow to define the same variable multiple times
         with (directory / "description.xml").open("w") as fh:
             fh.write(run_xml)
         with (directory / "predictions.arff").open("w") as fh:
-            fh.write(predictions_arff)
+            _write_predictions_arff(fh, arff_header, self.data_content)
+        if store_predictions_parquet:
+            self._data_content_as_frame(arff_header["attributes"]).to_parquet(
+                directory / "predictions.parquet",
+            )
         if store_model:
             with (directory / "model.pkl").open("wb") as fh_b:
                 pickle.dump(self.model, fh_b)
@@ -389,7 +423,7 @@ class OpenMLRun(OpenMLBase):
         if self.trace is not None:
             self.trace._to_filesystem(directory)
 
-    def _generate_arff_dict(self) -> OrderedDict[str, Any]:
+    def _generate_arff_dict(self, *, include_data: bool = True) -> OrderedDict[str, Any]:  # noqa: C901, PLR0912
         """Generates the arff dictionary for uploading predictions to the
         server.
 
@@ -397,6 +431,12 @@ class OpenMLRun(OpenMLBase):
 
         The order of the attributes follows the order defined by the Client API for R.
 
+        Parameters
+        ----------
+        include_data : bool (default=True)
+            Whether to add the predictions as a list of rows under ``"data"``.
+            If False, only the header is generated.
+
         Returns
         -------
         arf_dict : dict
@@ -414,7 +454,8 @@ class OpenMLRun(OpenMLBase):
         task = get_task(self.task_id)
 
         arff_dict = OrderedDict()  # type: 'OrderedDict[str, Any]'
-        arff_dict["data"] = self.data_content
+        if include_data:
+            arff_dict["data"] = self._data_content_as_rows()
         arff_dict["description"] = self.description_text
         arff_dict["relation"] = f"openml_task_{task.task_id}_predictions"
 
@@ -488,7 +529,25 @@ class OpenMLRun(OpenMLBase):
 
         return arff_dict
 
-    def get_metric_fn(self, sklearn_fn: Callable, kwargs: dict | None = None) -> np.ndarray:  # noqa: PLR0915, PLR0912, C901
+    def _data_content_as_frame(self, attributes: list[tuple[str, Any]]) -> pd.DataFrame:
+        """Return the predictions of this run as a DataFrame with one column per attribute."""
+        if self.data_content is None:
+            raise ValueError("Run has not been executed.")
+        names = [name for name, _ in attributes]
+        if isinstance(self.data_content, pd.DataFrame):
+            return self.data_content.set_axis(names, axis=1)
+        return pd.DataFrame(self.data_content, columns=names)
+
+    def _data_content_as_rows(self) -> list[list]:
+        """Return the predictions of this run as a list of rows, as expected by liac-arff."""
+        if self.data_content is None:
+            raise ValueError("Run has not been executed.")
+        if isinstance(self.data_content, pd.DataFrame):
+            # Casting to object converts numpy scalars to the corresponding python types
+            return self.data_content.to_numpy(dtype=object).tolist()  # type: ignore
+        return self.data_content
+
+    def get_metric_fn(self, sklearn_fn: Callable, kwargs: dict | None = None) -> np.ndarray:
         """Calculates metric scores based on predicted values. Assumes the
         run has been executed locally (and contains run_data). Furthermore,
         it assumes that the 'correct' or 'truth' attribute is specified in
@@ -508,17 +567,61 @@ class OpenMLRun(OpenMLBase):
         scores : ndarray of scores of length num_folds * num_repeats
             metric results
         """
+        return self.get_metrics({"metric": sklearn_fn}, {"metric": kwargs or {}})["metric"]
+
+    def get_metrics(
+        self,
+        metrics: Mapping[str, Callable],
+        kwargs: Mapping[str, dict] | None = None,
+    ) -> dict[str, np.ndarray]:
+        """Calculates several metric scores based on predicted values.
+
+        The predictions are parsed only once per run object and the scores of all metrics
+        are computed in a single pass over the folds. Has the same requirements on the run
+        as :meth:`get_metric_fn`.
+
+        Parameters
+        ----------
+        metrics : Mapping[str, Callable]
+            Mapping from a name to a sklearn-like function that accepts ``y_true``,
+            ``y_pred`` and ``**kwargs``.
+        kwargs : Mapping[str, dict], optional
+            Mapping from metric name to the kwargs for its function.
+
+        Returns
+        -------
+        scores : dict[str, np.ndarray]
+            Mapping from metric name to the scores of length num_folds * num_repeats.
+
+        Examples
+        --------
+        >>> scores = run.get_metrics(  # doctest: +SKIP
+        ...     {"accuracy": sklearn.metrics.accuracy_score, "f1": sklearn.metrics.f1_score},
+        ...     kwargs={"f1": {"average": "macro"}},
+        ... )
+        """
         kwargs = kwargs if kwargs else {}
+        scores: dict[str, list] = {name: [] for name in metrics}
+        for y_true, y_pred in self._get_prediction_folds():
+            for name, sklearn_fn in metrics.items():
+                scores[name].append(sklearn_fn(y_true, y_pred, **kwargs.get(name, {})))
+        return {name: np.array(metric_scores) for name, metric_scores in scores.items()}
+
+    def _get_prediction_folds(self) -> list[tuple[np.ndarray, np.ndarray]]:  # noqa: C901
+        """Return the true and predicted values of the last sample of every fold.
+
+        The folds are ordered by repeat and then by fold, in the order in which they appear
+        in the predictions. Class labels are given as indices into the declared labels.
+        The result is computed once and stored on the run.
+        """
+        if self._prediction_folds is not None:
+            return self._prediction_folds
+
         if self.data_content is not None and self.task_id is not None:
-            predictions_arff = self._generate_arff_dict()
-        elif (self.output_files is not None) and ("predictions" in self.output_files):
-            predictions_file_url = openml._api_calls._file_id_to_url(
-                self.output_files["predictions"],
-                "predictions.arff",
-            )
-            response = openml._api_calls._download_text_file(predictions_file_url)
-            predictions_arff = arff.loads(response)
-            # TODO: make this a stream reader
+            attributes = self._generate_arff_dict(include_data=False)["attributes"]
+            predictions = self._data_content_as_frame(attributes)
+        elif self._predictions_file_url() is not None:
+            attributes, predictions = self._load_predictions_file()
         else:
             raise ValueError(
                 "Run should have been locally executed or contain outputfile reference.",
@@ -527,92 +630,113 @@ class OpenMLRun(OpenMLBase):
         # Need to know more about the task to compute scores correctly
         task = get_task(self.task_id)
 
-        attribute_names = [att[0] for att in predictions_arff["attributes"]]
+        attribute_types = dict(attributes)
         if (
             task.task_type_id in [TaskType.SUPERVISED_CLASSIFICATION, TaskType.LEARNING_CURVE]
-            and "correct" not in attribute_names
+            and "correct" not in attribute_types
         ):
             raise ValueError('Attribute "correct" should be set for classification task runs')
-        if task.task_type_id == TaskType.SUPERVISED_REGRESSION and "truth" not in attribute_names:
+        if task.task_type_id == TaskType.SUPERVISED_REGRESSION and "truth" not in attribute_types:
             raise ValueError('Attribute "truth" should be set for regression task runs')
-        if task.task_type_id != TaskType.CLUSTERING and "prediction" not in attribute_names:
+        if task.task_type_id != TaskType.CLUSTERING and "prediction" not in attribute_types:
             raise ValueError('Attribute "prediction" should be set for supervised task runs')
 
-        def _attribute_list_to_dict(attribute_list):  # type: ignore
-            # convenience function: Creates a mapping to map from the name of
-            # attributes present in the arff prediction file to their index.
-            # This is necessary because the number of classes can be different
-            # for different tasks.
-            res = OrderedDict()
-            for idx in range(len(attribute_list)):
-                res[attribute_list[idx][0]] = idx
-            return res
-
-        attribute_dict = _attribute_list_to_dict(predictions_arff["attributes"])
-
-        repeat_idx = attribute_dict["repeat"]
-        fold_idx = attribute_dict["fold"]
-        predicted_idx = attribute_dict["prediction"]  # Assume supervised task
-
         if task.task_type_id in (TaskType.SUPERVISED_CLASSIFICATION, TaskType.LEARNING_CURVE):
-            correct_idx = attribute_dict["correct"]
+            correct_name = "correct"
         elif task.task_type_id == TaskType.SUPERVISED_REGRESSION:
-            correct_idx = attribute_dict["truth"]
-        has_samples = False
-        if "sample" in attribute_dict:
-            sample_idx = attribute_dict["sample"]
-            has_samples = True
+            correct_name = "truth"
 
-        if (
-            predictions_arff["attributes"][predicted_idx][1]
-            != predictions_arff["attributes"][correct_idx][1]
-        ):
-            pred = predictions_arff["attributes"][predicted_idx][1]
-            corr = predictions_arff["attributes"][correct_idx][1]
+        if attribute_types["prediction"] != attribute_types[correct_name]:
+            pred = attribute_types["prediction"]
+            corr = attribute_types[correct_name]
             raise ValueError(
                 f"Predicted and Correct do not have equal values: {pred!s} Vs. {corr!s}",
             )
 
-        # TODO: these could be cached
-        values_predict: dict[int, dict[int, dict[int, list[float]]]] = {}
-        values_correct: dict[int, dict[int, dict[int, list[float]]]] = {}
-        for _line_idx, line in enumerate(predictions_arff["data"]):
-            rep = line[repeat_idx]
-            fold = line[fold_idx]
-            samp = line[sample_idx] if has_samples else 0
-
-            if task.task_type_id in [
-                TaskType.SUPERVISED_CLASSIFICATION,
-                TaskType.LEARNING_CURVE,
-            ]:
-                prediction = predictions_arff["attributes"][predicted_idx][1].index(
-                    line[predicted_idx],
+        if task.task_type_id in [TaskType.SUPERVISED_CLASSIFICATION, TaskType.LEARNING_CURVE]:
+            class_labels = attribute_types["prediction"]
+            y_pred = _class_label_indices(predictions["prediction"], class_labels)
+            y_true = _class_label_indices(predictions[correct_name], class_labels)
+        else:
+            y_pred = predictions["prediction"].to_numpy()
+            y_true = predictions[correct_name].to_numpy()
+
+        repeats = predictions["repeat"].to_numpy()
+        folds = predictions["fold"].to_numpy()
+        samples = (
+            predictions["sample"].to_numpy()
+            if "sample" in predictions
+            else np.zeros(len(predictions), dtype=np.int64)
+        )
+
+        fold_rows = _last_sample_rows(repeats, folds, samples)
+        self._prediction_folds = [(y_true[idx], y_pred[idx]) for idx in fold_rows]
+        return self._prediction_folds
+
+    def _predictions_file_url(self) -> str | None:
+        """Return the url of the predictions file on the server, if the run has one."""
+        if self.predictions_url:
+            return self.predictions_url
+        if self.output_files is not None and "predictions" in self.output_files:
+            return openml._api_calls._file_id_to_url(
+                self.output_files["predictions"],
+                "predictions.arff",
+            )
+        return None
+
+    def _load_predictions_file(self) -> tuple[list[tuple[str, Any]], pd.DataFrame]:
+        """Load the predictions file of this run from the server.
+
+        For published runs, the predictions file is downloaded to the run's cache directory
+        once, and converted to a parquet file. Later calls (also from other run objects for
+        the same run) read the parquet file instead.
+
+        Returns
+        -------
+        attributes : list of tuples
+            The ARFF attributes of the predictions file.
+        predictions : pd.DataFrame
+            The predictions, with one column per attribute.
+        """
+        # Avoiding cyclic imports
+        import openml.runs.functions
+
+        url = self._predictions_file_url()
+        if url is None:
+            raise RuntimeError("Run has no predictions.")
+
+        if self.run_id is None:
+            predictions_arff = arff.loads(openml._api_calls._download_text_file(url))
+            return _predictions_arff_to_frame(predictions_arff)
+
+        run_dir = openml.utils._create_cache_directory_for_id(
+            openml.runs.functions.RUNS_CACHE_DIR_NAME,
+            self.run_id,
+        )
+        cache_file = run_dir / _PREDICTIONS_CACHE_FILE_NAME
+        if cache_file.is_file():
+            try:
+                return _read_predictions_parquet(cache_file)
+            except (OSError, KeyError, ValueError, pa.ArrowInvalid) as e:
+                openml.config.logger.warning(
+                    f"Could not read cached predictions {cache_file}, downloading them again: {e}",
                 )
-                correct = predictions_arff["attributes"][predicted_idx][1].index(line[correct_idx])
-            elif task.task_type_id == TaskType.SUPERVISED_REGRESSION:
-                prediction = line[predicted_idx]
-                correct = line[correct_idx]
-            if rep not in values_predict:
-                values_predict[rep] = OrderedDict()
-                values_correct[rep] = OrderedDict()
-            if fold not in values_predict[rep]:
-                values_predict[rep][fold] = OrderedDict()
-                values_correct[rep][fold] = OrderedDict()
-            if samp not in values_predict[rep][fold]:
-                values_predict[rep][fold][samp] = []
-                values_correct[rep][fold][samp] = []
-
-            values_predict[rep][fold][samp].append(prediction)
-            values_correct[rep][fold][samp].append(correct)
-
-        scores = []
-        for rep in values_predict:  # noqa: PLC0206
-            for fold in values_predict[rep]:
-                last_sample = len(values_predict[rep][fold]) - 1
-                y_pred = values_predict[rep][fold][last_sample]
-                y_true = values_correct[rep][fold][last_sample]
-                scores.append(sklearn_fn(y_true, y_pred, **kwargs))
-        return np.array(scores)
+
+        # Concurrent loads of the same run each download to (and remove) their own file
+        unique_suffix = f"{os.getpid()}.{threading.get_ident()}"
+        arff_file = run_dir / f"predictions.{unique_suffix}.arff"
+        try:
+            openml._api_calls._download_text_file(url, output_path=arff_file)
+            with arff_file.open(encoding="utf8") as fh:
+                attributes, predictions = _predictions_arff_to_frame(arff.load(fh))
+        finally:
+            arff_file.unlink(missing_ok=True)
+
+        # Write to a temporary file first so concurrent readers never see a partial cache
+        tmp_file = cache_file.with_suffix(f".{unique_suffix}.tmp")
+        _write_predictions_parquet(tmp_file, attributes, predictions)
+        tmp_file.replace(cache_file)
+        return attributes, predictions
 
     def _parse_publish_response(self, xml_response: dict) -> None:
         """Parse the id from the xml_response and assign it to self."""
@@ -651,8 +775,15 @@ class OpenMLRun(OpenMLBase):
         file_elements = {"description": ("description.xml", self._to_xml())}
 
         if self.error_message is None:
-            predictions = arff.dumps(self._generate_arff_dict())
-            file_elements["predictions"] = ("predictions.arff", predictions)
+            if self.data_content is None:
+                raise ValueError("Run has not been executed.")
+            with io.StringIO() as predictions:
+                _write_predictions_arff(
+                    predictions,
+                    self._generate_arff_dict(include_data=False),
+                    self.data_content,
+                )
+                file_elements["predictions"] = ("predictions.arff", predictions.getvalue())
 
         if self.trace is not None:
             trace_arff = arff.dumps(self.trace.trace_to_arff())
@@ -711,3 +842,139 @@ class OpenMLRun(OpenMLBase):
                                 current,
                             )
         return description
+
+
+def _write_predictions_arff(
+    fh: TextIO,
+    arff_header: dict[str, Any],
+    data: list[list] | pd.DataFrame,
+) -> None:
+    """Write a predictions ARFF file to ``fh``.
+
+    The output is the same as ``arff.dump`` with ``data`` as the data section. Predictions
+    given as a DataFrame are encoded column by column, ``_PREDICTIONS_CHUNK_SIZE`` rows at a
+    time, and written directly to ``fh`` instead of being formatted value by value.
+
+    Parameters
+    ----------
+    fh : TextIO
+        File handle to write to.
+    arff_header : dict
+        The ARFF dictionary without data, as returned by ``_generate_arff_dict``.
+    data : list of lists or pd.DataFrame
+        The predictions, one row per prediction and one value or column per attribute.
+    """
+    if not isinstance(data, pd.DataFrame):
+        arff.dump({**arff_header, "data": data}, fh)
+        return
+
+    n_attributes = len(arff_header["attributes"])
+    if data.shape[1] != n_attributes:
+        raise ValueError(
+            f"Predictions have {data.shape[1]} columns, but {n_attributes} attributes are "
+            "declared for the predictions file.",
+        )
+
+    # The header ends with the @DATA line and an empty line, which ends the file
+    header = list(arff.ArffEncoder().iter_encode(arff_header))[:-1]
+    fh.write("\n".join(header))
+    fh.write("\n")
+
+    for start in range(0, len(data), _PREDICTIONS_CHUNK_SIZE):
+        chunk = data.iloc[start : start + _PREDICTIONS_CHUNK_SIZE]
+        columns = [_encode_arff_column(chunk.iloc[:, i]) for i in range(n_attributes)]
+        fh.write("\n".join(map(",".join, zip(*columns, strict=True))))
+        fh.write("\n")
+
+
+def _encode_arff_column(column: pd.Series) -> list[str]:
+    """Encode the values of a column as ARFF data values, the way liac-arff does."""
+    # Predictions typically take few distinct values (repeats, folds, class labels and the
+    # confidences of e.g. tree based models), so every distinct value is only encoded once
+    codes, uniques = pd.factorize(column.to_numpy())
+    if uniques.dtype.kind in "biuf":
+        encoded_uniques = [str(value) for value in uniques.tolist()]
+    else:
+        encoded_uniques = [
+            "?" if value == "" else arff.encode_string(str(value)) for value in uniques
+        ]
+    # Missing values get the code -1, which picks the last element
+    encoded: list[str] = np.asarray([*encoded_uniques, "?"], dtype=object)[codes].tolist()
+    return encoded
+
+
+def _class_label_indices(values: pd.Series, class_labels: list[str]) -> np.ndarray:
+    """Return the index of every value in ``class_labels``."""
+    indices: np.ndarray = pd.Categorical(values, categories=class_labels).codes.astype(np.int64)
+    if (indices == -1).any():
+        unknown = values[indices == -1].iloc[0]
+        raise ValueError(f"{unknown!r} is not one of the class labels {class_labels}")
+    return indices
+
+
+def _last_sample_rows(
+    repeats: np.ndarray,
+    folds: np.ndarray,
+    samples: np.ndarray,
+) -> list[np.ndarray]:
+    """Group the rows of the predictions of the last sample of every fold.
+
+    Samples are numbered from 0, so the last sample of a fold is its number of samples minus
+    one. The folds are ordered by the first appearance of their repeat, and then by their own
+    first appearance, and the rows of a fold keep their order.
+
+    Returns
+    -------
+    list of np.ndarray
+        The row indices of every fold.
+    """
+    pairs, first_row, pair_codes = np.unique(
+        np.stack([repeats, folds], axis=1),
+        axis=0,
+        return_index=True,
+        return_inverse=True,
+    )
+    pair_codes = pair_codes.reshape(-1)
+    repeat_codes = np.unique(pairs[:, 0], return_inverse=True)[1].reshape(-1)
+    repeat_first_row = np.full(repeat_codes.max(initial=-1) + 1, len(repeats))
+    np.minimum.at(repeat_first_row, repeat_codes, first_row)
+    pair_order = np.lexsort((first_row, repeat_first_row[repeat_codes]))
+
+    pair_samples = np.unique(np.stack([pair_codes, samples], axis=1), axis=0)
+    n_samples = np.bincount(pair_samples[:, 0], minlength=len(pairs))
+    rows = np.flatnonzero(samples == n_samples[pair_codes] - 1)
+
+    # A stable sort keeps the order of the rows within a fold
+    rows = rows[np.argsort(pair_codes[rows], kind="stable")]
+    boundaries = np.searchsorted(pair_codes[rows], np.arange(len(pairs) + 1))
+    return [rows[boundaries[code] : boundaries[code + 1]] for code in pair_order]
+
+
+def _predictions_arff_to_frame(
+    predictions_arff: dict[str, Any],
+) -> tuple[list[tuple[str, Any]], pd.DataFrame]:
+    """Split a decoded predictions ARFF file into its attributes and a DataFrame."""
+    attributes = [(name, type_) for name, type_ in predictions_arff["attributes"]]
+    predictions = pd.DataFrame(
+        predictions_arff["data"],
+        columns=[name for name, _ in attributes],
+    )
+    return attributes, predictions
+
+
+def _write_predictions_parquet(
+    path: Path,
+    attributes: list[tuple[str, Any]],
+    predictions: pd.DataFrame,
+) -> None:
+    """Write predictions to a parquet file, with their ARFF attributes in the file metadata."""
+    table = pa.Table.from_pandas(predictions, preserve_index=False)
+    metadata = {**(table.schema.metadata or {}), b"openml": json.dumps(attributes).encode()}
+    pq.write_table(table.replace_schema_metadata(metadata), path)
+
+
+def _read_predictions_parquet(path: Path) -> tuple[list[tuple[str, Any]], pd.DataFrame]:
+    """Read predictions written by ``_write_predictions_parquet``."""
+    table = pq.read_table(path)
+    attributes = [(name, type_) for name, type_ in json.loads(table.schema.metadata[b"openml"])]
+    return attributes, table.to_pandas()
@@ -218,33 +218,22 @@ def _list_setups(
 
 def __list_setups(api_call: str) -> list[OpenMLSetup]:
     """Helper function to parse API calls which are lists of setups"""
-    xml_string = openml._api_calls._perform_api_call(api_call, "get")
-    setups_dict = xmltodict.parse(xml_string, force_list=("oml:setup",))
-    openml_uri = "http://openml.org/openml"
-    # Minimalistic check if the XML is useful
-    if "oml:setups" not in setups_dict:
-        raise ValueError(
-            f'Error in return XML, does not contain "oml:setups": {setups_dict!s}',
-        )
-
-    if "@xmlns:oml" not in setups_dict["oml:setups"]:
-        raise ValueError(
-            f'Error in return XML, does not contain "oml:setups"/@xmlns:oml: {setups_dict!s}',
-        )
-
-    if setups_dict["oml:setups"]["@xmlns:oml"] != openml_uri:
-        raise ValueError(
-            "Error in return XML, value of  "
-            '"oml:seyups"/@xmlns:oml is not '
-            f'"{openml_uri}": {setups_dict!s}',
+    response = openml._api_calls._perform_read_call(api_call, cached=False)
+    setups = []
+    records = openml.utils._iter_listing_records(response, "setups", "setup", nested=("parameter",))
+    for fields in records:
+        xml_parameters = [
+            {f"oml:{name}": value for name, value in parameter.items()}
+            for parameter in fields.get("parameter", [])
+        ]
+        parameters = {
+            int(xml_parameter["oml:id"]): _create_setup_parameter_from_xml(xml_parameter)
+            for xml_parameter in xml_parameters
+        }
+        setups.append(
+            OpenMLSetup(int(fields["setup_id"]), int(fields["flow_id"]), parameters or None)
         )
-
-    assert isinstance(setups_dict["oml:setups"]["oml:setup"], list), type(setups_dict["oml:setups"])
-
-    return [
-        _create_setup_from_xml({"oml:setup_parameters": setup_})
-        for setup_ in setups_dict["oml:setups"]["oml:setup"]
-    ]
+    return setups
 
 
 def initialize_model(setup_id: int, *, strict_version: bool = True) -> Any:
@@ -5,6 +5,7 @@ from .functions import (
     delete_task,
     get_task,
     get_tasks,
+    iter_tasks,
     list_tasks,
 )
 from .split import OpenMLSplit
@@ -31,5 +32,6 @@ __all__ = [
     "delete_task",
     "get_task",
     "get_tasks",
+    "iter_tasks",
     "list_tasks",
 ]
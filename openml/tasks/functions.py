@@ -5,12 +5,13 @@ import os
 import re
 import warnings
 from functools import partial
-from typing import Any
+from typing import TYPE_CHECKING, Any, Literal, overload
 
 import pandas as pd
 import xmltodict
 
 import openml._api_calls
+import openml._cache_index
 import openml.utils
 from openml.datasets import get_dataset
 from openml.exceptions import OpenMLCacheException
@@ -25,6 +26,10 @@ from .task import (
     TaskType,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from concurrent.futures import Executor
+
 TASKS_CACHE_DIR_NAME = "tasks"
 
 
@@ -139,6 +144,8 @@ def list_tasks(  # noqa: PLR0913
     number_features: int | None = None,
     number_classes: int | None = None,
     number_missing_values: int | None = None,
+    *,
+    force_refresh_cache: bool = False,
 ) -> pd.DataFrame:
     """
     Return a number of tasks having the given tag and task_type
@@ -165,6 +172,9 @@ def list_tasks(  # noqa: PLR0913
     number_features : int, optional
     number_classes : int, optional
     number_missing_values : int, optional
+    force_refresh_cache : bool (default=False)
+        If True, cached listings are ignored and replaced by the response of the server.
+        Listings are only cached if ``openml.config.listing_cache_ttl`` is set.
 
     Returns
     -------
@@ -174,6 +184,64 @@ def list_tasks(  # noqa: PLR0913
         as columns: task id, dataset id, task_type and status. If qualities are
         calculated for the associated dataset, some of these are also returned.
     """
+    batches = list(
+        iter_tasks(
+            task_type=task_type,
+            offset=offset,
+            size=size,
+            tag=tag,
+            data_tag=data_tag,
+            status=status,
+            data_name=data_name,
+            data_id=data_id,
+            number_instances=number_instances,
+            number_features=number_features,
+            number_classes=number_classes,
+            number_missing_values=number_missing_values,
+            force_refresh_cache=force_refresh_cache,
+        ),
+    )
+    if len(batches) == 0:
+        return pd.DataFrame()
+
+    return pd.concat(batches)
+
+
+def iter_tasks(  # noqa: PLR0913
+    *,
+    task_type: TaskType | None = None,
+    offset: int | None = None,
+    size: int | None = None,
+    tag: str | None = None,
+    data_tag: str | None = None,
+    status: str | None = None,
+    data_name: str | None = None,
+    data_id: int | None = None,
+    number_instances: int | None = None,
+    number_features: int | None = None,
+    number_classes: int | None = None,
+    number_missing_values: int | None = None,
+    force_refresh_cache: bool = False,
+    batch_size: int = 10_000,
+) -> Iterator[pd.DataFrame]:
+    """Iterate over the tasks on OpenML, one page of at most ``batch_size`` at a time.
+
+    Takes the same filters as :func:`list_tasks` (as keyword arguments), but yields every
+    page as soon as it has been received instead of returning all of them at once. Pages are
+    only requested while the iteration goes on.
+
+    Parameters
+    ----------
+    force_refresh_cache : bool (default=False)
+        If True, cached listings are ignored, see :func:`list_tasks`.
+    batch_size : int, optional (default=10000)
+        The number of tasks per page.
+
+    Yields
+    ------
+    dataframe
+        The tasks of one page, with the same columns as returned by :func:`list_tasks`.
+    """
     listing_call = partial(
         _list_tasks,
         task_type=task_type,
@@ -186,18 +254,22 @@ def list_tasks(  # noqa: PLR0913
         number_features=number_features,
         number_classes=number_classes,
         number_missing_values=number_missing_values,
+        force_refresh_cache=force_refresh_cache,
+    )
+    # Not a generator itself, so invalid arguments are reported when it is called
+    return openml.utils._iter_all(
+        listing_call,
+        offset=offset,
+        limit=size,
+        batch_size=batch_size,
     )
-    batches = openml.utils._list_all(listing_call, offset=offset, limit=size)
-    if len(batches) == 0:
-        return pd.DataFrame()
-
-    return pd.concat(batches)
 
 
 def _list_tasks(
     limit: int,
     offset: int,
     task_type: TaskType | int | None = None,
+    force_refresh_cache: bool = False,  # noqa: FBT002
     **kwargs: Any,
 ) -> pd.DataFrame:
     """
@@ -212,6 +284,8 @@ def _list_tasks(
     offset: int
     task_type : TaskType, optional
         Refers to the type of task.
+    force_refresh_cache : bool (default=False)
+        If True, a cached response of the call is ignored.
     kwargs: dict, optional
         Legal filter operators: tag, task_id (list), data_tag, status, limit,
         offset, data_id, data_name, number_instances, number_features,
@@ -236,16 +310,22 @@ def _list_tasks(
                     value = ",".join([str(int(i)) for i in value])  # noqa: PLW2901
                 api_call += f"/{operator}/{value}"
 
-    return __list_tasks(api_call=api_call)
+    return __list_tasks(api_call=api_call, force_refresh_cache=force_refresh_cache)
 
 
-def __list_tasks(api_call: str) -> pd.DataFrame:  # noqa: C901, PLR0912
+def __list_tasks(  # noqa: C901, PLR0912
+    api_call: str,
+    *,
+    force_refresh_cache: bool = False,
+) -> pd.DataFrame:
     """Returns a Pandas DataFrame with information about OpenML tasks.
 
     Parameters
     ----------
     api_call : str
         The API call specifying which tasks to return.
+    force_refresh_cache : bool (default=False)
+        If True, a cached response of the call is ignored.
 
     Returns
     -------
@@ -259,35 +339,22 @@ def __list_tasks(api_call: str) -> pd.DataFrame:  # noqa: C901, PLR0912
     KeyError
         If an invalid key is found in the XML for a task.
     """
-    xml_string = openml._api_calls._perform_api_call(api_call, "get")
-    tasks_dict = xmltodict.parse(xml_string, force_list=("oml:task", "oml:input"))
-    # Minimalistic check if the XML is useful
-    if "oml:tasks" not in tasks_dict:
-        raise ValueError(f'Error in return XML, does not contain "oml:runs": {tasks_dict}')
-
-    if "@xmlns:oml" not in tasks_dict["oml:tasks"]:
-        raise ValueError(
-            f'Error in return XML, does not contain "oml:runs"/@xmlns:oml: {tasks_dict}'
-        )
-
-    if tasks_dict["oml:tasks"]["@xmlns:oml"] != "http://openml.org/openml":
-        raise ValueError(
-            "Error in return XML, value of  "
-            '"oml:runs"/@xmlns:oml is not '
-            f'"http://openml.org/openml": {tasks_dict!s}',
-        )
-
-    assert isinstance(tasks_dict["oml:tasks"]["oml:task"], list), type(tasks_dict["oml:tasks"])
-
-    tasks = {}
+    response = openml._api_calls._perform_read_call(
+        api_call,
+        force_refresh_cache=force_refresh_cache,
+    )
+    tasks = openml.utils._ListingColumns()
     procs = _get_estimation_procedure_list()
     proc_dict = {x["id"]: x for x in procs}
 
-    for task_ in tasks_dict["oml:tasks"]["oml:task"]:
+    records = openml.utils._iter_listing_records(
+        response, "tasks", "task", nested=("input", "quality")
+    )
+    for fields in records:
         tid = None
         try:
-            tid = int(task_["oml:task_id"])
-            task_type_int = int(task_["oml:task_type_id"])
+            tid = int(fields["task_id"])
+            task_type_int = int(fields["task_type_id"])
             try:
                 task_type_id = TaskType(task_type_int)
             except ValueError as e:
@@ -298,52 +365,84 @@ def __list_tasks(api_call: str) -> pd.DataFrame:  # noqa: C901, PLR0912
                 )
                 continue
 
-            task = {
+            task: dict[str, Any] = {
                 "tid": tid,
                 "ttid": task_type_id,
-                "did": int(task_["oml:did"]),
-                "name": task_["oml:name"],
-                "task_type": task_["oml:task_type"],
-                "status": task_["oml:status"],
+                "did": int(fields["did"]),
+                "name": fields["name"],
+                "task_type": fields["task_type"],
+                "status": fields["status"],
             }
 
             # Other task inputs
-            for _input in task_.get("oml:input", []):
-                if _input["@name"] == "estimation_procedure":
-                    task[_input["@name"]] = proc_dict[int(_input["#text"])]["name"]
+            for _input in fields.get("input", []):
+                input_name = _input["name"]
+                value = _input["value"]
+                if input_name == "estimation_procedure":
+                    task[input_name] = proc_dict[int(value)]["name"]  # type: ignore[arg-type]
                 else:
-                    value = _input.get("#text")
-                    task[_input["@name"]] = value
+                    task[input_name] = value
 
             # The number of qualities can range from 0 to infinity
-            for quality in task_.get("oml:quality", []):
-                if "#text" not in quality:
-                    quality_value = 0.0
+            for quality in fields.get("quality", []):
+                text = quality["value"]
+                if text is None:
+                    quality_value: float = 0.0
                 else:
-                    quality["#text"] = float(quality["#text"])
-                    if abs(int(quality["#text"]) - quality["#text"]) < 0.0000001:
-                        quality["#text"] = int(quality["#text"])
-                    quality_value = quality["#text"]
-                task[quality["@name"]] = quality_value
-            tasks[tid] = task
+                    quality_value = float(text)
+                    if abs(int(quality_value) - quality_value) < 0.0000001:
+                        quality_value = int(quality_value)
+                task[quality["name"]] = quality_value
         except KeyError as e:
             if tid is not None:
                 warnings.warn(
-                    f"Invalid xml for task {tid}: {e}\nFrom {task_}",
+                    f"Invalid xml for task {tid}: {e}\nFrom {fields}",
                     RuntimeWarning,
                     stacklevel=2,
                 )
             else:
-                warnings.warn(f"Could not find key {e} in {task_}!", RuntimeWarning, stacklevel=2)
+                warnings.warn(f"Could not find key {e} in {fields}!", RuntimeWarning, stacklevel=2)
+            continue
+        tasks.add_row(task.items())
 
-    return pd.DataFrame.from_dict(tasks, orient="index")
+    if tasks.n_rows == 0:
+        return pd.DataFrame()
+    return tasks.to_frame(index="tid")
 
 
+@overload
 def get_tasks(
+    task_ids: list[int],
+    download_data: bool | None = ...,
+    download_qualities: bool | None = ...,
+    *,
+    max_workers: int | None = ...,
+    executor: Executor | None = ...,
+    return_exceptions: Literal[False] = ...,
+) -> list[OpenMLTask]: ...
+
+
+@overload
+def get_tasks(
+    task_ids: list[int],
+    download_data: bool | None = ...,
+    download_qualities: bool | None = ...,
+    *,
+    max_workers: int | None = ...,
+    executor: Executor | None = ...,
+    return_exceptions: Literal[True],
+) -> list[OpenMLTask | Exception]: ...
+
+
+def get_tasks(  # noqa: PLR0913
     task_ids: list[int],
     download_data: bool | None = None,
     download_qualities: bool | None = None,
-) -> list[OpenMLTask]:
+    *,
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+    return_exceptions: bool = False,
+) -> list[OpenMLTask] | list[OpenMLTask | Exception]:
     """Download tasks.
 
     This function iterates :meth:`openml.tasks.get_task`.
@@ -356,10 +455,19 @@ def get_tasks(
         Option to trigger download of data along with the meta data.
     download_qualities : bool (default=True)
         Option to download 'qualities' meta-data in addition to the minimal dataset description.
+    max_workers : int, optional (default=None)
+        Number of threads used to download the tasks concurrently.
+        If None (and no ``executor`` is given), the tasks are downloaded one after another.
+    executor : concurrent.futures.Executor, optional (default=None)
+        Executor to submit the downloads to, instead of creating a thread pool.
+    return_exceptions : bool (default=False)
+        If True, an exception raised for a task is returned in its place in the result
+        list instead of aborting the whole batch.
 
     Returns
     -------
     list
+        The tasks, in the order of ``task_ids``.
     """
     if download_data is None:
         warnings.warn(
@@ -377,12 +485,13 @@ def get_tasks(
         )
         download_qualities = True
 
-    tasks = []
-    for task_id in task_ids:
-        tasks.append(
-            get_task(task_id, download_data=download_data, download_qualities=download_qualities)
-        )
-    return tasks
+    return openml.utils._map_ids(  # type: ignore
+        partial(get_task, download_data=download_data, download_qualities=download_qualities),
+        task_ids,
+        max_workers=max_workers,
+        executor=executor,
+        return_exceptions=return_exceptions,
+    )
 
 
 @openml.utils.thread_safe_if_oslo_installed
@@ -448,7 +557,9 @@ def _get_task_description(task_id: int) -> OpenMLTask:
 
         with xml_file.open("w", encoding="utf8") as fh:
             fh.write(task_xml)
-        return _create_task_from_xml(task_xml)
+        task = _create_task_from_xml(task_xml)
+        openml._cache_index._index_task(task)
+        return task
 
 
 def _create_task_from_xml(xml: str) -> OpenMLTask:
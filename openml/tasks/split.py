@@ -1,14 +1,16 @@
 # License: BSD 3-Clause
 from __future__ import annotations
 
-import pickle
+import os
+import threading
+import zipfile
 from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 from typing_extensions import NamedTuple
 
-import arff  # type: ignore
 import numpy as np
+import pandas as pd
 
 
 class Split(NamedTuple):
@@ -91,74 +93,39 @@ class OpenMLSplit:  # noqa: PLW1641
         return True
 
     @classmethod
-    def _from_arff_file(cls, filename: Path) -> OpenMLSplit:  # noqa: C901, PLR0912
-        repetitions = None
-        name = None
-
-        pkl_filename = filename.with_suffix(".pkl.py3")
-
-        if pkl_filename.exists():
-            with pkl_filename.open("rb") as fh:
-                # TODO(eddiebergman): Would be good to figure out what _split is and assert it is
-                _split = pickle.load(fh)  # noqa: S301
-            repetitions = _split["repetitions"]
-            name = _split["name"]
-
-        # Cache miss
-        if repetitions is None:
-            # Faster than liac-arff and sufficient in this situation!
+    def _from_arff_file(cls, filename: Path) -> OpenMLSplit:
+        npz_filename = filename.with_suffix(".npz")
+
+        try:
+            with np.load(npz_filename, allow_pickle=False) as cached:
+                name = str(cached["name"])
+                keys, rowids, offsets = cached["keys"], cached["rowids"], cached["offsets"]
+        except (OSError, EOFError, KeyError, ValueError, zipfile.BadZipFile):
+            # Cache miss (or unreadable cache)
             if not filename.exists():
-                raise FileNotFoundError(f"Split arff {filename} does not exist!")
-
-            file_data = arff.load(filename.open("r"), return_type=arff.DENSE_GEN)
-            splits = file_data["data"]
-            name = file_data["relation"]
-            attrnames = [attr[0] for attr in file_data["attributes"]]
-
-            repetitions = OrderedDict()
-
-            type_idx = attrnames.index("type")
-            rowid_idx = attrnames.index("rowid")
-            repeat_idx = attrnames.index("repeat")
-            fold_idx = attrnames.index("fold")
-            sample_idx = attrnames.index("sample") if "sample" in attrnames else None
-
-            for line in splits:
-                # A line looks like type, rowid, repeat, fold
-                repetition = int(line[repeat_idx])
-                fold = int(line[fold_idx])
-                sample = 0
-                if sample_idx is not None:
-                    sample = int(line[sample_idx])
-
-                if repetition not in repetitions:
-                    repetitions[repetition] = OrderedDict()
-                if fold not in repetitions[repetition]:
-                    repetitions[repetition][fold] = OrderedDict()
-                if sample not in repetitions[repetition][fold]:
-                    repetitions[repetition][fold][sample] = ([], [])
-                split = repetitions[repetition][fold][sample]
-
-                type_ = line[type_idx]
-                if type_ == "TRAIN":
-                    split[0].append(line[rowid_idx])
-                elif type_ == "TEST":
-                    split[1].append(line[rowid_idx])
-                else:
-                    raise ValueError(type_)
-
-            for repetition in repetitions:
-                for fold in repetitions[repetition]:
-                    for sample in repetitions[repetition][fold]:
-                        repetitions[repetition][fold][sample] = Split(
-                            np.array(repetitions[repetition][fold][sample][0], dtype=np.int32),
-                            np.array(repetitions[repetition][fold][sample][1], dtype=np.int32),
-                        )
-
-            with pkl_filename.open("wb") as fh:
-                pickle.dump({"name": name, "repetitions": repetitions}, fh, protocol=2)
-
-        assert name is not None
+                raise FileNotFoundError(f"Split arff {filename} does not exist!") from None
+
+            name, columns = _read_split_arff(filename)
+            keys, rowids, offsets = _index_split(**columns)
+
+            # Write to a temporary file first so concurrent readers never see a partial cache
+            tmp_filename = npz_filename.with_suffix(
+                f".{os.getpid()}.{threading.get_ident()}.tmp.npz"
+            )
+            np.savez(tmp_filename, name=name, keys=keys, rowids=rowids, offsets=offsets)
+            tmp_filename.replace(npz_filename)
+
+        # Splits used to be cached as pickle, which is superseded by the npz cache
+        filename.with_suffix(".pkl.py3").unlink(missing_ok=True)
+
+        repetitions: dict[int, dict[int, dict[int, tuple[np.ndarray, np.ndarray]]]] = OrderedDict()
+        for (repetition, fold, sample), start, middle, stop in zip(
+            keys.tolist(), offsets[:-1:2], offsets[1::2], offsets[2::2], strict=True
+        ):
+            folds = repetitions.setdefault(repetition, OrderedDict())
+            samples = folds.setdefault(fold, OrderedDict())
+            samples[sample] = Split(rowids[start:middle], rowids[middle:stop])
+
         return cls(name, "", repetitions)
 
     def get(self, repeat: int = 0, fold: int = 0, sample: int = 0) -> tuple[np.ndarray, np.ndarray]:
@@ -190,3 +157,90 @@ class OpenMLSplit:  # noqa: PLW1641
         if sample not in self.split[repeat][fold]:
             raise ValueError(f"Sample {sample!s} not known")
         return self.split[repeat][fold][sample]
+
+
+def _read_split_arff(filename: Path) -> tuple[str, dict[str, np.ndarray]]:
+    """Read a ``datasplits.arff`` file into flat arrays.
+
+    Returns the relation name and a dict with the ``repeat``, ``fold``, ``sample`` and ``rowid``
+    columns as integer arrays and ``is_test`` as a boolean array.
+    """
+    name = ""
+    attribute_names = []
+    with filename.open("r", encoding="utf8") as fh:
+        for line in fh:
+            header_line = line.strip()
+            keyword = header_line.split(None, 1)[0].lower() if header_line else ""
+            if keyword == "@relation":
+                name = header_line.split(None, 1)[1].strip("'\"")
+            elif keyword == "@attribute":
+                attribute_names.append(header_line.split(None, 2)[1].strip("'\""))
+            elif keyword == "@data":
+                break
+
+        # The data section is plain csv, so it is parsed by pandas' C parser in one go
+        data = pd.read_csv(
+            fh,
+            header=None,
+            names=attribute_names,
+            comment="%",
+            quotechar="'",
+            skipinitialspace=True,
+        )
+
+    types = data["type"].str.strip("'\"").to_numpy()
+    unknown_types = set(types.tolist()) - {"TRAIN", "TEST"}
+    if unknown_types:
+        raise ValueError(unknown_types.pop())
+
+    n_rows = len(data)
+    return name, {
+        "repeat": data["repeat"].to_numpy(dtype=np.int64),
+        "fold": data["fold"].to_numpy(dtype=np.int64),
+        "sample": (
+            data["sample"].to_numpy(dtype=np.int64)
+            if "sample" in data
+            else np.zeros(n_rows, dtype=np.int64)
+        ),
+        "rowid": data["rowid"].to_numpy(dtype=np.int32),
+        "is_test": types == "TEST",
+    }
+
+
+def _index_split(
+    repeat: np.ndarray,
+    fold: np.ndarray,
+    sample: np.ndarray,
+    rowid: np.ndarray,
+    is_test: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Group the row ids of a split by (repeat, fold, sample) and train/test.
+
+    Returns
+    -------
+    keys : np.ndarray, shape (n_splits, 3)
+        The (repeat, fold, sample) of every split, in sorted order.
+    rowids : np.ndarray
+        All row ids, ordered by split and with the train ids before the test ids of a split.
+        Within each, the order of the split file is kept.
+    offsets : np.ndarray, shape (2 * n_splits + 1,)
+        Split ``i`` has train ids ``rowids[offsets[2i]:offsets[2i+1]]`` and test ids
+        ``rowids[offsets[2i+1]:offsets[2i+2]]``.
+    """
+    # lexsort is stable, so the order of the split file is kept within each group
+    order = np.lexsort((is_test, sample, fold, repeat))
+    rowids = rowid[order]
+    split_keys = np.stack([repeat[order], fold[order], sample[order]], axis=1)
+    keys, split_starts = np.unique(split_keys, axis=0, return_index=True)
+
+    n_test = (
+        np.add.reduceat(is_test[order].astype(np.int64), split_starts)
+        if len(order)
+        else np.zeros(0, dtype=np.int64)
+    )
+    split_stops = np.append(split_starts[1:], len(order))
+    offsets = np.empty(2 * len(keys) + 1, dtype=np.int64)
+    offsets[0:-1:2] = split_starts
+    offsets[1::2] = split_stops - n_test
+    offsets[-1] = len(order)
+    return keys, rowids, offsets
@@ -13,6 +13,7 @@ from typing_extensions import TypedDict
 
 import openml._api_calls
 import openml.config
+import openml.utils
 from openml import datasets
 from openml.base import OpenMLBase
 from openml.utils import _create_cache_directory_for_id
@@ -184,12 +185,16 @@ class OpenMLTask(OpenMLBase):
         cache_dir = _create_cache_directory_for_id("tasks", self.task_id)
         cached_split_file = cache_dir / "datasplits.arff"
 
-        try:
-            split = OpenMLSplit._from_arff_file(cached_split_file)
-        except OSError:
-            # Next, download and cache the associated split file
-            self._download_split(cached_split_file)
-            split = OpenMLSplit._from_arff_file(cached_split_file)
+        with openml.utils._pinned_cache_dir(cache_dir):
+            try:
+                split = OpenMLSplit._from_arff_file(cached_split_file)
+            except OSError:
+                # Next, download and cache the associated split file
+                self._download_split(cached_split_file)
+                split = OpenMLSplit._from_arff_file(cached_split_file)
+
+            openml.utils._mark_cache_dir_used(cache_dir)
+            openml.utils._evict_data_files(cache_dir)
 
         return split
 
@@ -2,21 +2,32 @@
 from __future__ import annotations
 
 import contextlib
+import itertools
+import logging
+import os
 import shutil
+import threading
+import time
 import warnings
-from collections.abc import Callable, Mapping, Sized
-from functools import wraps
+import weakref
+from collections import Counter, deque
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping, Sequence, Sized
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from functools import partial, wraps
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal, TypeVar, overload
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast, overload
 from typing_extensions import ParamSpec
+from xml.etree import ElementTree
 
 import numpy as np
+import pandas as pd
 import xmltodict
 from minio.helpers import ProgressType
 from tqdm import tqdm
 
 import openml
 import openml._api_calls
+import openml._cache_index
 import openml.exceptions
 
 from . import config
@@ -28,6 +39,35 @@ if TYPE_CHECKING:
     P = ParamSpec("P")
     R = TypeVar("R")
     _SizedT = TypeVar("_SizedT", bound=Sized)
+    _IdT = TypeVar("_IdT", bound=Hashable)
+
+OPENML_XML_NAMESPACE = "http://openml.org/openml"
+_OML = f"{{{OPENML_XML_NAMESPACE}}}"
+# Number of characters of a listing response handed to the XML parser at a time
+_XML_CHUNK_SIZE = 2**16
+
+logger = logging.getLogger(__name__)
+
+# The data files of the cached entities by the name of their cache directory. Only these files
+# count towards ``config.data_cache_max_mb``, the metadata next to them is never evicted.
+_DATA_FILE_PATTERNS = {"datasets": "dataset*", "tasks": "datasplits*"}
+# Data files which are created from the downloaded ones, so they can be evicted more cheaply
+_DERIVED_DATA_FILE_SUFFIXES = (".pkl.py3", ".feather", ".arrow", ".npz")
+
+# The size of the data files of each cached entity by the cache directory, as last seen by this
+# process. It is kept up to date with the entities this process uses, so the whole cache is only
+# walked when it is over ``config.data_cache_max_mb``.
+_data_file_sizes: dict[Path, dict[Path, int]] = {}
+_data_file_sizes_lock = threading.Lock()
+
+# Cache directories of entities in use by this process, with the number of their users
+_pinned_cache_dirs: Counter[Path] = Counter()
+_pinned_cache_dirs_lock = threading.Lock()
+
+# In-process locks used by ``thread_safe_if_oslo_installed`` when oslo is not available.
+# A lock is dropped once no thread holds or waits for it, so they do not pile up for every id.
+_thread_locks: weakref.WeakValueDictionary[str, threading.RLock] = weakref.WeakValueDictionary()
+_thread_locks_guard = threading.Lock()
 
 
 @overload
@@ -87,6 +127,228 @@ def extract_xml_tags(
     raise ValueError(f"Could not find tag '{xml_tag_name}' in node '{node!s}'")
 
 
+def _iter_listing_records(
+    response: Any,
+    listing: str,
+    record: str,
+    *,
+    nested: Iterable[str] = (),
+) -> Iterator[dict[str, Any]]:
+    """Yield the records of a listing response in XML or JSON one by one.
+
+    Either way, a record is a dict of the texts of its fields as given by ``_xml_fields``.
+    Fields with a tag in ``nested``, such as qualities, become lists of dicts with the
+    attributes and fields of each occurrence, or its text under the key ``value``.
+
+    Parameters
+    ----------
+    response : str or Any
+        A response of ``openml._api_calls._perform_read_call``, which is either the XML
+        response as a string or the decoded JSON response.
+    listing : str
+        Name of the listing without the ``oml:`` prefix, e.g. ``data``.
+    record : str
+        Name of the records without the ``oml:`` prefix, e.g. ``dataset``.
+    nested : Iterable[str]
+        Names of the fields which are records themselves.
+
+    Yields
+    ------
+    dict
+        A record.
+    """
+    nested = set(nested)
+    if not isinstance(response, str):
+        yield from _iter_json_records(response, listing, record, nested)
+        return
+
+    for element in _iter_xml_records(response, listing, record):
+        fields = _xml_fields(element, exclude=nested)
+        for child in element:
+            name = child.tag.replace(_OML, "")
+            if name in nested:
+                values: dict[str, Any] = dict(child.attrib)
+                if len(child):
+                    values.update(_xml_fields(child))
+                else:
+                    values["value"] = _xml_text(child)
+                fields.setdefault(name, []).append(values)
+        yield fields
+
+
+def _iter_json_records(
+    response: Any,
+    listing: str,
+    record: str,
+    nested: set[str],
+) -> Iterator[dict[str, Any]]:
+    try:
+        records = response[listing].get(record, [])
+    except (AttributeError, KeyError, TypeError):
+        raise ValueError(
+            f'Error in return JSON, does not contain "{listing}": {str(response)[:1000]}',
+        ) from None
+
+    for record_ in records if isinstance(records, list) else [records]:
+        fields: dict[str, Any] = {}
+        for name, value in record_.items():
+            if name in nested:
+                fields[name] = [
+                    {key: _json_text(item_value) for key, item_value in item.items()}
+                    for item in (value if isinstance(value, list) else [value])
+                ]
+            elif isinstance(value, list):
+                # As in XML, a field which occurs only once is not a list
+                texts = [_json_text(item) for item in value]
+                fields[name] = texts[0] if len(texts) == 1 else texts
+            else:
+                fields[name] = _json_text(value)
+        yield fields
+
+
+def _json_text(value: Any) -> str | None:
+    """A value of a JSON response as the text of an XML element, see ``_xml_text``."""
+    if value is None:
+        return None
+    text = value.strip() if isinstance(value, str) else str(value)
+    return text or None
+
+
+def _iter_xml_records(xml_string: str, listing: str, record: str) -> Iterator[ElementTree.Element]:
+    """Parse a listing incrementally and yield the elements of its records one by one.
+
+    Each record is removed from the tree once the next one is requested, so the memory needed
+    does not grow with the size of the listing.
+
+    Parameters
+    ----------
+    xml_string : str
+        The response of a listing call.
+    listing : str
+        Tag of the root element without the ``oml:`` prefix, e.g. ``data``.
+    record : str
+        Tag of the records without the ``oml:`` prefix, e.g. ``dataset``.
+
+    Yields
+    ------
+    xml.etree.ElementTree.Element
+        A record. Its tag and the tags of its children are prefixed with ``_OML``.
+
+    Raises
+    ------
+    ValueError
+        If the root element is not ``oml:<listing>`` in the OpenML namespace.
+    """
+    parser: ElementTree.XMLPullParser = ElementTree.XMLPullParser(
+        events=("start", "end"),
+    )
+    root: ElementTree.Element | None = None
+    record_tag = _OML + record
+    for start in range(0, len(xml_string), _XML_CHUNK_SIZE):
+        parser.feed(xml_string[start : start + _XML_CHUNK_SIZE])
+        # With only "start" and "end" events, every event is an element
+        events = cast("Iterator[tuple[str, ElementTree.Element]]", parser.read_events())
+        for event, element in events:
+            if root is None:
+                if element.tag != _OML + listing:
+                    raise ValueError(
+                        f'Error in return XML, does not contain "oml:{listing}" in the '
+                        f'"{OPENML_XML_NAMESPACE}" namespace: {xml_string[:1000]}',
+                    )
+                root = element
+            elif event == "end" and element.tag == record_tag:
+                yield element
+                root.clear()
+    parser.close()
+    if root is None:
+        raise ValueError(f'Error in return XML, does not contain "oml:{listing}": {xml_string}')
+
+
+def _xml_text(element: ElementTree.Element) -> str | None:
+    """The text of ``element`` the way ``xmltodict`` parses it: stripped, and None if empty."""
+    text = element.text
+    return (text.strip() or None) if text is not None else None
+
+
+def _xml_fields(element: ElementTree.Element, exclude: Iterable[str] = ()) -> dict[str, Any]:
+    """The texts of the children of ``element`` by tag without the ``oml:`` prefix.
+
+    As with ``xmltodict``, the texts of a tag which occurs more than once, such as a tag,
+    are collected in a list. Children with a tag in ``exclude`` are skipped.
+    """
+    fields: dict[str, Any] = {}
+    for child in element:
+        name = child.tag.replace(_OML, "")
+        if name in exclude:
+            continue
+        text = _xml_text(child)
+        if name not in fields:
+            fields[name] = text
+        elif isinstance(fields[name], list):
+            fields[name].append(text)
+        else:
+            fields[name] = [fields[name], text]
+    return fields
+
+
+class _ListingColumns:
+    """Column buffers for the records of a listing, which do not all have the same fields.
+
+    Every value is stored with the number of its row, so missing values are only filled in
+    once, when the DataFrame is built.
+    """
+
+    def __init__(self) -> None:
+        self.n_rows = 0
+        self._rows: dict[str, list[int]] = {}
+        self._values: dict[str, list[Any]] = {}
+
+    def add_row(self, fields: Iterable[tuple[str, Any]]) -> None:
+        """Add a row with the given ``(column, value)`` pairs."""
+        row = self.n_rows
+        for name, value in fields:
+            values = self._values.get(name)
+            if values is None:
+                self._rows[name] = [row]
+                self._values[name] = [value]
+            else:
+                self._rows[name].append(row)
+                values.append(value)
+        self.n_rows += 1
+
+    def to_frame(
+        self,
+        index: str,
+        converters: Mapping[str, Callable[[list[Any]], Any]] | None = None,
+    ) -> pd.DataFrame:
+        """Build the DataFrame of all rows, indexed by the values of column ``index``.
+
+        The columns are in the order in which they first occurred. ``converters`` maps
+        column names to functions which convert the list of values of that column at once.
+        Missing values are NaN.
+        """
+        converters = {} if converters is None else converters
+        columns = {}
+        for name, values in self._values.items():
+            rows = self._rows[name]
+            if name in converters:
+                column = pd.Series(converters[name](values), index=rows)
+                columns[name] = column.reindex(range(self.n_rows))
+            elif len(rows) == self.n_rows:
+                columns[name] = pd.Series(values)
+            else:
+                # Infer the dtype from all values, as pandas does when building from records
+                full_values = [np.nan] * self.n_rows
+                for row, value in zip(rows, values, strict=True):
+                    full_values[row] = value
+                columns[name] = pd.Series(full_values)
+
+        frame = pd.DataFrame(columns, index=pd.RangeIndex(self.n_rows))
+        if self.n_rows > 0:
+            frame.index = pd.Index(frame[index].to_numpy())
+        return frame
+
+
 def _get_rest_api_type_alias(oml_object: OpenMLBase) -> str:
     """Return the alias of the openml entity as it is defined for the REST API."""
     rest_api_mapping: list[tuple[type | tuple, str]] = [
@@ -238,12 +500,13 @@ def _delete_entity(entity_type: str, entity_id: int) -> bool:
         raise e
 
 
-def _list_all(  # noqa: C901
+def _list_all(
     listing_call: Callable[[int, int], _SizedT],
     *,
     limit: int | None = None,
     offset: int | None = None,
     batch_size: int | None = 10_000,
+    max_concurrent_pages: int | None = None,
 ) -> list[_SizedT]:
     """Helper to handle paged listing requests.
 
@@ -264,14 +527,45 @@ def _list_all(  # noqa: C901
         The total size of the listing. If not provided, the function will
         request the first batch and then continue until no more results are
         returned
+    max_concurrent_pages : int, optional
+        The maximum number of pages which are requested at the same time. Defaults to
+        ``config.max_concurrent_pages``. If larger than one, the following pages are requested
+        ahead in threads as soon as their offsets are known: right away if ``limit`` is given,
+        otherwise once the first page turned out to be full.
 
     Returns
     -------
     List of types returned from type of the listing call
     """
-    page = 0
-    results: list[_SizedT] = []
+    return list(
+        _iter_all(
+            listing_call,
+            limit=limit,
+            offset=offset,
+            batch_size=batch_size,
+            max_concurrent_pages=max_concurrent_pages,
+        ),
+    )
+
 
+def _iter_all(
+    listing_call: Callable[[int, int], _SizedT],
+    *,
+    limit: int | None = None,
+    offset: int | None = None,
+    batch_size: int | None = 10_000,
+    max_concurrent_pages: int | None = None,
+) -> Iterator[_SizedT]:
+    """Lazily request the pages of a paged listing, see ``_list_all`` for the parameters.
+
+    The arguments are validated right away, but a page is only requested once the iteration
+    gets to it (or, with ``max_concurrent_pages`` larger than one, to one of the pages
+    before it). Stopping the iteration early stops requesting pages.
+
+    Returns
+    -------
+    Iterator over the results of the listing call, one per page
+    """
     offset = offset if offset is not None else 0
     batch_size = batch_size if batch_size is not None else 10_000
 
@@ -295,7 +589,36 @@ def _list_all(  # noqa: C901
     if not isinstance(offset, int):
         raise ValueError(f"'offset' should be an integer but got {offset}")
 
-    batch_size = BATCH_SIZE_ORIG
+    if max_concurrent_pages is None:
+        max_concurrent_pages = config.max_concurrent_pages
+    if max_concurrent_pages < 1:
+        raise ValueError(
+            f"'max_concurrent_pages' should be positive but got {max_concurrent_pages}",
+        )
+    if max_concurrent_pages > 1:
+        return _iter_all_concurrently(
+            listing_call,
+            limit=LIMIT,
+            offset=offset,
+            batch_size=BATCH_SIZE_ORIG,
+            max_concurrent_pages=max_concurrent_pages,
+        )
+    return _iter_all_sequentially(
+        listing_call, limit=LIMIT, offset=offset, batch_size=BATCH_SIZE_ORIG
+    )
+
+
+def _iter_all_sequentially(
+    listing_call: Callable[[int, int], _SizedT],
+    *,
+    limit: int | None,
+    offset: int,
+    batch_size: int,
+) -> Iterator[_SizedT]:
+    """Request the pages of a listing one after the other."""
+    page = 0
+    n_received = 0
+    BATCH_SIZE_ORIG = batch_size
     while True:
         try:
             current_offset = offset + BATCH_SIZE_ORIG * page
@@ -305,7 +628,8 @@ def _list_all(  # noqa: C901
             # to enforce it...
             break
 
-        results.append(new_batch)
+        n_received += len(new_batch)
+        yield new_batch
 
         # If the batch is less than our requested batch_size, that's the last batch
         # and we can bail out.
@@ -313,19 +637,78 @@ def _list_all(  # noqa: C901
             break
 
         page += 1
-        if LIMIT is not None:
+        if limit is not None:
             # check if the number of required results has been achieved
             # always do a 'bigger than' check,
             # in case of bugs to prevent infinite loops
-            n_received = sum(len(result) for result in results)
-            if n_received >= LIMIT:
+            if n_received >= limit:
                 break
 
             # check if there are enough results to fulfill a batch
-            if LIMIT - n_received < BATCH_SIZE_ORIG:
-                batch_size = LIMIT - n_received
+            if limit - n_received < BATCH_SIZE_ORIG:
+                batch_size = limit - n_received
+
 
-    return results
+def _iter_all_concurrently(  # noqa: C901
+    listing_call: Callable[[int, int], _SizedT],
+    *,
+    limit: int | None,
+    offset: int,
+    batch_size: int,
+    max_concurrent_pages: int,
+) -> Iterator[_SizedT]:
+    """Request the pages of a listing with up to ``max_concurrent_pages`` requests in flight.
+
+    The pages are requested in the order of their offsets and their results are processed in
+    that order, with the same stop conditions as ``_iter_all_sequentially``. Pages which were
+    requested beyond the last page are discarded.
+    """
+    limit_is_known = limit is not None and not np.isinf(limit)
+
+    def _pages() -> Iterator[tuple[int, int]]:
+        """Yield the offset and size of every page which may be requested."""
+        for page in itertools.count():
+            if limit is None or not limit_is_known:
+                yield offset + batch_size * page, batch_size
+                continue
+            remaining = limit - batch_size * page
+            if page > 0 and remaining <= 0:
+                return
+            yield offset + batch_size * page, min(batch_size, remaining)
+
+    pages = _pages()
+    in_flight: deque[tuple[int, Future[_SizedT]]] = deque()
+    # Without a limit, only the first page is requested until it turns out to be full
+    window = max_concurrent_pages if limit_is_known else 1
+    n_received = 0
+
+    pool = ThreadPoolExecutor(max_workers=max_concurrent_pages)
+    try:
+        while True:
+            while len(in_flight) < window and (page := next(pages, None)) is not None:
+                page_offset, page_size = page
+                in_flight.append((page_size, pool.submit(listing_call, page_size, page_offset)))
+            if not in_flight:
+                break
+
+            page_size, future = in_flight.popleft()
+            try:
+                new_batch = future.result()
+            except openml.exceptions.OpenMLServerNoResult:
+                break
+
+            n_received += len(new_batch)
+            yield new_batch
+
+            # A page with less results than requested is the last page
+            if len(new_batch) < page_size:
+                break
+            if limit is not None and n_received >= limit:
+                break
+            window = max_concurrent_pages
+    finally:
+        # Do not wait for requests of pages beyond the last page, or after the caller stopped
+        pool.shutdown(wait=False, cancel_futures=True)
 
 
 def _get_cache_dir_for_key(key: str) -> Path:
@@ -396,9 +779,171 @@ def _remove_cache_dir_for_id(key: str, cache_dir: Path) -> None:
         raise ValueError(
             f"Cannot remove faulty {key} cache directory {cache_dir}. Please do this manually!",
         ) from e
+    if cache_dir.name.isdigit():
+        openml._cache_index._remove_from_index(key, int(cache_dir.name))
+
+
+def _pin_cache_dir(cache_dir: Path, owner: object | None = None) -> None:
+    """Protect the data files in ``cache_dir`` from eviction.
+
+    If ``owner`` is given, the directory is unpinned once ``owner`` is garbage collected,
+    otherwise with ``_unpin_cache_dir``.
+    """
+    cache_dir = Path(cache_dir).resolve()
+    with _pinned_cache_dirs_lock:
+        _pinned_cache_dirs[cache_dir] += 1
+    if owner is not None:
+        weakref.finalize(owner, _unpin_cache_dir, cache_dir)
+
+
+def _unpin_cache_dir(cache_dir: Path) -> None:
+    cache_dir = Path(cache_dir).resolve()
+    with _pinned_cache_dirs_lock:
+        _pinned_cache_dirs[cache_dir] -= 1
+        if _pinned_cache_dirs[cache_dir] <= 0:
+            del _pinned_cache_dirs[cache_dir]
+
+
+@contextlib.contextmanager
+def _pinned_cache_dir(cache_dir: Path) -> Iterator[None]:
+    """Protect the data files in ``cache_dir`` from eviction within the context."""
+    _pin_cache_dir(cache_dir)
+    try:
+        yield
+    finally:
+        _unpin_cache_dir(cache_dir)
+
+
+def _mark_cache_dir_used(cache_dir: Path) -> None:
+    """Record the use of the data files in ``cache_dir`` for the eviction of the least recently
+    used data.
+
+    The access time of the files is set explicitly, as file systems are often mounted to not
+    update it on reads.
+    """
+    pattern = _DATA_FILE_PATTERNS.get(Path(cache_dir).parent.name)
+    if pattern is None:
+        return
+    now = time.time()
+    for data_file in Path(cache_dir).glob(pattern):
+        with contextlib.suppress(OSError):
+            os.utime(data_file, (now, data_file.stat().st_mtime))
+
+
+def _evict_data_files(cache_dir: Path | None = None) -> None:
+    """Remove cached data files until they fit in ``config.data_cache_max_mb``.
+
+    The data of the least recently used entities is removed first, but their pickle, feather
+    and arrow copies go before any of the downloaded files, which are more expensive to get
+    back. The metadata of the entities is kept, and the data of pinned entities is skipped.
+    Evicted data files are created again when they are needed.
+
+    Parameters
+    ----------
+    cache_dir : Path, optional (default=None)
+        Cache directory of the entity whose data files were just created or used. Only these
+        files are looked at, unless the size of the cache exceeds the budget (or this process
+        has not seen the whole cache yet).
+    """
+    if config.data_cache_max_mb <= 0:
+        return
+    cache_directory = Path(config.get_cache_directory()).resolve()
+    max_bytes = config.data_cache_max_mb * 2**20
+    try:
+        with _data_file_sizes_lock:
+            sizes = _data_file_sizes.get(cache_directory)
+            if sizes is not None and cache_dir is not None:
+                _update_data_file_size(sizes, cache_directory, Path(cache_dir).resolve())
+            if sizes is not None and sum(sizes.values()) <= max_bytes:
+                return
+            _data_file_sizes[cache_directory] = __evict_data_files(cache_directory, max_bytes)
+    except OSError as e:
+        logger.warning("Could not evict cached data files: %s", e)
+
+
+def _update_data_file_size(sizes: dict[Path, int], cache_directory: Path, cache_dir: Path) -> None:
+    """Record the current size of the data files in the entity directory ``cache_dir``."""
+    pattern = _DATA_FILE_PATTERNS.get(cache_dir.parent.name)
+    if pattern is None or cache_dir.parent.parent != cache_directory:
+        return
+    size = sum(stat.st_size for _, stat in _stat_data_files(cache_dir, pattern))
+    if size:
+        sizes[cache_dir] = size
+    else:
+        sizes.pop(cache_dir, None)
+
+
+def __evict_data_files(cache_directory: Path, max_bytes: float) -> dict[Path, int]:
+    """Evict data files from the whole cache, and return the size of what remains by entity."""
+    with _pinned_cache_dirs_lock:
+        pinned_cache_dirs = set(_pinned_cache_dirs)
+
+    entries = []
+    for cache_dir, data_files in _iter_cached_data_files(cache_directory):
+        last_used = max(stat.st_atime for _, stat in data_files)
+        cache_dir = cache_dir.resolve()  # noqa: PLW2901
+        is_pinned = cache_dir in pinned_cache_dirs
+        for data_file, stat in data_files:
+            is_downloaded = not data_file.name.endswith(_DERIVED_DATA_FILE_SUFFIXES)
+            entries.append(
+                ((is_downloaded, last_used), stat.st_size, data_file, cache_dir, is_pinned)
+            )
+
+    total_bytes = sum(size for _, size, *_ in entries)
+    sizes: Counter[Path] = Counter()
+    for _, size, data_file, cache_dir, is_pinned in sorted(entries, key=lambda entry: entry[0]):
+        if total_bytes <= max_bytes or is_pinned:
+            sizes[cache_dir] += size
+            continue
+        with contextlib.suppress(FileNotFoundError):
+            data_file.unlink()
+            logger.debug("Evicted %s from the cache", data_file)
+        total_bytes -= size
+    return dict(sizes)
+
+
+def _iter_cached_data_files(
+    cache_directory: Path,
+) -> Iterator[tuple[Path, list[tuple[Path, os.stat_result]]]]:
+    """Yield the cache directories of the entities with their data files and their stats."""
+    for key, pattern in _DATA_FILE_PATTERNS.items():
+        if not (cache_directory / key).is_dir():
+            continue
+        for cache_dir in (cache_directory / key).iterdir():
+            data_files = _stat_data_files(cache_dir, pattern)
+            if data_files:
+                yield cache_dir, data_files
+
+
+def _stat_data_files(cache_dir: Path, pattern: str) -> list[tuple[Path, os.stat_result]]:
+    """Return the data files in the entity directory ``cache_dir`` with their stats."""
+    data_files = []
+    for data_file in cache_dir.glob(pattern):
+        # Skip files which are still being written or downloaded
+        if {".tmp", ".part"}.intersection(data_file.suffixes):
+            continue
+        with contextlib.suppress(FileNotFoundError):
+            data_files.append((data_file, data_file.stat()))
+    return data_files
+
+
+def _get_thread_lock(name: str) -> threading.RLock:
+    """Return the process-wide reentrant lock registered under ``name``."""
+    with _thread_locks_guard:
+        lock = _thread_locks.get(name)
+        if lock is None:
+            lock = threading.RLock()
+            _thread_locks[name] = lock
+        return lock
 
 
 def thread_safe_if_oslo_installed(func: Callable[P, R]) -> Callable[P, R]:
+    """Serialize calls to ``func`` which concern the same id.
+
+    If ``oslo.concurrency`` is installed, a file lock in the cache directory is used, which makes
+    the call safe across threads and processes. Otherwise, a lock local to this process is used,
+    which only protects against concurrent calls from multiple threads.
+    """
     try:
         # Currently, importing oslo raises a lot of warning that it will stop working
         # under python3.8; remove this once they disappear
@@ -406,26 +951,109 @@ def thread_safe_if_oslo_installed(func: Callable[P, R]) -> Callable[P, R]:
             warnings.simplefilter("ignore")
             from oslo_concurrency import lockutils
 
-        @wraps(func)
-        def safe_func(*args: P.args, **kwargs: P.kwargs) -> R:
-            # Lock directories use the id that is passed as either positional or keyword argument.
-            id_parameters = [parameter_name for parameter_name in kwargs if "_id" in parameter_name]
-            if len(id_parameters) == 1:
-                id_ = kwargs[id_parameters[0]]
-            elif len(args) > 0:
-                id_ = args[0]
-            else:
-                raise RuntimeError(
-                    f"An id must be specified for {func.__name__}, was passed: ({args}, {kwargs}).",
-                )
-            # The [7:] gets rid of the 'openml.' prefix
-            lock_name = f"{func.__module__[7:]}.{func.__name__}:{id_}"
-            with lockutils.external_lock(name=lock_name, lock_path=_create_lockfiles_dir()):
-                return func(*args, **kwargs)
-
-        return safe_func
+        def _lock(name: str) -> contextlib.AbstractContextManager:
+            return lockutils.external_lock(name=name, lock_path=_create_lockfiles_dir())  # type: ignore
+
     except ImportError:
-        return func
+        _lock = _get_thread_lock
+
+    @wraps(func)
+    def safe_func(*args: P.args, **kwargs: P.kwargs) -> R:
+        # Lock directories use the id that is passed as either positional or keyword argument.
+        id_parameters = [parameter_name for parameter_name in kwargs if "_id" in parameter_name]
+        if len(id_parameters) == 1:
+            id_ = kwargs[id_parameters[0]]
+        elif len(args) > 0:
+            id_ = args[0]
+        else:
+            raise RuntimeError(
+                f"An id must be specified for {func.__name__}, was passed: ({args}, {kwargs}).",
+            )
+        # The [7:] gets rid of the 'openml.' prefix
+        lock_name = f"{func.__module__[7:]}.{func.__name__}:{id_}"
+        with _lock(lock_name):
+            return func(*args, **kwargs)
+
+    return safe_func
+
+
+def _map_ids(
+    fetch: Callable[[_IdT], R],
+    ids: Sequence[_IdT],
+    *,
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+    return_exceptions: bool = False,
+) -> list[R | Exception]:
+    """Call ``fetch`` for every id in ``ids``, optionally concurrently.
+
+    Every distinct id is fetched exactly once, even if it occurs several times in ``ids``
+    (also as both ``1`` and ``"1"``), so the same cache directory is never populated twice by
+    one call. The results are returned in the order of ``ids``.
+
+    Parameters
+    ----------
+    fetch : callable
+        Function which takes a single id, e.g. ``get_task``.
+    ids : sequence
+        The ids to fetch.
+    max_workers : int, optional (default=None)
+        The number of threads used to fetch the ids. If ``None`` and no ``executor`` is
+        given, the ids are fetched sequentially.
+    executor : concurrent.futures.Executor, optional (default=None)
+        An executor to submit the fetches to. It is not shut down afterwards. Takes
+        precedence over ``max_workers``. For a process pool, ``fetch`` must be picklable.
+    return_exceptions : bool (default=False)
+        If ``True``, an exception raised for an id is placed in the result list at the
+        position of that id instead of being raised.
+
+    Returns
+    -------
+    list
+        One result (or exception) per id in ``ids``.
+    """
+    if max_workers is not None and max_workers < 1:
+        raise ValueError(f"`max_workers` must be positive but is {max_workers}.")
+
+    # Ids such as 1 and "1" refer to the same entity, and so to the same cache directory
+    unique_ids: dict[Hashable, _IdT] = {}
+    for id_ in ids:
+        unique_ids.setdefault(_id_key(id_), id_)
+
+    # A module-level callable, so the fetches can also be submitted to a process pool
+    _fetch = partial(_call_with_exceptions, fetch, return_exceptions)
+    if executor is None and max_workers is None:
+        results = [_fetch(id_) for id_ in unique_ids.values()]
+    elif executor is not None:
+        results = list(executor.map(_fetch, unique_ids.values()))
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(_fetch, unique_ids.values()))
+
+    result_by_key = dict(zip(unique_ids, results, strict=True))
+    return [result_by_key[_id_key(id_)] for id_ in ids]
+
+
+def _id_key(id_: Hashable) -> Hashable:
+    """Return the integer id represented by ``id_`` if it is a string like ``"1"``, else ``id_``."""
+    if isinstance(id_, str):
+        with contextlib.suppress(ValueError):
+            return int(id_)
+    return id_
+
+
+def _call_with_exceptions(
+    fetch: Callable[[_IdT], R],
+    return_exceptions: bool,
+    id_: _IdT,
+) -> R | Exception:
+    """Call ``fetch`` with ``id_``, and return the exception it raises if ``return_exceptions``."""
+    if not return_exceptions:
+        return fetch(id_)
+    try:
+        return fetch(id_)
+    except Exception as e:  # noqa: BLE001
+        return e
 
 
 def _create_lockfiles_dir() -> Path:
@@ -0,0 +1,91 @@
+"""Micro-benchmark for decoding nominal ARFF columns with ``OpenMLDataset._unpack_categories``.
+
+Times the decoding of ``--columns`` nominal columns of ``--rows`` integer codes each (with a
+fraction of missing values), as done for every nominal attribute on the first load of an ARFF
+dataset. Compares against the per-element loop that was used before, unless ``--skip-reference``.
+
+Example::
+
+    python scripts/benchmark_unpack_categories.py --rows 1000000 --columns 200 --skip-reference
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from openml.datasets import OpenMLDataset
+
+
+def _reference_unpack_categories(series: pd.Series, categories: list) -> pd.Series:
+    """The per-element implementation ``_unpack_categories`` replaced."""
+
+    def valid_category(cat: Any) -> bool:
+        return isinstance(cat, str) or (cat is not None and not np.isnan(cat))
+
+    filtered_categories = [c for c in categories if valid_category(c)]
+    col = []
+    for x in series:
+        try:
+            col.append(categories[int(x)])
+        except (TypeError, ValueError):
+            col.append(np.nan)
+    raw_cat = pd.Categorical(col, ordered=True, categories=filtered_categories)
+    return pd.Series(raw_cat, index=series.index, name=series.name)
+
+
+def _make_columns(
+    n_rows: int,
+    n_columns: int,
+    n_categories: int,
+    missing: float,
+    seed: int,
+) -> list[pd.Series]:
+    rng = np.random.default_rng(seed)
+    columns = []
+    for i in range(n_columns):
+        codes = rng.integers(0, n_categories, size=n_rows).astype(np.float64)
+        codes[rng.random(n_rows) < missing] = np.nan
+        columns.append(pd.Series(codes, name=f"nominal_{i}"))
+    return columns
+
+
+def _time(unpack: Any, columns: list[pd.Series], categories: list) -> float:
+    start = time.perf_counter()
+    for column in columns:
+        unpack(column, categories)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--columns", type=int, default=100)
+    parser.add_argument("--categories", type=int, default=10)
+    parser.add_argument("--missing", type=float, default=0.05, help="Fraction of missing values.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--skip-reference",
+        action="store_true",
+        help="Do not time the per-element reference implementation, which is slow.",
+    )
+    args = parser.parse_args()
+
+    categories = [f"category_{i}" for i in range(args.categories)]
+    columns = _make_columns(args.rows, args.columns, args.categories, args.missing, args.seed)
+    print(f"{args.columns} nominal columns x {args.rows} rows, {args.categories} categories")
+
+    vectorized = _time(OpenMLDataset._unpack_categories, columns, categories)
+    print(f"_unpack_categories: {vectorized:.3f}s")
+
+    if not args.skip_reference:
+        reference = _time(_reference_unpack_categories, columns, categories)
+        print(f"per-element loop:   {reference:.3f}s ({reference / vectorized:.1f}x slower)")
+
+
+if __name__ == "__main__":
+    main()
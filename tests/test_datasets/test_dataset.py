@@ -482,3 +482,154 @@ def test__check_qualities():
     qualities = [{"oml:name": "a", "oml:value": None}]
     qualities = openml.datasets.dataset._check_qualities(qualities)
     assert qualities["a"] != qualities["a"]
+
+
+@pytest.mark.parametrize("cache_format", ["feather", "arrow"])
+def test_get_data_cache_format_matches_pickle(static_cache_dir, tmp_path, cache_format):
+    data_file = tmp_path / "dataset.arff"
+    data_file.write_bytes(
+        (static_cache_dir / "org" / "openml" / "test" / "datasets" / "2" / "dataset.arff").read_bytes()
+    )
+    expected, _, expected_categorical, expected_names = OpenMLDataset(
+        "anneal", None, data_file=str(data_file), cache_format="pickle"
+    ).get_data()
+
+    # The first call parses the arff file and writes the cache, the second one loads the cache.
+    for _ in range(2):
+        dataset = OpenMLDataset(
+            "anneal", None, data_file=str(data_file), cache_format=cache_format
+        )
+        data, _, categorical, attribute_names = dataset.get_data()
+        pd.testing.assert_frame_equal(data, expected)
+        assert categorical == expected_categorical
+        assert attribute_names == expected_names
+
+
+def test_get_data_cache_format_arrow_is_memory_mapped(static_cache_dir, tmp_path):
+    data_file = tmp_path / "dataset.arff"
+    data_file.write_bytes(
+        (static_cache_dir / "org" / "openml" / "test" / "datasets" / "2" / "dataset.arff").read_bytes()
+    )
+    OpenMLDataset("anneal", None, data_file=str(data_file), cache_format="arrow").get_data()
+    assert (tmp_path / "dataset.arrow").exists()
+
+    data, *_ = OpenMLDataset(
+        "anneal", None, data_file=str(data_file), cache_format="arrow"
+    ).get_data()
+    numeric_column = data["carbon"].to_numpy()
+    assert not numeric_column.flags.owndata
+    assert not numeric_column.flags.writeable
+
+    # Separating the target does not copy the remaining columns off the memory map
+    x, *_ = OpenMLDataset(
+        "anneal", None, data_file=str(data_file), cache_format="arrow"
+    ).get_data(target="class")
+    assert "class" not in x.columns
+    numeric_column = x["carbon"].to_numpy()
+    assert not numeric_column.flags.owndata
+    assert not numeric_column.flags.writeable
+
+
+@pytest.mark.parametrize("cache_format", ["pickle", "feather", "arrow"])
+def test_get_data_recreates_evicted_cache_file(static_cache_dir, tmp_path, cache_format):
+    data_file = tmp_path / "dataset.arff"
+    data_file.write_bytes(
+        (static_cache_dir / "org" / "openml" / "test" / "datasets" / "2" / "dataset.arff").read_bytes()
+    )
+    dataset = OpenMLDataset("anneal", None, data_file=str(data_file), cache_format=cache_format)
+    expected, *_ = dataset.get_data()
+    for cache_file in tmp_path.glob("dataset.*"):
+        if cache_file != data_file:
+            cache_file.unlink()
+
+    data, *_ = dataset.get_data()
+    pd.testing.assert_frame_equal(data, expected)
+    assert len(list(tmp_path.glob("dataset.*"))) > 1
+
+
+@pytest.mark.parametrize("cache_format", ["pickle", "feather", "arrow"])
+def test_get_data_columns_and_rows(static_cache_dir, tmp_path, cache_format):
+    data_file = tmp_path / "dataset.arff"
+    data_file.write_bytes(
+        (static_cache_dir / "org" / "openml" / "test" / "datasets" / "2" / "dataset.arff").read_bytes()
+    )
+    full, full_y, full_categorical, full_names = OpenMLDataset(
+        "anneal", None, data_file=str(data_file), cache_format=cache_format
+    ).get_data(target="class")
+
+    columns = ["thick", "family", "carbon"]
+    rows = np.array([5, 0, 42])
+    dataset = OpenMLDataset(
+        "anneal",
+        None,
+        data_file=str(data_file),
+        cache_format=cache_format,
+        ignore_attribute="carbon",
+    )
+    x, y, categorical, attribute_names = dataset.get_data(
+        target="class", columns=columns, rows=rows
+    )
+
+    assert attribute_names == ["thick", "family"]
+    assert categorical == [full_categorical[full_names.index(c)] for c in attribute_names]
+    pd.testing.assert_frame_equal(x, full[attribute_names].iloc[rows])
+    pd.testing.assert_series_equal(y, full_y.iloc[rows])
+
+    with pytest.raises(ValueError, match="not attributes of this dataset"):
+        dataset.get_data(columns=["does-not-exist"])
+
+
+ARFF_WITH_ALL_TYPES = """@relation types
+
+@attribute i integer
+@attribute i_missing integer
+@attribute r real
+@attribute s string
+@attribute b {TRUE,FALSE}
+@attribute nom {a,'b c',d}
+@attribute big integer
+
+@data
+1,1,1.5,'hello world',TRUE,a,1000
+2,?,2.5,?,FALSE,'b c',2000
+% a comment in the data section
+3,5,?,x,?,?,3000
+"""
+
+
+def test__parse_data_from_arff_column_types(tmp_path):
+    data_file = tmp_path / "dataset.arff"
+    data_file.write_text(ARFF_WITH_ALL_TYPES)
+    dataset = OpenMLDataset("types", None, data_file=str(data_file))
+
+    X, categorical, attribute_names = dataset._parse_data_from_arff(data_file)
+
+    assert attribute_names == ["i", "i_missing", "r", "s", "b", "nom", "big"]
+    assert categorical == [False, False, False, False, True, True, False]
+    assert X["i"].dtype == np.uint8
+    assert X["i_missing"].dtype == np.float64
+    assert X["big"].dtype == np.int64
+    assert X["b"].tolist()[:2] == [True, False]
+    assert X["nom"].tolist()[:2] == ["a", "b c"]
+    assert X["s"][0] == "hello world"
+    assert X.isna().sum().to_dict() == {
+        "i": 0, "i_missing": 1, "r": 1, "s": 1, "b": 1, "nom": 1, "big": 0
+    }
+
+
+@pytest.mark.parametrize("data_format", ["arff", "sparse_arff"])
+def test__parse_data_from_arff_is_independent_of_chunk_size(
+    static_cache_dir, tmp_path, data_format, monkeypatch
+):
+    data_file = static_cache_dir / "org" / "openml" / "test" / "datasets" / "-1" / "dataset.arff"
+    dataset = OpenMLDataset("dexter", None, data_format=data_format, data_file=str(data_file))
+    expected, *_ = dataset._parse_data_from_arff(data_file)
+
+    monkeypatch.setattr(openml.datasets.dataset, "_ARFF_CHUNK_SIZE", 7)
+    X, *_ = dataset._parse_data_from_arff(data_file)
+
+    if data_format == "sparse_arff":
+        assert X.shape == expected.shape
+        assert (X != expected).nnz == 0
+    else:
+        pd.testing.assert_frame_equal(X, expected)
@@ -1992,6 +1992,42 @@ def test__get_dataset_parquet_not_cached():
     assert path.is_file(), "_get_dataset_parquet returns path to real file"
 
 
+def test_list_datasets_json_matches_xml(requests_mock, test_files_directory):
+    mock_responses = test_files_directory / "mock_responses" / "datasets"
+    xml_list = requests_mock.get(
+        "https://test.openml.org/api/v1/xml/data/list/limit/10/offset/0",
+        text=(mock_responses / "data_list.xml").read_text(),
+    )
+    json_list = requests_mock.get(
+        "https://test.openml.org/api/v1/json/data/list/limit/10/offset/0",
+        text=(mock_responses / "data_list.json").read_text(),
+    )
+
+    xml_datasets = openml.datasets.functions._list_datasets(limit=10, offset=0)
+    with openml.config.overwrite_config_context({"api_format": "json"}):
+        json_datasets = openml.datasets.functions._list_datasets(limit=10, offset=0)
+
+    assert xml_list.call_count == 1
+    assert json_list.call_count == 1
+    pd.testing.assert_frame_equal(json_datasets, xml_datasets)
+    assert json_datasets.index.tolist() == [2, 3, 5]
+    assert json_datasets.loc[3, "NumberOfInstances"] == 3196
+    assert pd.isna(json_datasets.loc[5, "NumberOfInstances"])
+
+
+def test_list_datasets_json_no_results(requests_mock, test_files_directory):
+    content_file = test_files_directory / "mock_responses" / "datasets" / "data_list_no_results.json"
+    requests_mock.get(
+        "https://test.openml.org/api/v1/json/data/list/limit/10/offset/0",
+        status_code=412,
+        text=content_file.read_text(),
+    )
+
+    with openml.config.overwrite_config_context({"api_format": "json"}):
+        with pytest.raises(OpenMLServerNoResult, match="No results"):
+            openml.datasets.functions._list_datasets(limit=10, offset=0)
+
+
 def test_read_features_from_xml_with_whitespace() -> None:
     from openml.datasets.dataset import _read_features
 
@@ -2016,3 +2052,26 @@ def test_get_dataset_parquet(requests_mock, test_files_directory):
     assert dataset.parquet_file is not None
     assert os.path.isfile(dataset.parquet_file)
     assert dataset.data_file is None  # is alias for arff path
+
+
+def test__get_dataset_qualities_file_revalidates(static_cache_dir, tmp_path):
+    from openml.datasets.dataset import _read_qualities
+
+    qualities_file = tmp_path / "qualities.xml"
+    shutil.copy(static_cache_dir / "org/openml/test/datasets/2/qualities.xml", qualities_file)
+    assert _read_qualities(qualities_file)["NumberOfInstances"] == 898.0
+    os.utime(qualities_file, (0, 0))
+
+    def _revalidate(call, cache_file):
+        cache_file.write_text(cache_file.read_text().replace(">898<", ">899<"))
+
+    with mock.patch(
+        "openml._api_calls._download_revalidated", side_effect=_revalidate
+    ) as download_revalidated:
+        with openml.config.overwrite_config_context({"metadata_revalidate_after": 60}):
+            assert _get_dataset_qualities_file(tmp_path, 2) == qualities_file
+            assert _get_dataset_qualities_file(tmp_path, 2) == qualities_file
+
+    download_revalidated.assert_called_once_with("data/qualities/2", qualities_file)
+    # The pickled qualities are outdated by the revalidated file
+    assert _read_qualities(qualities_file)["NumberOfInstances"] == 899.0
@@ -1,6 +1,8 @@
 # License: BSD 3-Clause
 from __future__ import annotations
 
+from unittest import mock
+
 import pytest
 
 import openml
@@ -264,3 +266,88 @@ class TestEvaluationFunctions(TestBase):
         task_id = [6]
         size = 121
         self._check_list_evaluation_setups(tasks=task_id, size=size)
+
+
+def _evaluations_xml(run_ids, uploader):
+    evaluations = "".join(
+        f"""<oml:evaluation>
+        <oml:run_id>{run_id}</oml:run_id><oml:task_id>1</oml:task_id>
+        <oml:setup_id>1</oml:setup_id><oml:flow_id>1</oml:flow_id>
+        <oml:flow_name>flow</oml:flow_name><oml:data_id>1</oml:data_id>
+        <oml:data_name>data</oml:data_name><oml:function>predictive_accuracy</oml:function>
+        <oml:upload_time>2024-01-01 00:00:00</oml:upload_time>
+        <oml:uploader>{uploader}</oml:uploader><oml:value>0.5</oml:value>
+        </oml:evaluation>"""
+        for run_id in run_ids
+    )
+    return f'<oml:evaluations xmlns:oml="http://openml.org/openml">{evaluations}</oml:evaluations>'
+
+
+@mock.patch("openml.evaluations.functions._uploader_names", {})
+@mock.patch("openml._api_calls._perform_api_call")
+def test_list_evaluations_caches_uploader_names(perform_api_call):
+    def _perform_api_call(call, request_method, **kwargs):
+        if call.startswith("user/list/user_id/"):
+            return (
+                '<oml:users xmlns:oml="http://openml.org/openml"><oml:user>'
+                "<oml:id>7</oml:id><oml:username>someone</oml:username>"
+                "</oml:user></oml:users>"
+            )
+        offset = int(call.split("/offset/")[1].split("/")[0])
+        return _evaluations_xml(range(offset, offset + 2), uploader=7)
+
+    perform_api_call.side_effect = _perform_api_call
+
+    evaluations = openml.evaluations.list_evaluations("predictive_accuracy", size=2)
+    assert evaluations[0].uploader_name == "someone"
+    evaluations = openml.evaluations.list_evaluations("predictive_accuracy", offset=2, size=2)
+    assert evaluations[3].uploader_name == "someone"
+
+    user_calls = [c for c in perform_api_call.call_args_list if c.args[0].startswith("user/")]
+    assert len(user_calls) == 1
+
+    perform_api_call.reset_mock()
+    evaluations = openml.evaluations.list_evaluations(
+        "predictive_accuracy",
+        size=2,
+        resolve_uploader_names=False,
+    )
+    assert evaluations[0].uploader == 7
+    assert evaluations[0].uploader_name is None
+    assert perform_api_call.call_count == 1
+
+
+@mock.patch("openml.setups.list_setups")
+@mock.patch("openml.evaluations.functions.list_evaluations")
+def test_list_evaluations_setups_fetches_setup_chunks(list_evaluations, list_setups):
+    import pandas as pd
+
+    setup_ids = [(i * 7) % 250 + 1 for i in range(500)]
+    list_evaluations.return_value = pd.DataFrame(
+        {"run_id": range(500), "setup_id": setup_ids, "flow_id": 1},
+    )
+
+    def _list_setups(setup, output_format):
+        records = [
+            {
+                "setup_id": setup_id,
+                "flow_id": 1,
+                "parameters": {1: {"full_name": "flow(1)_C", "value": str(setup_id)}},
+            }
+            for setup_id in setup
+        ]
+        return pd.DataFrame.from_records(records, index="setup_id")
+
+    list_setups.side_effect = _list_setups
+
+    evals = openml.evaluations.list_evaluations_setups(
+        "predictive_accuracy",
+        flows=[1],
+        parameters_in_separate_columns=True,
+        max_workers=3,
+    )
+
+    # 250 unique setups are listed in chunks of at most 100
+    assert sorted(len(c.kwargs["setup"]) for c in list_setups.call_args_list) == [83, 83, 84]
+    assert evals["run_id"].tolist() == list(range(500))
+    assert evals["flow(1)_C"].tolist() == [str(setup_id) for setup_id in setup_ids]
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import hashlib
+import io
 import unittest.mock
+import zipfile
 from pathlib import Path
 from typing import NamedTuple, Iterable, Iterator
 from unittest import mock
 
 import minio
 import pytest
+import urllib3
 
 import openml
 from openml.config import ConfigurationForExamples
@@ -21,9 +25,9 @@ class TestConfig(openml.testing.TestBase):
             openml.datasets.list_datasets(data_id=list(range(10000)))
 
     @unittest.mock.patch("time.sleep")
-    @unittest.mock.patch("requests.Session")
+    @unittest.mock.patch("openml._api_calls._get_session")
     @pytest.mark.uses_test_server()
-    def test_retry_on_database_error(self, Session_class_mock, _):
+    def test_retry_on_database_error(self, get_session_mock, _):
         response_mock = unittest.mock.Mock()
         response_mock.text = (
             "<oml:error>\n"
@@ -33,11 +37,34 @@ class TestConfig(openml.testing.TestBase):
             "Please wait for N seconds and try again.</oml:message>\n"
             "</oml:error>"
         )
-        Session_class_mock.return_value.__enter__.return_value.get.return_value = response_mock
+        get_session_mock.return_value.get.return_value = response_mock
         with pytest.raises(openml.exceptions.OpenMLServerException, match="/abc returned code 107"):
             openml._api_calls._send_request("get", "/abc", {})
 
-        assert Session_class_mock.return_value.__enter__.return_value.get.call_count == 20
+        assert get_session_mock.return_value.get.call_count == 20
+
+
+def test_session_is_reused_and_recreated_on_pool_size_change() -> None:
+    session = openml._api_calls._get_session()
+    assert openml._api_calls._get_session() is session
+
+    adapter = session.get_adapter("https://www.openml.org")
+    assert adapter._pool_maxsize == openml.config.connection_pool_maxsize
+
+    pool_maxsize = openml.config.connection_pool_maxsize
+    try:
+        openml.config.connection_pool_maxsize = pool_maxsize + 1
+        new_session = openml._api_calls._get_session()
+        assert new_session is not session
+        assert new_session.get_adapter("https://www.openml.org")._pool_maxsize == pool_maxsize + 1
+    finally:
+        openml.config.connection_pool_maxsize = pool_maxsize
+
+
+@pytest.fixture(autouse=True)
+def _clear_minio_clients():
+    # The clients are shared between downloads, so they would outlive the mocks of a test
+    openml._api_calls._minio_clients.clear()
 
 
 class FakeObject(NamedTuple):
@@ -46,19 +73,40 @@ class FakeObject(NamedTuple):
     """We use the etag of a Minio object as the name of a marker if we already downloaded it."""
 
 
+class FakeResponse:
+    def __init__(self, content: bytes):
+        self._content = content
+
+    def stream(self, amt: int) -> Iterator[bytes]:
+        for start in range(0, len(self._content), amt):
+            yield self._content[start : start + amt]
+
+    def close(self) -> None:
+        pass
+
+    def release_conn(self) -> None:
+        pass
+
+
 class FakeMinio:
-    def __init__(self, objects: Iterable[FakeObject] | None = None):
+    def __init__(self, objects: Iterable[FakeObject] | None = None, content: bytes = b"foo"):
         self._objects = objects or []
+        self._content = content
 
     def list_objects(self, *args, **kwargs) -> Iterator[FakeObject]:
         yield from self._objects
 
-    def fget_object(self, object_name: str, file_path: str, *args, **kwargs) -> None:
-        if object_name in [obj.object_name for obj in self._objects]:
-            Path(file_path).write_text("foo")
-            return
+    def stat_object(self, bucket_name: str, object_name: str, *args, **kwargs) -> FakeObject:
+        for obj in self._objects:
+            if obj.object_name == object_name:
+                return unittest.mock.Mock(etag=obj.etag, size=len(self._content))
         raise FileNotFoundError
 
+    def get_object(
+        self, bucket_name: str, object_name: str, offset: int = 0, length: int = 0, **kwargs
+    ) -> FakeResponse:
+        return FakeResponse(self._content[offset : offset + length])
+
 
 @mock.patch.object(minio, "Minio")
 def test_download_all_files_observes_cache(mock_minio, tmp_path: Path) -> None:
@@ -72,7 +120,7 @@ def test_download_all_files_observes_cache(mock_minio, tmp_path: Path) -> None:
     )
 
     _download_minio_bucket(source=some_url, destination=tmp_path)
-    time_created = (tmp_path / "dataset.arff").stat().st_ctime
+    time_created = (tmp_path / "dataset.arff").stat().st_mtime
 
     _download_minio_bucket(source=some_url, destination=tmp_path)
     time_modified = (tmp_path / some_filename).stat().st_mtime
@@ -126,3 +174,375 @@ def test_authentication_endpoints_requiring_api_key_show_relevant_help_link(
     with openml.config.overwrite_config_context({"apikey": None}):
         with pytest.raises(openml.exceptions.OpenMLNotAuthorizedError, match=API_TOKEN_HELP_LINK):
             openml._api_calls._perform_api_call(call=endpoint, request_method=method, data=None)
+
+
+@pytest.fixture()
+def listing_cache(tmp_path: Path) -> Iterator[Path]:
+    with mock.patch("openml.config.get_cache_directory", return_value=str(tmp_path)):
+        with openml.config.overwrite_config_context({"listing_cache_ttl": "60, evaluation=0"}):
+            yield tmp_path / openml._api_calls.LISTING_CACHE_DIR_NAME
+
+
+def test_listing_cache_ttl_and_refresh(requests_mock, listing_cache: Path) -> None:
+    server = "https://test.openml.org/api/v1/xml"
+    data_list = requests_mock.get(
+        f"{server}/data/list/limit/10",
+        [{"text": "first"}, {"text": "second"}],
+    )
+    evaluation_list = requests_mock.get(
+        f"{server}/evaluation/list/function/a",
+        [{"text": "third"}, {"text": "fourth"}],
+    )
+    cached_call = openml._api_calls._perform_cached_api_call
+
+    assert cached_call("data/list/limit/10") == "first"
+    assert cached_call("data/list/limit/10") == "first"
+    assert data_list.call_count == 1
+    assert len(list(listing_cache.glob("*.xml"))) == 1
+
+    assert cached_call("data/list/limit/10", force_refresh_cache=True) == "second"
+    assert cached_call("data/list/limit/10") == "second"
+    assert data_list.call_count == 2
+
+    # The time-to-live of evaluation listings is overwritten to not cache them
+    assert cached_call("evaluation/list/function/a") == "third"
+    assert cached_call("evaluation/list/function/a") == "fourth"
+    assert evaluation_list.call_count == 2
+
+
+def test_listing_cache_serves_stale_while_refreshing(requests_mock, listing_cache: Path) -> None:
+    import os
+    import time
+
+    requests_mock.get(
+        "https://test.openml.org/api/v1/xml/task/list",
+        [{"text": "first"}, {"text": "second"}, {"text": "third"}],
+    )
+    cached_call = openml._api_calls._perform_cached_api_call
+    assert cached_call("task/list") == "first"
+    (cache_file,) = listing_cache.glob("*.xml")
+
+    stale = time.time() - 90
+    os.utime(cache_file, (stale, stale))
+    assert cached_call("task/list") == "first"
+    for _ in range(100):
+        if not openml._api_calls._refreshing_listings:
+            break
+        time.sleep(0.05)
+    assert cache_file.read_text() == "second"
+
+    expired = time.time() - 150
+    os.utime(cache_file, (expired, expired))
+    assert cached_call("task/list") == "third"
+
+
+def test_download_revalidated_uses_validators(requests_mock, tmp_path: Path) -> None:
+    import os
+
+    url = "https://test.openml.org/api/v1/xml/data/qualities/2"
+    requests_mock.get(
+        url,
+        [
+            {"text": "<qualities/>", "headers": {"ETag": '"v1"'}},
+            {"status_code": 304},
+            {"text": "<new-qualities/>", "headers": {"Last-Modified": "Mon, 1 Jan 2024"}},
+        ],
+    )
+    cache_file = tmp_path / "qualities.xml"
+    download = openml._api_calls._download_revalidated
+
+    assert download("data/qualities/2", cache_file) == "<qualities/>"
+    assert "If-None-Match" not in requests_mock.last_request.headers
+
+    os.utime(cache_file, (0, 0))
+    assert download("data/qualities/2", cache_file) == "<qualities/>"
+    assert requests_mock.last_request.headers["If-None-Match"] == '"v1"'
+    # A revalidated file counts as fresh again
+    assert cache_file.stat().st_mtime > 0
+
+    assert download("data/qualities/2", cache_file) == "<new-qualities/>"
+    assert cache_file.read_text() == "<new-qualities/>"
+    assert openml._api_calls._validators_file(cache_file).read_text() == (
+        '{"last_modified": "Mon, 1 Jan 2024"}'
+    )
+
+
+@mock.patch("time.sleep")
+def test_download_revalidated_falls_back_to_cached_copy(
+    _sleep, requests_mock, tmp_path: Path
+) -> None:
+    import requests
+
+    requests_mock.get(
+        "https://test.openml.org/api/v1/xml/data/2",
+        exc=requests.exceptions.ConnectionError,
+    )
+    cache_file = tmp_path / "description.xml"
+    with pytest.raises(requests.exceptions.ConnectionError):
+        openml._api_calls._download_revalidated("data/2", cache_file)
+
+    cache_file.write_text("<description/>")
+    assert openml._api_calls._download_revalidated("data/2", cache_file) == "<description/>"
+
+
+def test_is_due_for_revalidation(tmp_path: Path) -> None:
+    import os
+
+    cache_file = tmp_path / "description.xml"
+    cache_file.write_text("<description/>")
+    os.utime(cache_file, (0, 0))
+
+    assert not openml._api_calls._is_due_for_revalidation(cache_file)
+    with openml.config.overwrite_config_context({"metadata_revalidate_after": 3600}):
+        assert openml._api_calls._is_due_for_revalidation(cache_file)
+        assert not openml._api_calls._is_due_for_revalidation(tmp_path / "missing.xml")
+        cache_file.touch()
+        assert not openml._api_calls._is_due_for_revalidation(cache_file)
+
+
+def test_evict_listings_removes_least_recently_used(tmp_path: Path) -> None:
+    import os
+
+    for last_used, name in enumerate(["b", "a", "c"]):
+        cache_file = tmp_path / f"{name}.xml"
+        cache_file.write_text("x" * 100)
+        os.utime(cache_file, (1_000 + last_used, 1_000))
+
+    openml._api_calls._evict_listings(tmp_path, max_bytes=250)
+
+    assert sorted(p.name for p in tmp_path.glob("*.xml")) == ["a.xml", "c.xml"]
+
+
+def test_parse_listing_cache_ttl() -> None:
+    parse = openml.config._parse_listing_cache_ttl
+    assert parse(0) == {"": 0}
+    assert parse("3600, evaluation=600") == {"": 3600, "evaluation": 600}
+    with pytest.raises(ValueError, match="Invalid entry 'run=soon'"):
+        parse("run=soon")
+
+
+def test_parse_api_format() -> None:
+    parse = openml.config._parse_api_format
+    assert parse("xml") == {"": "xml"}
+    assert parse("json, setup=xml") == {"": "json", "setup": "xml"}
+    with pytest.raises(ValueError, match="Invalid entry 'run=csv'"):
+        parse("json, run=csv")
+
+
+@mock.patch.object(openml._api_calls, "_xml_fallback_endpoints", set())
+def test_read_call_uses_json_per_endpoint_and_falls_back_to_xml(requests_mock) -> None:
+    server = "https://test.openml.org/api/v1"
+    requests_mock.get(f"{server}/json/task/list", text='{"tasks": {"task": []}}')
+    json_runs = requests_mock.get(f"{server}/json/run/list", text="<html>Not Found</html>")
+    requests_mock.get(f"{server}/xml/run/list", text="<oml:runs/>")
+    requests_mock.get(f"{server}/xml/setup/list", text="<oml:setups/>")
+    read_call = openml._api_calls._perform_read_call
+
+    with openml.config.overwrite_config_context({"api_format": "json, setup=xml"}):
+        assert read_call("task/list") == {"tasks": {"task": []}}
+        assert read_call("setup/list", cached=False) == "<oml:setups/>"
+        # The answer of the JSON API is not JSON, so runs are listed in XML from now on
+        assert read_call("run/list") == "<oml:runs/>"
+        assert read_call("run/list") == "<oml:runs/>"
+
+    assert json_runs.call_count == 1
+
+
+def _fake_read_range(content: bytes, requests: list[tuple[int, int]], fail_at: int | None = None):
+    """Serve ranges of ``content``, dropping the connection once when reaching ``fail_at``."""
+
+    def read_range(offset: int, length: int) -> Iterator[bytes]:
+        requests.append((offset, length))
+        for position in range(offset, offset + length, 4):
+            nonlocal fail_at
+            # Only the part which contains ``fail_at`` fails, whichever thread gets there first
+            if fail_at is not None and offset <= fail_at <= position:
+                fail_at = None
+                raise ConnectionError("Connection dropped")
+            yield content[position : min(position + 4, offset + length)]
+
+    return read_range
+
+
+@mock.patch("time.sleep")
+@mock.patch("openml._api_calls._DOWNLOAD_PART_SIZE", 10)
+def test__download_in_parts(_, tmp_path: Path) -> None:
+    content = bytes(range(95))
+    destination = tmp_path / "dataset.pq"
+    requests = []
+
+    openml._api_calls._download_in_parts(
+        _fake_read_range(content, requests, fail_at=24),
+        len(content),
+        destination,
+        source="http://not.real.com/dataset.pq",
+        md5_checksum=hashlib.md5(content).hexdigest(),
+    )
+
+    assert destination.read_bytes() == content
+    assert list(tmp_path.iterdir()) == [destination]
+    # Every part is requested once, the part with the dropped connection from where it stopped
+    assert sorted(requests) == [(0, 10), (10, 10), (20, 10), (24, 6)] + [
+        (start, 10) for start in range(30, 90, 10)
+    ] + [(90, 5)]
+
+
+@mock.patch("time.sleep")
+@mock.patch("openml._api_calls._DOWNLOAD_PART_SIZE", 10)
+def test__download_in_parts_resumes_interrupted_download(_, tmp_path: Path) -> None:
+    content = bytes(range(95))
+    destination = tmp_path / "dataset.pq"
+    requests = []
+
+    with openml.config.overwrite_config_context({"connection_n_retries": 1}):
+        with pytest.raises(ConnectionError):
+            openml._api_calls._download_in_parts(
+                _fake_read_range(content, requests, fail_at=44),
+                len(content),
+                destination,
+                source="http://not.real.com/dataset.pq",
+                version="etag",
+            )
+    assert not destination.exists()
+    assert (tmp_path / "dataset.pq.part").exists()
+
+    completed_parts = {offset for offset, _ in requests} - {40}
+    requests.clear()
+    openml._api_calls._download_in_parts(
+        _fake_read_range(content, requests),
+        len(content),
+        destination,
+        source="http://not.real.com/dataset.pq",
+        version="etag",
+    )
+
+    assert destination.read_bytes() == content
+    assert {offset for offset, _ in requests}.isdisjoint(completed_parts)
+    assert list(tmp_path.iterdir()) == [destination]
+
+
+@mock.patch("openml._api_calls._DOWNLOAD_PART_SIZE", 10)
+def test__download_in_parts_checks_md5(tmp_path: Path) -> None:
+    content = bytes(range(25))
+    destination = tmp_path / "dataset.arff"
+
+    with pytest.raises(openml.exceptions.OpenMLHashException, match="Checksum"):
+        openml._api_calls._download_in_parts(
+            _fake_read_range(content, []),
+            len(content),
+            destination,
+            source="http://not.real.com/dataset.arff",
+            md5_checksum=hashlib.md5(b"other content").hexdigest(),
+        )
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@mock.patch.object(minio, "Minio")
+@mock.patch("openml._api_calls._DOWNLOAD_PART_SIZE", 10)
+def test_download_minio_file_in_parts(mock_minio, tmp_path: Path) -> None:
+    content = bytes(range(42))
+    mock_minio.return_value = FakeMinio(
+        objects=[FakeObject(object_name="dataset_61.pq", etag=hashlib.md5(content).hexdigest())],
+        content=content,
+    )
+
+    openml._api_calls._download_minio_file(
+        source="http://not.real.com/dataset61/dataset_61.pq",
+        destination=tmp_path,
+    )
+
+    assert (tmp_path / "dataset_61.pq").read_bytes() == content
+
+
+@mock.patch("openml._api_calls._DOWNLOAD_PART_SIZE", 10)
+def test_download_text_file_uses_range_requests(requests_mock, tmp_path: Path) -> None:
+    content = b"@RELATION test\n@ATTRIBUTE a NUMERIC\n@DATA\n1\n2\n"
+    url = "https://test.openml.org/data/v1/download/1/test.arff"
+    requests_mock.head(
+        url,
+        headers={"Accept-Ranges": "bytes", "Content-Length": str(len(content)), "ETag": '"1"'},
+    )
+
+    def _range_response(request, context):
+        start, stop = map(int, request.headers["Range"].removeprefix("bytes=").split("-"))
+        context.status_code = 206
+        return content[start : stop + 1]
+
+    requests_mock.get(url, content=_range_response)
+
+    openml._api_calls._download_text_file(
+        url,
+        output_path=tmp_path / "dataset.arff",
+        md5_checksum=hashlib.md5(content).hexdigest(),
+    )
+
+    assert (tmp_path / "dataset.arff").read_bytes() == content
+    assert len([r for r in requests_mock.request_history if r.method == "GET"]) == 5
+
+
+@mock.patch("openml._api_calls._DOWNLOAD_CHUNK_SIZE", 4)
+def test_download_text_file_streams_to_file(requests_mock, tmp_path: Path) -> None:
+    content = "@RELATION ünïcode\n@ATTRIBUTE a NUMERIC\n@DATA\n1\n2\n".encode()
+    url = "https://test.openml.org/data/v1/download/1/test.arff"
+    requests_mock.head(url, headers={"Content-Length": str(len(content))})
+    requests_mock.get(url, content=content, headers={"Content-Type": "text/plain; charset=utf-8"})
+    output_path = tmp_path / "dataset.arff"
+
+    openml._api_calls._download_text_file(
+        url,
+        output_path=output_path,
+        md5_checksum=hashlib.md5(content).hexdigest(),
+    )
+    assert output_path.read_bytes() == content
+
+    with (
+        openml.config.overwrite_config_context({"connection_n_retries": 1}),
+        pytest.raises(
+            openml.exceptions.OpenMLHashException,
+            match="unequal to the expected checksum",
+        ),
+    ):
+        openml._api_calls._download_text_file(
+            url, output_path=tmp_path / "other.arff", md5_checksum="0" * 32
+        )
+    # A failed download leaves neither the file nor a temporary file behind
+    assert [p.name for p in tmp_path.iterdir()] == ["dataset.arff"]
+
+
+@mock.patch.object(minio, "Minio")
+def test_download_minio_bucket_shares_client_and_observes_markers(
+    mock_minio, tmp_path: Path
+) -> None:
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        zip_file.writestr("images/0.txt", "image")
+    objects = [
+        FakeObject(object_name=f"0000/0061/archive_{i}.zip", etag=f"etag{i}") for i in range(5)
+    ]
+    fake_minio = FakeMinio(objects=objects, content=archive.getvalue())
+    mock_minio.return_value = fake_minio
+    source = "http://not.real.com/datasets/0000/0061/dataset_61.pq"
+
+    with (
+        mock.patch.object(fake_minio, "get_object", wraps=fake_minio.get_object) as get_object,
+        mock.patch(
+            "openml._api_calls._download_in_parts", wraps=openml._api_calls._download_in_parts
+        ) as download_in_parts,
+    ):
+        _download_minio_bucket(source=source, destination=tmp_path)
+        assert get_object.call_count == 5
+        _download_minio_bucket(source=source, destination=tmp_path)
+        assert get_object.call_count == 5
+
+    # Objects are downloaded concurrently, so each object by itself is not downloaded in parts
+    assert {call.kwargs["max_workers"] for call in download_in_parts.call_args_list} == {1}
+    # One client for listing and downloading all objects, with a pool of the configured size
+    assert mock_minio.call_count == 1
+    http_client = mock_minio.call_args.kwargs["http_client"]
+    assert isinstance(http_client, urllib3.PoolManager)
+    assert http_client.connection_pool_kw["maxsize"] == openml.config.connection_pool_maxsize
+    for i in range(5):
+        assert (tmp_path / f"etag{i}").exists()
+        assert not (tmp_path / f"archive_{i}.zip").exists()
+    assert (tmp_path / "images" / "0.txt").read_text() == "image"
@@ -0,0 +1,74 @@
+# License: BSD 3-Clause
+from __future__ import annotations
+
+import shutil
+import sqlite3
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+import openml
+from openml import _cache_index
+
+CACHED_FILES = ["datasets/2", "tasks/1", "tasks/1882", "runs/1"]
+
+
+@pytest.fixture()
+def cache_directory(tmp_path, static_cache_dir):
+    openml.config.set_root_cache_directory(tmp_path)
+    cache_directory = Path(openml.config.get_cache_directory())
+    static_cache_directory = static_cache_dir / "org" / "openml" / "test"
+    for entity in CACHED_FILES:
+        shutil.copytree(static_cache_directory / entity, cache_directory / entity)
+    return cache_directory
+
+
+def test_query_cache_index_builds_index_from_cached_files(cache_directory):
+    (cache_directory / "tasks" / "3").mkdir(parents=True)
+    (cache_directory / "tasks" / "3" / "task.xml").write_text("<not a task")
+
+    tasks = openml.query_cache_index(
+        "SELECT tasks.tid FROM tasks JOIN dataset_qualities AS q ON q.did = tasks.did"
+        " WHERE tasks.task_type_id = 1 AND q.name = 'NumberOfInstances' AND q.value < ?",
+        (10000,),
+    )
+
+    assert (cache_directory / _cache_index.CACHE_INDEX_FILE_NAME).is_file()
+    assert tasks["tid"].tolist() == [1882]
+
+    datasets = openml.query_cache_index("SELECT * FROM datasets JOIN dataset_features USING (did)")
+    assert datasets[["did", "name", "number_of_features"]].values.tolist() == [[2, "anneal", 39]]
+    assert openml.query_cache_index("SELECT tid FROM tasks")["tid"].tolist() == [1, 1882]
+    runs = openml.query_cache_index("SELECT run_id, task_id, flow_id FROM runs")
+    assert runs.values.tolist() == [[100, 28, 67]]
+
+
+def test_cache_index_is_updated_on_download_and_removal(cache_directory):
+    task_xml = (cache_directory / "tasks" / "1882" / "task.xml").read_text()
+    shutil.rmtree(cache_directory / "tasks")
+
+    with mock.patch("openml._api_calls._perform_api_call", return_value=task_xml):
+        openml.tasks.functions._get_task_description(1882)
+
+    with _cache_index._connect() as connection:
+        assert connection.execute("SELECT tid, did FROM tasks").fetchall() == [(1882, 2)]
+
+    openml.utils._remove_cache_dir_for_id("tasks", cache_directory / "tasks" / "1882")
+
+    with _cache_index._connect() as connection:
+        assert connection.execute("SELECT tid FROM tasks").fetchall() == []
+
+
+def test_cache_index_errors_do_not_fail_downloads(cache_directory):
+    task_xml = (cache_directory / "tasks" / "1882" / "task.xml").read_text()
+    shutil.rmtree(cache_directory / "tasks")
+
+    with (
+        mock.patch("openml._api_calls._perform_api_call", return_value=task_xml),
+        mock.patch("sqlite3.connect", side_effect=sqlite3.OperationalError("database is locked")),
+    ):
+        task = openml.tasks.functions._get_task_description(1882)
+
+    assert task.task_id == 1882
+    assert (cache_directory / "tasks" / "1882" / "task.xml").is_file()
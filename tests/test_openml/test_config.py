@@ -83,9 +83,16 @@ class TestConfig(openml.testing.TestBase):
         _config["avoid_duplicate_runs"] = False
         _config["connection_n_retries"] = 20
         _config["retry_policy"] = "robot"
+        _config["connection_pool_maxsize"] = 10
+        _config["max_concurrent_pages"] = 1
+        _config["listing_cache_ttl"] = 0
+        _config["listing_cache_max_mb"] = 64
+        _config["data_cache_max_mb"] = 0
+        _config["metadata_revalidate_after"] = 0
+        _config["api_format"] = "xml"
         _config["show_progress"] = False
         assert isinstance(config, dict)
-        assert len(config) == 7
+        assert len(config) == 14
         self.assertDictEqual(config, _config)
 
     def test_setup_with_config(self):
@@ -97,6 +104,13 @@ class TestConfig(openml.testing.TestBase):
         _config["avoid_duplicate_runs"] = True
         _config["retry_policy"] = "human"
         _config["connection_n_retries"] = 100
+        _config["connection_pool_maxsize"] = 10
+        _config["max_concurrent_pages"] = 4
+        _config["listing_cache_ttl"] = "3600, evaluation=600"
+        _config["listing_cache_max_mb"] = 16.0
+        _config["data_cache_max_mb"] = 2048.0
+        _config["metadata_revalidate_after"] = 86400
+        _config["api_format"] = "json, setup=xml"
         _config["show_progress"] = False
         orig_config = openml.config.get_config_as_dict()
         openml.config._setup(_config)
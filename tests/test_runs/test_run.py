@@ -1,12 +1,19 @@
 # License: BSD 3-Clause
 from __future__ import annotations
 
+import io
 import os
 import random
+import shutil
+from pathlib import Path
 from time import time
+from unittest import mock
 
+import arff
 import numpy as np
+import pandas as pd
 import pytest
+import sklearn.metrics
 import xmltodict
 from openml_sklearn import SklearnExtension
 from sklearn.base import clone
@@ -14,10 +21,12 @@ from sklearn.dummy import DummyClassifier
 from sklearn.linear_model import LinearRegression
 from sklearn.model_selection import GridSearchCV
 from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder
 from sklearn.tree import DecisionTreeClassifier
 
 import openml
 from openml import OpenMLRun
+from openml.runs.run import _write_predictions_arff
 from openml.testing import SimpleImputer, TestBase
 
 
@@ -397,3 +406,185 @@ class TestRun(TestBase):
 
         recreated_run = openml.runs.functions._create_run_from_xml(xml, from_server=False)
         assert recreated_run.setup_string == SETUP_STRING
+
+    def _run_dummy_on_cached_task(self):
+        test_cache_dir = Path("org", "openml", "test")
+        for entity in ("tasks/1882", "datasets/2"):
+            shutil.copytree(
+                self.static_cache_dir / test_cache_dir / entity,
+                self.workdir / test_cache_dir / entity,
+            )
+        openml.config.set_root_cache_directory(self.workdir)
+        task = openml.tasks.get_task(1882, download_data=True)
+        model = Pipeline(
+            [
+                ("encoder", OneHotEncoder(handle_unknown="ignore")),
+                ("estimator", DummyClassifier(strategy="stratified", random_state=1)),
+            ],
+        )
+        data_content, _, fold_evaluations, _ = openml.runs.functions._run_task_get_arffcontent(
+            extension=SklearnExtension(),
+            model=model,
+            task=task,
+            add_local_measures=True,
+            n_jobs=1,
+        )
+        return OpenMLRun(
+            task_id=task.task_id,
+            flow_id=None,
+            dataset_id=task.dataset_id,
+            data_content=data_content,
+            fold_evaluations=fold_evaluations,
+            model=model,
+            flow=SklearnExtension().model_to_flow(model),
+        )
+
+    @pytest.mark.sklearn()
+    def test_to_from_filesystem_predictions_parquet(self):
+        run = self._run_dummy_on_cached_task()
+
+        cache_path = self.workdir / "runs" / str(random.getrandbits(128))
+        run.to_filesystem(cache_path, store_predictions_parquet=True)
+        assert (cache_path / "predictions.parquet").is_file()
+
+        with (cache_path / "predictions.arff").open() as fh:
+            predictions_arff = arff.load(fh)
+        expected_arff = arff.loads(arff.dumps(run._generate_arff_dict()))
+        assert predictions_arff == expected_arff
+
+        loaded_run = OpenMLRun.from_filesystem(cache_path)
+        assert isinstance(loaded_run.data_content, pd.DataFrame)
+        pd.testing.assert_frame_equal(loaded_run.data_content, run.predictions)
+
+        # Without the sidecar, the predictions are parsed from the ARFF file
+        (cache_path / "predictions.parquet").unlink()
+        loaded_run = OpenMLRun.from_filesystem(cache_path)
+        assert loaded_run.data_content == predictions_arff["data"]
+
+    @pytest.mark.sklearn()
+    def test_get_metrics(self):
+        run = self._run_dummy_on_cached_task()
+
+        scores = run.get_metrics(
+            {
+                "accuracy": sklearn.metrics.accuracy_score,
+                "precision": sklearn.metrics.precision_score,
+            },
+            kwargs={"precision": {"average": "macro", "zero_division": 0}},
+        )
+        # The parsed predictions are kept on the run, so they are not generated again
+        with mock.patch.object(OpenMLRun, "_generate_arff_dict") as generate_arff_dict:
+            accuracy = run.get_metric_fn(sklearn.metrics.accuracy_score)
+        generate_arff_dict.assert_not_called()
+
+        # 10 times 10-fold CV, in the same order as the fold evaluations
+        expected_accuracy = [
+            score
+            for repeat in run.fold_evaluations["predictive_accuracy"].values()
+            for score in repeat.values()
+        ]
+        np.testing.assert_array_almost_equal(scores["accuracy"], expected_accuracy)
+        np.testing.assert_array_equal(accuracy, scores["accuracy"])
+
+        predictions = run.predictions
+        fold = predictions[(predictions["repeat"] == 2) & (predictions["fold"] == 3)]
+        expected_precision = sklearn.metrics.precision_score(
+            fold["correct"],
+            fold["prediction"],
+            average="macro",
+            zero_division=0,
+        )
+        assert scores["precision"][2 * 10 + 3] == pytest.approx(expected_precision)
+
+    def test_predictions_are_cached_as_parquet(self):
+        predictions_arff = arff.dumps(
+            {
+                "relation": "openml_task_1_predictions",
+                "attributes": [
+                    ("repeat", "NUMERIC"),
+                    ("fold", "NUMERIC"),
+                    ("row_id", "NUMERIC"),
+                    ("prediction", ["a", "b"]),
+                    ("correct", ["a", "b"]),
+                    ("confidence.a", "NUMERIC"),
+                    ("confidence.b", "NUMERIC"),
+                ],
+                "data": [[0, 0, 1, "a", "a", 0.75, 0.25], [0, 1, 0, "b", None, 0.0, 1.0]],
+            },
+        )
+
+        def download(source, output_path=None, **_kwargs):
+            if output_path is None:
+                return predictions_arff
+            Path(output_path).write_text(predictions_arff)
+            return None
+
+        def new_run():
+            return OpenMLRun(
+                task_id=1,
+                flow_id=1,
+                dataset_id=1,
+                run_id=123,
+                predictions_url="https://openml.org/data/download/1/predictions.arff",
+            )
+
+        with mock.patch.object(
+            openml._api_calls, "_download_text_file", side_effect=download
+        ) as download_mock:
+            predictions = new_run().predictions
+            cached_predictions = new_run().predictions
+        assert download_mock.call_count == 1
+
+        run_dir = Path(openml.config.get_cache_directory()) / "runs" / "123"
+        # Neither the downloaded arff file nor a temporary parquet file is left behind
+        assert [path.name for path in run_dir.iterdir()] == ["predictions.parquet"]
+
+        assert list(predictions.columns) == [
+            "repeat",
+            "fold",
+            "row_id",
+            "prediction",
+            "correct",
+            "confidence.a",
+            "confidence.b",
+        ]
+        assert predictions["prediction"].tolist() == ["a", "b"]
+        assert predictions["correct"].isna().tolist() == [False, True]
+        pd.testing.assert_frame_equal(cached_predictions, predictions)
+
+
+def test__write_predictions_arff_matches_arff_dump(monkeypatch):
+    monkeypatch.setattr(openml.runs.run, "_PREDICTIONS_CHUNK_SIZE", 3)
+    labels = ["a", "with space", "it's", "x,y", "50%"]
+    arff_header = {
+        "description": "two\nlines",
+        "relation": "openml_task_1_predictions",
+        "attributes": [
+            ("repeat", "NUMERIC"),
+            ("row_id", "NUMERIC"),
+            ("prediction", labels),
+            ("confidence.a", "NUMERIC"),
+        ],
+    }
+    predictions = pd.DataFrame(
+        {
+            "repeat": [0, 0, 0, 1, 1, 1, 1],
+            "row_id": np.array([3, 1, 2, 0, 5, 4, 6], dtype=np.int32),
+            "prediction": ["a", "with space", "it's", "x,y", None, "50%", "a"],
+            "confidence.a": [1.0, 0.1 + 0.2, np.nan, 1e-20, 0.0, 1e16, 0.5],
+        },
+    )
+    expected = arff.dumps(
+        {**arff_header, "data": predictions.to_numpy(dtype=object).tolist()},
+    )
+
+    with io.StringIO() as fh:
+        _write_predictions_arff(fh, arff_header, predictions)
+        assert fh.getvalue() == expected
+
+    with io.StringIO() as fh:
+        _write_predictions_arff(fh, arff_header, predictions.to_numpy(dtype=object).tolist())
+        assert fh.getvalue() == expected
+
+    with pytest.raises(ValueError, match="Predictions have 3 columns, but 4 attributes"):
+        _write_predictions_arff(io.StringIO(), arff_header, predictions.iloc[:, :3])
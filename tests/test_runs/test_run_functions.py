@@ -4,9 +4,11 @@ from __future__ import annotations
 import ast
 import os
 import random
+import shutil
 import time
 import unittest
 import warnings
+from pathlib import Path
 
 from openml_sklearn import SklearnExtension, cat, cont
 from packaging.version import Version
@@ -1345,6 +1347,101 @@ class TestRun(TestBase):
             loaded_run.publish,
         )
 
+    @pytest.mark.sklearn()
+    def test__run_task_get_arffcontent_loads_data_once(self):
+        test_cache_dir = Path("org", "openml", "test")
+        for entity in ("tasks/1882", "datasets/2"):
+            shutil.copytree(
+                self.static_cache_dir / test_cache_dir / entity,
+                self.workdir / test_cache_dir / entity,
+            )
+        openml.config.set_root_cache_directory(self.workdir)
+        task = openml.tasks.get_task(1882, download_data=True)  # anneal; 10 times 10-fold CV
+        num_reps, num_folds, num_samples = task.get_split_dimensions()
+        clf = make_pipeline(
+            OneHotEncoder(handle_unknown="ignore"),
+            DummyClassifier(strategy="most_frequent"),
+        )
+
+        with mock.patch.object(
+            type(task), "get_X_and_y", autospec=True, side_effect=type(task).get_X_and_y
+        ) as get_x_and_y:
+            arff_datacontent, *_ = openml.runs.functions._run_task_get_arffcontent(
+                extension=self.extension,
+                model=clf,
+                task=task,
+                add_local_measures=False,
+                n_jobs=1,
+            )
+
+        assert get_x_and_y.call_count == 1
+        x, _ = task.get_X_and_y()
+        assert len(arff_datacontent) == len(x) * num_reps * num_samples
+
+    @pytest.mark.sklearn()
+    def test__run_task_get_arffcontent_matches_format_prediction(self):
+        test_cache_dir = Path("org", "openml", "test")
+        for entity in ("tasks/1882", "datasets/2"):
+            shutil.copytree(
+                self.static_cache_dir / test_cache_dir / entity,
+                self.workdir / test_cache_dir / entity,
+            )
+        openml.config.set_root_cache_directory(self.workdir)
+        task = openml.tasks.get_task(1882, download_data=True)
+        clf = make_pipeline(
+            OneHotEncoder(handle_unknown="ignore"),
+            DummyClassifier(strategy="stratified", random_state=1),
+        )
+
+        data_content, *_ = openml.runs.functions._run_task_get_arffcontent(
+            extension=self.extension,
+            model=clf,
+            task=task,
+            add_local_measures=False,
+            n_jobs=1,
+        )
+
+        assert isinstance(data_content, pd.DataFrame)
+        assert list(data_content.columns) == [
+            "repeat",
+            "fold",
+            "sample",
+            "row_id",
+            "prediction",
+            "correct",
+            *(f"confidence.{label}" for label in task.class_labels),
+        ]
+
+        # The columnar block holds the same rows as formatting every prediction one by one
+        _, test_indices = task.get_train_test_split_indices(repeat=3, fold=4)
+        fold = data_content[(data_content["repeat"] == 3) & (data_content["fold"] == 4)]
+        _, y = task.get_X_and_y()
+        expected = [
+            format_prediction(
+                task=task,
+                repeat=3,
+                fold=4,
+                index=row_id,
+                prediction=row["prediction"],
+                truth=y.iloc[row_id],
+                proba={label: row[f"confidence.{label}"] for label in task.class_labels},
+            )
+            for row_id, (_, row) in zip(test_indices, fold.iterrows())
+        ]
+        assert fold.to_numpy(dtype=object).tolist() == expected
+
+        run = openml.runs.OpenMLRun(
+            task_id=task.task_id,
+            flow_id=None,
+            dataset_id=task.dataset_id,
+            data_content=data_content,
+            flow=self.extension.model_to_flow(clf),
+        )
+        arff_dict = run._generate_arff_dict()
+        assert arff_dict["data"] == data_content.to_numpy(dtype=object).tolist()
+        assert all(type(value) is int for value in arff_dict["data"][0][:4])
+        pd.testing.assert_frame_equal(run.predictions, data_content)
+
     @pytest.mark.sklearn()
     @unittest.skipIf(
         Version(sklearn.__version__) < Version("0.20"),
@@ -1370,7 +1467,7 @@ class TestRun(TestBase):
         )
         arff_datacontent, trace, fold_evaluations, _ = res
         # predictions
-        assert isinstance(arff_datacontent, list)
+        assert isinstance(arff_datacontent, pd.DataFrame)
         # trace. SGD does not produce any
         assert isinstance(trace, type(None))
 
@@ -1384,7 +1481,7 @@ class TestRun(TestBase):
 
         # 10 times 10 fold CV of 150 samples
         assert len(arff_datacontent) == num_instances * num_repeats
-        for arff_line in arff_datacontent:
+        for arff_line in arff_datacontent.itertuples(index=False):
             # check number columns
             assert len(arff_line) == 8
             # check repeat
@@ -1608,7 +1705,7 @@ class TestRun(TestBase):
         # 2 folds, 5 repeats; keep in mind that this task comes from the test
         # server, the task on the live server is different
         assert len(data_content) == 4490
-        for row in data_content:
+        for row in data_content.itertuples(index=False):
             # repeat, fold, row_id, 6 confidences, prediction and correct label
             assert len(row) == 12
 
@@ -1652,7 +1749,7 @@ class TestRun(TestBase):
         # 2 folds, 5 repeats; keep in mind that this task comes from the test
         # server, the task on the live server is different
         assert len(data_content) == 4490
-        for row in data_content:
+        for row in data_content.itertuples(index=False):
             # repeat, fold, row_id, 6 confidences, prediction and correct label
             assert len(row) == 12
 
@@ -29,7 +29,7 @@ class OpenMLSplitTest(TestBase):
             / "1882"
             / "datasplits.arff"
         )
-        self.pd_filename = self.arff_filepath.with_suffix(".pkl.py3")
+        self.pd_filename = self.arff_filepath.with_suffix(".npz")
 
     def tearDown(self):
         try:
@@ -96,3 +96,44 @@ class OpenMLSplitTest(TestBase):
             2,
             10,
         )
+
+    def test_from_arff_file_uses_npz_cache(self):
+        split = OpenMLSplit._from_arff_file(self.arff_filepath)
+        assert self.pd_filename.exists()
+
+        with np.load(self.pd_filename, allow_pickle=False) as cached:
+            assert set(cached.files) == {"name", "keys", "rowids", "offsets"}
+
+        cached_split = OpenMLSplit._from_arff_file(self.arff_filepath)
+        assert cached_split == split
+        assert cached_split.name == "phpFsFYVN_splits"
+
+        # All folds are views into the same flat array of row ids
+        train, test = cached_split.get(repeat=3, fold=4)
+        assert train.base is not None
+        assert train.base is test.base
+
+    def test_from_arff_file_removes_legacy_pickle_cache(self):
+        pkl_filename = self.arff_filepath.with_suffix(".pkl.py3")
+        pkl_filename.write_bytes(b"")
+
+        OpenMLSplit._from_arff_file(self.arff_filepath)
+        assert not pkl_filename.exists()
+        assert not list(self.arff_filepath.parent.glob("*.tmp.npz"))
+
+
+def test__index_split_keeps_file_order():
+    from openml.tasks.split import _index_split
+
+    keys, rowids, offsets = _index_split(
+        repeat=np.array([0, 0, 0, 0, 0, 0]),
+        fold=np.array([1, 0, 1, 0, 0, 1]),
+        sample=np.zeros(6, dtype=int),
+        rowid=np.array([5, 3, 4, 2, 1, 0], dtype=np.int32),
+        is_test=np.array([False, True, True, False, False, False]),
+    )
+
+    assert keys.tolist() == [[0, 0, 0], [0, 1, 0]]
+    assert offsets.tolist() == [0, 2, 3, 5, 6]
+    # fold 0: train [2, 1], test [3]; fold 1: train [5, 0], test [4]
+    assert rowids.tolist() == [2, 1, 3, 5, 0, 4]
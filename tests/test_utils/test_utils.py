@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import functools
+import gc
 import os
 import unittest.mock
+from pathlib import Path
+
+import pandas as pd
 import pytest
 import openml
 from openml.testing import _check_dataset
@@ -43,7 +48,7 @@ def min_number_evaluations_on_test_server() -> int:
     return 8
 
 
-def _mocked_perform_api_call(call, request_method):
+def _mocked_perform_api_call(call, request_method, **kwargs):
     url = openml.config.server + "/" + call
     return openml._api_calls._download_text_file(url)
 
@@ -152,3 +157,349 @@ def test_correct_test_server_download_state():
     task = openml.tasks.get_task(119)
     dataset = task.get_dataset()
     assert len(dataset.features) == dataset.get_data()[0].shape[1]
+
+
+@pytest.mark.parametrize("max_workers", [None, 1, 4])
+def test__map_ids_preserves_order_and_deduplicates(max_workers):
+    fetch = unittest.mock.Mock(side_effect=lambda id_: id_ * 10)
+
+    result = openml.utils._map_ids(fetch, [3, 1, 3, 2], max_workers=max_workers)
+
+    assert result == [30, 10, 30, 20]
+    assert sorted(call.args[0] for call in fetch.call_args_list) == [1, 2, 3]
+
+
+def test__map_ids_deduplicates_string_ids():
+    fetch = unittest.mock.Mock(side_effect=lambda id_: f"fetched {id_}")
+
+    result = openml.utils._map_ids(fetch, [1, "1", "anneal", "2", 2], max_workers=2)
+
+    # Each id is fetched once, as it occurs first, names are left as they are
+    assert result == ["fetched 1", "fetched 1", "fetched anneal", "fetched 2", "fetched 2"]
+    assert fetch.call_count == 3
+
+
+@pytest.mark.parametrize("executor_cls", ["ThreadPoolExecutor", "ProcessPoolExecutor"])
+def test__map_ids_uses_given_executor(executor_cls):
+    import concurrent.futures
+
+    with getattr(concurrent.futures, executor_cls)(max_workers=2) as executor:
+        result = openml.utils._map_ids(str, [1, 2], executor=executor)
+    assert result == ["1", "2"]
+
+
+def test__map_ids_return_exceptions():
+    def fetch(id_):
+        if id_ == 2:
+            raise openml.exceptions.OpenMLServerException("not found")
+        return id_
+
+    with pytest.raises(openml.exceptions.OpenMLServerException, match="not found"):
+        openml.utils._map_ids(fetch, [1, 2, 3], max_workers=2)
+
+    result = openml.utils._map_ids(fetch, [1, 2, 3], max_workers=2, return_exceptions=True)
+    assert result[0] == 1
+    assert isinstance(result[1], openml.exceptions.OpenMLServerException)
+    assert result[2] == 3
+
+
+def test__map_ids_invalid_max_workers():
+    with pytest.raises(ValueError, match="max_workers"):
+        openml.utils._map_ids(str, [1], max_workers=0)
+
+
+def _paged_listing(n_results, calls):
+    """A listing call over ``n_results`` results, which records the requested pages."""
+
+    def listing_call(batch_size, offset):
+        calls.append((batch_size, offset))
+        if offset >= n_results:
+            raise openml.exceptions.OpenMLServerNoResult("No results")
+        return list(range(offset, min(offset + batch_size, n_results)))
+
+    return listing_call
+
+
+@pytest.mark.parametrize("max_concurrent_pages", [1, 3])
+@pytest.mark.parametrize(
+    ("n_results", "limit", "expected_sizes"),
+    [
+        (25, None, [10, 10, 5]),
+        (30, None, [10, 10, 10]),
+        (25, 22, [10, 10, 2]),
+        (25, 20, [10, 10]),
+        (5, 22, [5]),
+    ],
+)
+def test__list_all_pages(max_concurrent_pages, n_results, limit, expected_sizes):
+    calls = []
+    batches = openml.utils._list_all(
+        _paged_listing(n_results, calls),
+        limit=limit,
+        offset=0,
+        batch_size=10,
+        max_concurrent_pages=max_concurrent_pages,
+    )
+
+    assert [len(batch) for batch in batches] == expected_sizes
+    assert sum(batches, []) == list(range(sum(expected_sizes)))
+    # Concurrent paging requests at most a window of pages beyond the last one
+    n_extra_calls = len(calls) - len(expected_sizes)
+    assert 0 <= n_extra_calls <= max_concurrent_pages
+
+
+def test__list_all_concurrent_pages_from_config():
+    calls = []
+    with unittest.mock.patch.object(openml.config, "max_concurrent_pages", 4):
+        batches = openml.utils._list_all(
+            _paged_listing(100, calls), limit=100, offset=5, batch_size=10
+        )
+
+    assert sum(batches, []) == list(range(5, 100))
+    assert sorted(calls)[:4] == [(10, 5), (10, 15), (10, 25), (10, 35)]
+
+
+def test__list_all_concurrent_pages_raises_errors_of_needed_pages():
+    def listing_call(batch_size, offset):
+        if offset == 20:
+            raise openml.exceptions.OpenMLServerException("server error")
+        return list(range(batch_size))
+
+    with pytest.raises(openml.exceptions.OpenMLServerException, match="server error"):
+        openml.utils._list_all(listing_call, limit=50, batch_size=10, max_concurrent_pages=3)
+
+
+def test__list_all_invalid_max_concurrent_pages():
+    with pytest.raises(ValueError, match="max_concurrent_pages"):
+        openml.utils._list_all(str, max_concurrent_pages=0)
+
+
+def test__iter_all_requests_pages_lazily():
+    calls = []
+    pages = openml.utils._iter_all(
+        _paged_listing(25, calls),
+        limit=None,
+        offset=0,
+        batch_size=10,
+    )
+    assert calls == []
+
+    assert next(pages) == list(range(10))
+    assert calls == [(10, 0)]
+    pages.close()
+    assert calls == [(10, 0)]
+
+
+@unittest.mock.patch("openml.tasks.functions._list_tasks")
+def test_iter_tasks_yields_pages(list_tasks_mock):
+    import pandas as pd
+
+    def _list_tasks(limit, offset, **kwargs):
+        if offset >= 25:
+            raise openml.exceptions.OpenMLServerNoResult("No results")
+        return pd.DataFrame({"tid": range(offset, min(offset + limit, 25))})
+
+    list_tasks_mock.side_effect = _list_tasks
+
+    pages = openml.tasks.iter_tasks(tag="study_14", batch_size=10)
+    first_page = next(pages)
+    assert first_page["tid"].tolist() == list(range(10))
+    assert list_tasks_mock.call_count == 1
+    assert list_tasks_mock.call_args.kwargs["tag"] == "study_14"
+
+    assert [len(page) for page in pages] == [10, 5]
+    assert openml.tasks.list_tasks(tag="study_14")["tid"].tolist() == list(range(25))
+
+
+@pytest.mark.parametrize(
+    "iter_listing",
+    [
+        openml.datasets.iter_datasets,
+        openml.tasks.iter_tasks,
+        openml.runs.iter_runs,
+        functools.partial(openml.evaluations.iter_evaluations, "predictive_accuracy"),
+    ],
+)
+def test_iter_listing_validates_arguments_when_called(iter_listing):
+    with pytest.raises(ValueError, match="batch_size"):
+        iter_listing(batch_size="10")
+    with pytest.raises(ValueError, match="offset"):
+        iter_listing(offset="10")
+
+
+def test__iter_xml_records_streams_records():
+    xml_string = (
+        '<oml:flows xmlns:oml="http://openml.org/openml">'
+        + "".join(
+            f"<oml:flow><oml:id>{i}</oml:id><oml:tag>a</oml:tag><oml:tag>b</oml:tag>"
+            "<oml:name></oml:name></oml:flow>"
+            for i in range(3)
+        )
+        + "</oml:flows>"
+    )
+    with unittest.mock.patch("openml.utils._XML_CHUNK_SIZE", 7):
+        records = openml.utils._iter_xml_records(xml_string, "flows", "flow")
+        fields = [openml.utils._xml_fields(record) for record in records]
+
+    assert fields == [{"id": str(i), "tag": ["a", "b"], "name": None} for i in range(3)]
+
+
+@pytest.mark.parametrize(
+    "xml_string",
+    [
+        '<oml:runs xmlns:oml="http://openml.org/openml"></oml:runs>',
+        '<oml:flows xmlns:oml="http://example.org"></oml:flows>',
+        "<flows></flows>",
+    ],
+)
+def test__iter_xml_records_checks_listing(xml_string):
+    with pytest.raises(ValueError, match='does not contain "oml:flows"'):
+        list(openml.utils._iter_xml_records(xml_string, "flows", "flow"))
+
+
+def test__listing_columns_to_frame():
+    columns = openml.utils._ListingColumns()
+    columns.add_row([("id", 5), ("name", "a"), ("quality", "1")])
+    columns.add_row([("id", 3), ("comment", "b")])
+    columns.add_row([("id", 9), ("quality", "2.5"), ("name", "c")])
+
+    frame = columns.to_frame(index="id", converters={"quality": pd.to_numeric})
+
+    assert frame.index.tolist() == [5, 3, 9]
+    assert frame.columns.tolist() == ["id", "name", "quality", "comment"]
+    assert frame["quality"].dtype == float
+    assert frame["quality"].isna().tolist() == [False, True, False]
+    assert frame["name"].tolist()[::2] == ["a", "c"]
+    assert pd.isna(frame.loc[3, "name"])
+
+
+@pytest.fixture()
+def cached_data_files(tmp_path):
+    openml.config.set_root_cache_directory(tmp_path)
+    cache_directory = Path(openml.config.get_cache_directory())
+    files = {
+        "datasets/1": ["description.xml", "dataset.arff", "dataset.pkl.py3"],
+        "datasets/2": ["description.xml", "dataset_2.pq", "dataset_2.pkl.py3"],
+        "tasks/3": ["task.xml", "datasplits.arff", "datasplits.npz"],
+    }
+    last_used = {"datasets/1": 100, "datasets/2": 300, "tasks/3": 200}
+    for cache_dir, file_names in files.items():
+        (cache_directory / cache_dir).mkdir(parents=True)
+        for file_name in file_names:
+            file = cache_directory / cache_dir / file_name
+            file.write_bytes(b"0" * 1000)
+            os.utime(file, (last_used[cache_dir], last_used[cache_dir]))
+    return cache_directory
+
+
+def _remaining_files(cache_directory):
+    return sorted(str(file.relative_to(cache_directory)) for file in cache_directory.rglob("*.*"))
+
+
+@pytest.mark.parametrize(
+    ("max_bytes", "evicted"),
+    [
+        (0, []),
+        (6000, []),
+        # The copies of the least recently used entities go first ...
+        (
+            3500,
+            [
+                "datasets/1/dataset.pkl.py3",
+                "datasets/2/dataset_2.pkl.py3",
+                "tasks/3/datasplits.npz",
+            ],
+        ),
+        # ... and then the downloads
+        (
+            1500,
+            [
+                "datasets/1/dataset.arff",
+                "datasets/1/dataset.pkl.py3",
+                "datasets/2/dataset_2.pkl.py3",
+                "tasks/3/datasplits.arff",
+                "tasks/3/datasplits.npz",
+            ],
+        ),
+    ],
+)
+def test__evict_data_files(cached_data_files, max_bytes, evicted):
+    files = _remaining_files(cached_data_files)
+    with unittest.mock.patch.object(openml.config, "data_cache_max_mb", max_bytes / 2**20):
+        openml.utils._evict_data_files()
+
+    assert _remaining_files(cached_data_files) == sorted(set(files) - set(evicted))
+
+
+def test__evict_data_files_skips_pinned_cache_dirs(cached_data_files):
+    class Owner:
+        pass
+
+    owner = Owner()
+    openml.utils._pin_cache_dir(cached_data_files / "datasets" / "1", owner=owner)
+    with openml.utils._pinned_cache_dir(cached_data_files / "tasks" / "3"):
+        with unittest.mock.patch.object(openml.config, "data_cache_max_mb", 1 / 2**20):
+            openml.utils._evict_data_files()
+
+        assert _remaining_files(cached_data_files) == [
+            "datasets/1/dataset.arff",
+            "datasets/1/dataset.pkl.py3",
+            "datasets/1/description.xml",
+            "datasets/2/description.xml",
+            "tasks/3/datasplits.arff",
+            "tasks/3/datasplits.npz",
+            "tasks/3/task.xml",
+        ]
+
+    del owner
+    assert openml.utils._pinned_cache_dirs == {}
+
+
+def test__evict_data_files_keeps_running_total(cached_data_files):
+    iter_cached_data_files = unittest.mock.patch.object(
+        openml.utils,
+        "_iter_cached_data_files",
+        wraps=openml.utils._iter_cached_data_files,
+    )
+    with (
+        unittest.mock.patch.object(openml.config, "data_cache_max_mb", 7000 / 2**20),
+        iter_cached_data_files as iter_mock,
+    ):
+        # The cache is only walked once, while it fits in the budget
+        openml.utils._evict_data_files()
+        openml.utils._evict_data_files(cached_data_files / "datasets" / "1")
+        assert iter_mock.call_count == 1
+
+        # New data of an entity is accounted for without walking the cache ...
+        (cached_data_files / "datasets" / "1" / "dataset.feather").write_bytes(b"0" * 500)
+        openml.utils._evict_data_files(cached_data_files / "datasets" / "1")
+        assert iter_mock.call_count == 1
+
+        # ... until it exceeds the budget
+        (cached_data_files / "datasets" / "1" / "dataset.feather").write_bytes(b"0" * 1500)
+        openml.utils._evict_data_files(cached_data_files / "datasets" / "1")
+        assert iter_mock.call_count == 2
+
+    assert "tasks/3/datasplits.npz" not in _remaining_files(cached_data_files)
+    assert "datasets/2/dataset_2.pkl.py3" in _remaining_files(cached_data_files)
+
+
+def test__mark_cache_dir_used(cached_data_files):
+    openml.utils._mark_cache_dir_used(cached_data_files / "datasets" / "1")
+
+    with unittest.mock.patch.object(openml.config, "data_cache_max_mb", 4500 / 2**20):
+        openml.utils._evict_data_files()
+
+    # Dataset 1 is now the most recently used entity
+    assert "datasets/1/dataset.pkl.py3" in _remaining_files(cached_data_files)
+    assert "datasets/2/dataset_2.pkl.py3" not in _remaining_files(cached_data_files)
+
+
+def test__get_thread_lock_is_shared_and_released():
+    lock = openml.utils._get_thread_lock("datasets.functions.get_dataset:1")
+    assert openml.utils._get_thread_lock("datasets.functions.get_dataset:1") is lock
+    assert openml.utils._get_thread_lock("datasets.functions.get_dataset:2") is not lock
+
+    del lock
+    gc.collect()
+    assert "datasets.functions.get_dataset:1" not in openml.utils._thread_locks